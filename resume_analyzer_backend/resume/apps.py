@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ResumeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'resume'
+
+    def ready(self):
+        # ✅ Load the sentence encoder once per worker before the first request
+        from .encoder import warm_up_on_boot
+        warm_up_on_boot()
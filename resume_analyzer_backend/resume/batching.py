@@ -0,0 +1,147 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+
+@dataclass
+class _Pending:
+    items: list
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatcher:
+    """Collects concurrent calls for up to ``max_wait_ms`` (or ``max_batch_size`` items) and runs them as one batch.
+
+    ``fn`` takes a flat list of items and returns a sequence (list / numpy array) of the same
+    length; each caller gets back the slice for its own items.
+    """
+
+    def __init__(self, fn, max_batch_size=32, max_wait_ms=5.0, name="micro-batcher"):
+        self.fn = fn
+        self.max_batch_size = max(int(max_batch_size), 1)
+        self.max_wait = max(float(max_wait_ms), 0.0) / 1000
+        self._queue = queue.Queue()
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "requests": 0,
+            "batches": 0,
+            "items": 0,
+            "max_batch_size_seen": 0,
+            "max_queue_depth": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "total_run_seconds": 0.0,
+            "errors": 0,
+        }
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, items):
+        pending = _Pending(list(items))
+        self._queue.put(pending)
+        depth = self._queue.qsize()
+        with self._metrics_lock:
+            self._metrics["requests"] += 1
+            self._metrics["max_queue_depth"] = max(self._metrics["max_queue_depth"], depth)
+        return pending.future
+
+    def run(self, items):
+        """Blocking submit: returns this caller's results once its batch has run."""
+        return self.submit(items).result()
+
+    def close(self):
+        self._queue.put(None)
+
+    def metrics(self):
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        batches, requests = metrics["batches"], metrics["requests"]
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": metrics["max_queue_depth"],
+            "requests": requests,
+            "batches": batches,
+            "errors": metrics["errors"],
+            "avg_batch_size": round(metrics["items"] / batches, 2) if batches else 0.0,
+            "max_batch_size": metrics["max_batch_size_seen"],
+            "avg_wait_ms": round(metrics["total_wait_seconds"] * 1000 / requests, 3) if requests else 0.0,
+            "max_wait_ms": round(metrics["max_wait_seconds"] * 1000, 3),
+            "avg_run_ms": round(metrics["total_run_seconds"] * 1000 / batches, 3) if batches else 0.0,
+            "config": {"max_batch_size": self.max_batch_size, "max_wait_ms": self.max_wait * 1000},
+        }
+
+    def _collect(self, first):
+        """The first request plus everything that arrives before its wait window closes or the batch fills."""
+        batch, size = [first], len(first.items)
+        deadline = first.enqueued_at + self.max_wait
+        while size < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                pending = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if pending is None:
+                self._queue.put(None)  # ✅ Stop after this batch
+                break
+            batch.append(pending)
+            size += len(pending.items)
+        return batch, size
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, size = self._collect(first)
+
+            started = time.perf_counter()
+            waits = [started - pending.enqueued_at for pending in batch]
+            try:
+                results = self.fn([item for pending in batch for item in pending.items])
+                offset = 0
+                for pending in batch:
+                    pending.future.set_result(results[offset:offset + len(pending.items)])
+                    offset += len(pending.items)
+                failed = False
+            except Exception as e:
+                for pending in batch:
+                    pending.future.set_exception(e)
+                failed = True
+
+            with self._metrics_lock:
+                self._metrics["batches"] += 1
+                self._metrics["items"] += size
+                self._metrics["errors"] += int(failed)
+                self._metrics["max_batch_size_seen"] = max(self._metrics["max_batch_size_seen"], size)
+                self._metrics["total_wait_seconds"] += sum(waits)
+                self._metrics["max_wait_seconds"] = max(self._metrics["max_wait_seconds"], max(waits))
+                self._metrics["total_run_seconds"] += time.perf_counter() - started
+
+
+class BatchingModel:
+    """Wraps a SentenceTransformer so concurrent scoring encodes share one padded batch.
+
+    Only the call shape used by scoring.encode_texts is batched; any other encode() call
+    (e.g. convert_to_tensor=True) and every other attribute go straight to the model.
+    """
+
+    BATCHED_KWARGS = {"convert_to_numpy": True, "normalize_embeddings": True}
+
+    def __init__(self, model, max_batch_size=32, max_wait_ms=5.0):
+        from .scoring import encode_texts
+
+        self.model = model
+        self.batcher = MicroBatcher(
+            lambda texts: encode_texts(model, texts), max_batch_size, max_wait_ms, name="encoder-micro-batcher"
+        )
+
+    def encode(self, texts, **kwargs):
+        if kwargs != self.BATCHED_KWARGS or isinstance(texts, str):
+            return self.model.encode(texts, **kwargs)
+        return self.batcher.run(texts)
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
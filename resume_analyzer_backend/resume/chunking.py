@@ -0,0 +1,102 @@
+import re
+from dataclasses import dataclass, field
+from django.conf import settings
+
+
+DEFAULT_CHUNKING_CONFIG = {
+    "ENABLED": True,
+    "CHUNK_WORDS": 96,       # stays under MiniLM's 128-token window for typical resume prose
+    "OVERLAP_WORDS": 16,
+    "MAX_CHUNKS": 8,         # encode budget per resume
+    "AGGREGATION": "topk",   # per job field, over chunks: "max", "mean" or "topk" (mean of the best TOP_K)
+    "TOP_K": 2,
+}
+
+AGGREGATIONS = ("max", "mean", "topk")
+
+# ✅ Bump when chunk_text changes; stored vectors built another way are re-encoded (see embed_resumes)
+CHUNKING_VERSION = "1"
+
+# ✅ A line that is only a common resume section title (optionally followed by a colon)
+SECTION_HEADING_RE = re.compile(
+    r"^[ \t]*(summary|profile|professional summary|objective|career objective|about me|experience|work experience"
+    r"|professional experience|employment history|internships?|education|academic background|qualifications"
+    r"|skills|technical skills|key skills|core competencies|projects|academic projects|certifications?"
+    r"|achievements|awards|responsibilities|publications|languages|interests|hobbies|declaration)[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def get_chunking_config():
+    config = dict(DEFAULT_CHUNKING_CONFIG)
+    config.update(getattr(settings, "RESUME_CHUNKING", {}))
+    if config["AGGREGATION"] not in AGGREGATIONS:
+        raise ValueError(f"RESUME_CHUNKING['AGGREGATION'] must be one of {AGGREGATIONS}")
+    return config
+
+
+def chunking_signature(config=None):
+    """Identifies how stored resume vectors were chunked ("" marks vectors from before chunking)."""
+    config = config or get_chunking_config()
+    if not config["ENABLED"]:
+        return "off"
+    return f"v{CHUNKING_VERSION}:{config['CHUNK_WORDS']}/{config['OVERLAP_WORDS']}/{config['MAX_CHUNKS']}"
+
+
+@dataclass
+class ChunkedText:
+    chunks: list = field(default_factory=list)
+    total_chunks: int = 0  # before the MAX_CHUNKS budget was applied
+    sections: int = 0
+
+
+def split_sections(text):
+    """[(heading, body)] in document order; text before the first heading is the "header" section."""
+    sections = []
+    last_end, heading = 0, "header"
+    for match in SECTION_HEADING_RE.finditer(text):
+        sections.append((heading, text[last_end:match.start()]))
+        heading, last_end = match.group(1).lower(), match.end()
+    sections.append((heading, text[last_end:]))
+    return [(heading, body) for heading, body in sections if body.strip()]
+
+
+def _windows(words, size, overlap):
+    if not words:
+        return
+    step = max(size - overlap, 1)
+    for start in range(0, max(len(words) - overlap, 1), step):
+        yield words[start:start + size]
+
+
+def chunk_text(text, config=None):
+    """Section-aware word windows, limited to MAX_CHUNKS.
+
+    Every window is prefixed with its section heading. When the budget is exceeded the
+    windows are picked round-robin across sections, so a long experience section cannot
+    crowd out skills or education.
+    """
+    config = config or get_chunking_config()
+    sections = split_sections(text or "")
+    per_section = []
+    for heading, body in sections:
+        prefix = "" if heading == "header" else f"{heading.title()}: "
+        windows = [prefix + " ".join(words) for words in _windows(body.split(), config["CHUNK_WORDS"], config["OVERLAP_WORDS"])]
+        per_section.append(windows)
+
+    total = sum(len(windows) for windows in per_section)
+    budget = max(int(config["MAX_CHUNKS"]), 1)
+    if total <= budget:
+        chunks = [chunk for windows in per_section for chunk in windows]
+    else:
+        picked = [[] for _ in per_section]
+        depth, count = 0, 0
+        while count < budget:
+            for i, windows in enumerate(per_section):
+                if depth < len(windows) and count < budget:
+                    picked[i].append(windows[depth])
+                    count += 1
+            depth += 1
+        chunks = [chunk for windows in picked for chunk in windows]  # ✅ Keep document order
+
+    return ChunkedText(chunks=chunks or [text or ""], total_chunks=max(total, 1), sections=len(sections))
@@ -0,0 +1,158 @@
+import re
+from dataclasses import dataclass, field
+from django.conf import settings
+from django.db.models import Q
+
+
+DEFAULT_CONTACTS_CONFIG = {
+    "DEFAULT_COUNTRY_CODE": "91",  # prefixed to 10-digit national numbers when normalising to E.164
+    "TOP_REGION_CHARS": 2000,      # contact details live in the header; only scan the rest if nothing is found here
+    "MAX_CANDIDATES": 3,
+}
+
+# ✅ Compiled once. Every repetition is bounded and the phone pattern is a single character class,
+# so matching stays linear in the text length even on long, noisy OCR output.
+EMAIL_RE = re.compile(
+    r"(?<![\w.%+-])[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]{1,63}(?:\.[A-Za-z0-9-]{1,63}){0,4}\.[A-Za-z]{2,24}(?![\w-])"
+)
+PHONE_RE = re.compile(r"(?<![\w+])\+?\(?\d[\d \t().-]{6,20}\d(?!\w)")
+_NON_DIGITS = re.compile(r"\D")
+
+MIN_NATIONAL_DIGITS = 10
+MIN_E164_DIGITS = 8
+MAX_E164_DIGITS = 15
+
+
+def get_contacts_config():
+    config = dict(DEFAULT_CONTACTS_CONFIG)
+    config.update(getattr(settings, "RESUME_CONTACTS", {}))
+    return config
+
+
+@dataclass
+class ContactInfo:
+    emails: list = field(default_factory=list)
+    phones: list = field(default_factory=list)  # E.164, e.g. +919876543210
+
+    @property
+    def email(self):
+        return self.emails[0] if self.emails else None
+
+    @property
+    def phone(self):
+        return self.phones[0] if self.phones else None
+
+
+def normalize_email(raw):
+    local, _, domain = raw.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+def normalize_phone(raw, default_country_code=None):
+    """E.164 form of a phone-number candidate, or None if it cannot be one.
+
+    Numbers written with ``+`` or ``00`` keep their country code; 10-digit national numbers
+    (after dropping a trunk ``0``) get ``default_country_code``.
+    """
+    digits = _NON_DIGITS.sub("", raw)
+    international = raw.lstrip().startswith("+")
+    if not international and digits.startswith("00"):
+        digits, international = digits[2:], True
+
+    if not international:
+        digits = digits.lstrip("0")
+        if len(digits) != MIN_NATIONAL_DIGITS or not default_country_code:
+            return None
+        digits = f"{default_country_code}{digits}"
+
+    if not MIN_E164_DIGITS <= len(digits) <= MAX_E164_DIGITS:
+        return None
+    return f"+{digits}"
+
+
+def _scan(text, config, contacts, emails=True, phones=True):
+    limit = config["MAX_CANDIDATES"]
+    if emails:
+        for match in EMAIL_RE.finditer(text):
+            email = normalize_email(match.group())
+            if email not in contacts.emails:
+                contacts.emails.append(email)
+                if len(contacts.emails) >= limit:
+                    break
+    if phones:
+        for match in PHONE_RE.finditer(text):
+            phone = normalize_phone(match.group(), config["DEFAULT_COUNTRY_CODE"])
+            if phone and phone not in contacts.phones:
+                contacts.phones.append(phone)
+                if len(contacts.phones) >= limit:
+                    break
+
+
+def extract_contacts(text, config=None):
+    """All (up to MAX_CANDIDATES) emails and E.164 phone numbers, header region first."""
+    config = config or get_contacts_config()
+    contacts = ContactInfo()
+    if not text:
+        return contacts
+
+    top = config["TOP_REGION_CHARS"]
+    _scan(text[:top] if top else text, config, contacts)
+    if top and len(text) > top and (not contacts.emails or not contacts.phones):
+        # ✅ Only the missing kind is searched for below the header (with a small overlap at the boundary)
+        _scan(text[max(top - 64, 0):], config, contacts, emails=not contacts.emails, phones=not contacts.phones)
+    return contacts
+
+
+def extract_email_and_phone(text):
+    contacts = extract_contacts(text)
+    return contacts.email, contacts.phone
+
+
+def extract_contacts_batch(texts):
+    """extract_contacts over many texts, reading the settings once."""
+    config = get_contacts_config()
+    return [extract_contacts(text, config) for text in texts]
+
+
+def backfill_contacts(queryset=None, batch_size=1000, only_missing=True):
+    """Re-derives email/phone_number from stored extracted_text in batches of bulk updates.
+
+    Returns (scanned, updated).
+    """
+    from .models import Resume
+
+    queryset = Resume.objects.all() if queryset is None else queryset
+    queryset = queryset.exclude(extracted_text__isnull=True).exclude(extracted_text="")
+    if only_missing:
+        queryset = queryset.filter(
+            Q(email__isnull=True) | Q(email="") | Q(phone_number__isnull=True) | Q(phone_number="")
+        )
+
+    scanned = updated = 0
+    rows = queryset.order_by("id").values_list("id", "email", "phone_number", "extracted_text")
+    batch = []
+    for row in rows.iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            updated += _backfill_batch(batch)
+            scanned += len(batch)
+            batch = []
+    if batch:
+        updated += _backfill_batch(batch)
+        scanned += len(batch)
+    return scanned, updated
+
+
+def _backfill_batch(rows):
+    from .models import Resume
+
+    config = get_contacts_config()
+    changed = []
+    for resume_id, email, phone_number, text in rows:
+        contacts = extract_contacts(text, config)
+        new_email, new_phone = contacts.email or email, contacts.phone or phone_number
+        if (new_email, new_phone) != (email, phone_number):
+            changed.append(Resume(id=resume_id, email=new_email, phone_number=new_phone))
+    if changed:
+        Resume.objects.bulk_update(changed, ["email", "phone_number"])
+    return len(changed)
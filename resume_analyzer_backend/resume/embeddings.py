@@ -0,0 +1,195 @@
+import numpy as np
+from django.utils import timezone
+from .chunking import chunking_signature
+from .encoder import get_encoder
+from .job_cache import get_job_matrix
+from .scoring import JOB_FIELDS, encode_resumes, score_chunk_groups
+
+
+def vector_to_bytes(vector):
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def bytes_to_vector(data, dimensions=None):
+    """Flat float32 vector, or a (chunks x dimensions) matrix when ``dimensions`` is given."""
+    vector = np.frombuffer(bytes(data), dtype=np.float32)
+    return vector.reshape(-1, dimensions) if dimensions else vector
+
+
+def store_resume_embedding(resume, vectors, model_name):
+    """Saves (or replaces) the resume's chunk vectors (or single vector) for the given encoder."""
+    from .models import ResumeEmbedding
+
+    matrix = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    ResumeEmbedding.objects.update_or_create(
+        resume=resume,
+        model_name=model_name,
+        defaults={"dimensions": matrix.shape[1], "vector": vector_to_bytes(matrix), "chunking": chunking_signature()},
+    )
+
+
+def get_resume_vector(resume, model_name):
+    """The stored (chunks x dims) matrix for one resume, or None if missing or built with other chunking."""
+    from .models import ResumeEmbedding
+
+    row = (
+        ResumeEmbedding.objects.filter(resume=resume, model_name=model_name, chunking=chunking_signature())
+        .values_list("vector", "dimensions")
+        .first()
+    )
+    return bytes_to_vector(*row) if row is not None else None
+
+
+def _as_batch(ids, buffers, counts, dimensions):
+    matrix = np.frombuffer(b"".join(buffers), dtype=np.float32).reshape(-1, dimensions)
+    return np.asarray(ids, dtype=np.int64), matrix, np.asarray(counts, dtype=np.int64)
+
+
+def iter_embedding_batches(model_name, resumes=None, batch_size=5000):
+    """Yields (resume ids, stacked chunk matrix, chunks per resume) over the stored vectors of one encoder.
+
+    Each resume's chunk rows are contiguous in the matrix. ``resumes`` may be a Resume
+    queryset or a list of ids to restrict the pool. Vectors built with other chunking (e.g.
+    pre-chunking truncated ones the backfill could not replace) are skipped, as in get_resume_vector.
+    """
+    from .models import ResumeEmbedding
+
+    embeddings = ResumeEmbedding.objects.filter(model_name=model_name, chunking=chunking_signature())
+    if resumes is not None:
+        embeddings = embeddings.filter(resume__in=resumes)
+
+    ids, buffers, counts = [], [], []
+    rows = embeddings.order_by("resume_id").values_list("resume_id", "dimensions", "vector")
+    for resume_id, dimensions, data in rows.iterator(chunk_size=batch_size):
+        data = bytes(data)
+        ids.append(resume_id)
+        buffers.append(data)
+        counts.append(len(data) // (4 * dimensions))
+        if len(ids) == batch_size:
+            yield _as_batch(ids, buffers, counts, dimensions)
+            ids, buffers, counts = [], [], []
+    if ids:
+        yield _as_batch(ids, buffers, counts, dimensions)
+
+
+def load_embedding_matrix(model_name, resume_ids=None):
+    """Returns (resume ids, stacked chunk matrix, chunks per resume) for every stored resume of one encoder."""
+    batches = list(iter_embedding_batches(model_name, resume_ids))
+    if not batches:
+        return np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32), np.empty(0, dtype=np.int64)
+    return (
+        np.concatenate([ids for ids, _, _ in batches]),
+        np.vstack([matrix for _, matrix, _ in batches]),
+        np.concatenate([counts for _, _, counts in batches]),
+    )
+
+
+def stale_embeddings(model_name, queryset):
+    """Resumes of ``queryset`` with no vector for this encoder, or one built with older chunking."""
+    from .models import ResumeEmbedding
+
+    current = ResumeEmbedding.objects.filter(model_name=model_name, chunking=chunking_signature()).values("resume_id")
+    return queryset.exclude(id__in=current)
+
+
+def embed_missing_resumes(model_name, encoder, queryset, batch_size=64):
+    """Encodes stored extracted_text for resumes without an up-to-date vector for this encoder.
+
+    Vectors from before chunking (or from another chunking setup) are replaced, so the pool is
+    never scored on a mix of truncated and chunk-aggregated vectors.
+    """
+    from .models import ResumeEmbedding
+
+    missing = stale_embeddings(model_name, queryset).exclude(extracted_text__isnull=True)
+    pending = []
+    created = 0
+    for resume_id, text in missing.values_list("id", "extracted_text").iterator(chunk_size=batch_size):
+        pending.append((resume_id, text))
+        if len(pending) == batch_size:
+            created += _embed_batch(pending, model_name, encoder, ResumeEmbedding)
+            pending = []
+    if pending:
+        created += _embed_batch(pending, model_name, encoder, ResumeEmbedding)
+    return created
+
+
+def _embed_batch(pending, model_name, encoder, ResumeEmbedding):
+    matrices, _ = encode_resumes([text for _, text in pending], encoder)
+    signature, now = chunking_signature(), timezone.now()
+    ResumeEmbedding.objects.bulk_create(
+        [
+            ResumeEmbedding(resume_id=resume_id, model_name=model_name, dimensions=matrix.shape[1],
+                            vector=vector_to_bytes(matrix), chunking=signature, created_at=now)
+            for (resume_id, _), matrix in zip(pending, matrices)
+        ],
+        update_conflicts=True,
+        unique_fields=["resume", "model_name"],
+        update_fields=["dimensions", "vector", "chunking", "created_at"],
+    )
+    return len(pending)
+
+
+def rescore_pool(job_data, resume_ids=None, encoder=None):
+    """Scores stored resume vectors against a job: one job encode, one matrix product.
+
+    Returns (resume ids, per-field score matrix, final ATS scores) as numpy arrays.
+    """
+    encoder = encoder or get_encoder()
+    job_matrix = get_job_matrix(job_data, encoder)
+    ids, matrix, counts = load_embedding_matrix(encoder.model_name, resume_ids)
+    if not len(ids):
+        return ids, np.empty((0, len(JOB_FIELDS))), np.empty(0)
+
+    field_scores, final_scores = score_chunk_groups(matrix, counts, job_matrix)
+    return ids, field_scores, final_scores
+
+
+def rerank_pool(job_data, resumes, ats_threshold, top_n=20, batch_size=5000, encoder=None):
+    """Re-scores a Resume queryset against a job in vectorised batches and saves the results.
+
+    Resumes without a vector for the current encoder are embedded from their stored
+    extracted_text first. ``ats_score`` is written with bulk_update, ``shortlisted`` is re-derived
+    from the HR threshold stored in the database, and the best ``top_n`` candidates are returned
+    (highest score first), flagged against ``ats_threshold``.
+    """
+    from .models import Resume
+    from .thresholds import materialize_shortlisted
+
+    encoder = encoder or get_encoder()
+    embedded = embed_missing_resumes(encoder.model_name, encoder, resumes)
+    job_matrix = get_job_matrix(job_data, encoder)
+
+    rescored = 0
+    top_ids = np.empty(0, dtype=np.int64)
+    top_fields = np.empty((0, len(JOB_FIELDS)))
+    top_scores = np.empty(0)
+
+    for ids, matrix, counts in iter_embedding_batches(encoder.model_name, resumes, batch_size):
+        field_scores, final_scores = score_chunk_groups(matrix, counts, job_matrix)
+        Resume.objects.bulk_update(
+            [Resume(id=int(resume_id), ats_score=float(score)) for resume_id, score in zip(ids, final_scores)],
+            ["ats_score"],
+            batch_size=1000,
+        )
+        materialize_shortlisted(Resume.objects.filter(id__in=[int(resume_id) for resume_id in ids]))
+        rescored += len(ids)
+
+        # ✅ Keep a running top-N instead of holding every score in memory
+        top_ids = np.concatenate([top_ids, ids])
+        top_fields = np.vstack([top_fields, field_scores])
+        top_scores = np.concatenate([top_scores, final_scores])
+        if len(top_scores) > top_n:
+            keep = np.argpartition(-top_scores, top_n)[:top_n]
+            top_ids, top_fields, top_scores = top_ids[keep], top_fields[keep], top_scores[keep]
+
+    order = np.argsort(-top_scores, kind="stable")
+    top_candidates = [
+        {
+            "resume_id": int(top_ids[i]),
+            "ats_score": float(top_scores[i]),
+            "shortlisted": bool(top_scores[i] >= ats_threshold),
+            "scores": {field: float(value) for field, value in zip(JOB_FIELDS, top_fields[i])},
+        }
+        for i in order
+    ]
+    return {"rescored": rescored, "embedded": embedded, "top_candidates": top_candidates}
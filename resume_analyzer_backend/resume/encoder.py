@@ -0,0 +1,202 @@
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from django.conf import settings
+
+
+# ✅ Defaults used when settings.RESUME_ENCODER leaves a key out
+DEFAULT_ENCODER_CONFIG = {
+    "MODEL_NAME": "paraphrase-MiniLM-L3-v2",
+    "DEVICE": "cpu",
+    "CACHE_FOLDER": "/tmp",
+    "WARMUP": True,
+    "WARMUP_BACKGROUND": True,  # warm up in a daemon thread so the worker starts serving (e.g. /health) at once
+    "SERVER_SOCKET": "",        # set to use the shared inference server (manage.py serve_encoder) instead of a local copy
+    "SERVER_TIMEOUT_SECONDS": 30,
+    "SERVER_MAX_BATCH": 64,     # texts per batch on the server
+    "MICRO_BATCH": True,        # merge concurrent in-process scoring encodes into one batch
+    "MICRO_BATCH_MAX_SIZE": 32,
+    "MICRO_BATCH_WAIT_MS": 5.0, # how long the first caller waits for others to join (server uses it too)
+}
+
+
+@dataclass
+class LoadedEncoder:
+    """A SentenceTransformer instance plus the cost of loading it."""
+    model: object
+    model_name: str
+    device: str
+    load_seconds: float
+    param_bytes: int
+    rss_delta_bytes: int
+    loaded_at: float = field(default_factory=time.time)
+    warmed: bool = False
+    batch_metrics: object = None  # callable returning micro-batching metrics, if batching is in front of the model
+
+    def stats(self):
+        return {
+            "model_name": self.model_name,
+            "device": self.device,
+            "load_seconds": round(self.load_seconds, 3),
+            "param_megabytes": round(self.param_bytes / (1024 * 1024), 2),
+            "rss_delta_megabytes": round(self.rss_delta_bytes / (1024 * 1024), 2),
+            "warmed": self.warmed,
+            "pid": os.getpid(),
+            "batching": self.batch_metrics() if self.batch_metrics else None,
+        }
+
+
+# ✅ One encoder per (model name, device) per worker process
+_encoders = {}
+_lock = threading.Lock()
+
+
+def get_encoder_config():
+    """Reads the encoder settings at call time so overrides apply without a code reload."""
+    config = dict(DEFAULT_ENCODER_CONFIG)
+    config.update(getattr(settings, "RESUME_ENCODER", {}))
+    return config
+
+
+def _rss_bytes():
+    """Current resident set size of this process (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _load_encoder(model_name, device, cache_folder):
+    from sentence_transformers import SentenceTransformer
+
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+    model = SentenceTransformer(model_name, device=device or None, cache_folder=cache_folder)
+    load_seconds = time.perf_counter() - started
+
+    param_bytes = sum(p.numel() * p.element_size() for p in model.parameters())
+    print(f"✅ Loaded encoder {model_name} on {device or 'auto'} in {load_seconds:.2f}s")
+
+    return LoadedEncoder(
+        model=model,
+        model_name=model_name,
+        device=device,
+        load_seconds=load_seconds,
+        param_bytes=param_bytes,
+        rss_delta_bytes=max(_rss_bytes() - rss_before, 0),
+    )
+
+
+def _connect_remote_encoder(model_name, socket_path, timeout):
+    """An encoder whose model lives in the inference server; this worker holds no weights."""
+    from .inference import InferenceError, RemoteEncoderModel
+
+    started = time.perf_counter()
+    model = RemoteEncoderModel(socket_path, timeout=timeout)
+    served = model.info()["model_name"]
+    if served != model_name:
+        raise InferenceError(f"Inference server at {socket_path} serves {served}, not {model_name}")
+    print(f"✅ Connected to inference server for {model_name} at {socket_path}")
+
+    return LoadedEncoder(
+        model=model,
+        model_name=model_name,
+        device="remote",
+        load_seconds=time.perf_counter() - started,
+        param_bytes=0,
+        rss_delta_bytes=0,
+        batch_metrics=model.server_batch_metrics,
+    )
+
+
+def _with_micro_batching(encoder, config):
+    from .batching import BatchingModel
+
+    encoder.model = BatchingModel(encoder.model, config["MICRO_BATCH_MAX_SIZE"], config["MICRO_BATCH_WAIT_MS"])
+    encoder.batch_metrics = encoder.model.batcher.metrics
+    return encoder
+
+
+def load_local_encoder(model_name=None, device=None):
+    """Loads the weights in this process regardless of SERVER_SOCKET (used by the inference server itself)."""
+    config = get_encoder_config()
+    return _load_encoder(
+        model_name or config["MODEL_NAME"], device if device is not None else config["DEVICE"], config["CACHE_FOLDER"]
+    )
+
+
+def get_encoder(model_name=None, device=None):
+    """Returns the process-wide encoder, loading it (or connecting to the inference server) on first use."""
+    config = get_encoder_config()
+    key = (model_name or config["MODEL_NAME"], device if device is not None else config["DEVICE"])
+
+    encoder = _encoders.get(key)
+    if encoder is None:
+        with _lock:
+            encoder = _encoders.get(key)
+            if encoder is None:
+                if config["SERVER_SOCKET"]:
+                    encoder = _connect_remote_encoder(key[0], config["SERVER_SOCKET"], config["SERVER_TIMEOUT_SECONDS"])
+                else:
+                    encoder = _load_encoder(key[0], key[1], config["CACHE_FOLDER"])
+                    if config["MICRO_BATCH"]:
+                        encoder = _with_micro_batching(encoder, config)
+                _encoders[key] = encoder
+    return encoder
+
+
+def get_model(model_name=None, device=None):
+    return get_encoder(model_name, device).model
+
+
+def warm_up(model_name=None, device=None):
+    """Loads the encoder and runs one encode so the first request skips lazy initialisation."""
+    encoder = get_encoder(model_name, device)
+    if not encoder.warmed:
+        encoder.model.encode(["warm-up"])
+        encoder.warmed = True
+    return encoder
+
+
+def _is_serving_process():
+    """False for manage.py commands (migrate, shell, test ...) other than the runserver child."""
+    if os.path.basename(sys.argv[0]) != "manage.py":
+        return True  # gunicorn / uvicorn / wsgi import
+    if len(sys.argv) < 2 or sys.argv[1] != "runserver":
+        return False
+    return "--noreload" in sys.argv or os.environ.get("RUN_MAIN") == "true"
+
+
+def _warm_up_quietly():
+    try:
+        warm_up()
+    except Exception as e:
+        print(f"⚠️ Encoder warm-up failed: {e}")
+
+
+def warm_up_on_boot():
+    """Called from AppConfig.ready(): preloads the encoder in server worker processes.
+
+    Requests that need the encoder while the background warm-up is running wait on the
+    registry lock instead of loading a second copy.
+    """
+    config = get_encoder_config()
+    if not config["WARMUP"] or not _is_serving_process():
+        return
+    if config["WARMUP_BACKGROUND"]:
+        threading.Thread(target=_warm_up_quietly, name="encoder-warmup", daemon=True).start()
+    else:
+        _warm_up_quietly()
+
+
+def encoder_stats():
+    return [encoder.stats() for encoder in list(_encoders.values())]
+
+
+def clear_encoders():
+    """Drops every loaded encoder (used by tests and after settings changes)."""
+    with _lock:
+        _encoders.clear()
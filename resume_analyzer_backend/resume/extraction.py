@@ -0,0 +1,250 @@
+import io
+import itertools
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from django.conf import settings
+
+
+# ✅ Bump when extractors change so the content-addressed extraction cache is rebuilt
+EXTRACTOR_VERSION = "1"
+
+DEFAULT_EXTRACTION_CONFIG = {
+    "PROCESSES": os.cpu_count() or 1,  # 0 runs extraction inline in the calling thread
+    "TIMEOUT_SECONDS": 60,             # per file, enforced inside the worker process
+    "MEMORY_LIMIT_MB": 1024,           # address space a worker may add on top of what it inherited (0 = unlimited)
+}
+
+
+# ✅ Slack on top of TIMEOUT_SECONDS, counted from when a worker picked the file up, before
+# the worker is treated as hung (the in-worker alarm normally fires well within it)
+HUNG_WORKER_SLACK_SECONDS = 5
+POLL_SECONDS = 0.5
+
+
+def get_extraction_config():
+    config = dict(DEFAULT_EXTRACTION_CONFIG)
+    config.update(getattr(settings, "RESUME_EXTRACTION", {}))
+    return config
+
+
+class ExtractionTimeout(BaseException):
+    """Raised by the per-file alarm; a BaseException so the extractors' ``except Exception`` cannot swallow it."""
+
+
+@dataclass
+class ExtractionResult:
+    file_name: str
+    text: str = ""
+    error: str = ""
+    seconds: float = 0.0
+
+    @property
+    def ok(self):
+        return not self.error
+
+
+def named_bytes(file_name, data):
+    """BytesIO with a .name so utils.extract_text can pick the right extractor."""
+    buffer = io.BytesIO(data)
+    buffer.name = file_name
+    return buffer
+
+
+def _address_space_bytes():
+    """Current VmSize of this process (0 where /proc is not available)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+# ✅ Runs inside the worker processes
+_worker_starts = None
+
+
+def _init_worker(memory_limit_mb, starts=None):
+    global _worker_starts
+    _worker_starts = starts
+    if memory_limit_mb:
+        import resource
+        # Forked workers inherit the parent's mappings (torch alone is several GB of VmSize once
+        # the encoder is warm), so the cap is headroom above the inherited size, not an absolute.
+        limit = _address_space_bytes() + memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _raise_timeout(signum, frame):
+    raise ExtractionTimeout()
+
+
+def _extract_one(file_name, data, timeout_seconds, task_id=None):
+    from .utils import extract_text
+
+    if _worker_starts is not None and task_id is not None:
+        _worker_starts.put((task_id, time.time()))  # the parent's hung-worker clock starts here, not at submit
+    started = time.perf_counter()
+    use_alarm = timeout_seconds and threading.current_thread() is threading.main_thread() and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(int(timeout_seconds))
+    try:
+        text = extract_text(named_bytes(file_name, data))
+        return ExtractionResult(file_name, text=text, seconds=time.perf_counter() - started)
+    except ExtractionTimeout:
+        return ExtractionResult(file_name, error=f"Extraction timed out after {timeout_seconds}s",
+                                seconds=time.perf_counter() - started)
+    except MemoryError:
+        return ExtractionResult(file_name, error="Extraction exceeded the memory limit",
+                                seconds=time.perf_counter() - started)
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+# ✅ Shared process pool (one per web/queue worker process)
+@dataclass
+class _WorkerPool:
+    executor: ProcessPoolExecutor
+    starts: object  # queue of (task id, wall-clock start) posted by the workers
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_task_ids = itertools.count()
+_task_starts = {}  # task id -> start time (None while still queued) for every caller's in-flight files
+_starts_lock = threading.Lock()
+
+
+def _get_pool(config):
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            context = multiprocessing.get_context()
+            starts = context.Queue()
+            _pool = _WorkerPool(
+                executor=ProcessPoolExecutor(
+                    max_workers=config["PROCESSES"],
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(config["MEMORY_LIMIT_MB"], starts),
+                ),
+                starts=starts,
+            )
+        return _pool
+
+
+def _reset_pool(pool=None):
+    """Kills the pool's processes (a worker ignored its alarm or died) so the next call starts fresh.
+
+    Only ``pool`` (default: the current one) is torn down; if another caller already replaced
+    it there is nothing left to do.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or (pool is not None and _pool is not pool):
+            return
+        pool, _pool = _pool, None
+    for process in list(getattr(pool.executor, "_processes", {}).values()):
+        process.kill()
+    pool.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit(config, name, data, timeout):
+    """Queues one file on the shared pool (replacing a pool that broke meanwhile). Returns (pool, task id, future)."""
+    for attempt in range(2):
+        pool = _get_pool(config)
+        task_id = next(_task_ids)
+        with _starts_lock:
+            _task_starts[task_id] = None
+        try:
+            return pool, task_id, pool.executor.submit(_extract_one, name, data, timeout, task_id)
+        except RuntimeError:  # shut down by another caller's reset, or BrokenProcessPool
+            _forget_task(task_id)
+            if attempt:
+                raise
+            _reset_pool(pool)
+
+
+def _forget_task(task_id):
+    with _starts_lock:
+        _task_starts.pop(task_id, None)
+
+
+def _task_started_at(pool, task_id):
+    """When a worker picked the task up (None while it is still queued behind other callers' files)."""
+    with _starts_lock:
+        while True:
+            try:
+                started_id, started = pool.starts.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                break
+            if started_id in _task_starts:
+                _task_starts[started_id] = started
+        return _task_starts.get(task_id)
+
+
+def extract_texts_parallel(files):
+    """Extracts text from [(file name, bytes)] across worker processes, preserving order.
+
+    A file that times out, blows the memory cap or crashes its worker yields an
+    ExtractionResult with ``error`` set; the rest of the batch is unaffected.
+    """
+    config = get_extraction_config()
+    timeout = config["TIMEOUT_SECONDS"]
+
+    if not config["PROCESSES"]:
+        return [_extract_one(name, data, timeout) for name, data in files]
+
+    # The in-worker alarm is the real timeout; this only catches workers that stopped responding.
+    # Each file is timed from when a worker started it, so files waiting behind other callers'
+    # work in the shared pool are never mistaken for hung ones.
+    hung_after = (timeout or 3600) + HUNG_WORKER_SLACK_SECONDS
+    results = [None] * len(files)
+    pending, retried = {}, set()
+    for index, (name, data) in enumerate(files):
+        pool, task_id, future = _submit(config, name, data, timeout)
+        pending[future] = (index, pool, task_id)
+
+    while pending:
+        done, _ = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+        for future in list(pending):
+            index, pool, task_id = pending[future]
+            name, data = files[index]
+            if future in done:
+                del pending[future]
+                _forget_task(task_id)
+                try:
+                    results[index] = future.result()
+                except (BrokenProcessPool, CancelledError):
+                    _reset_pool(pool)
+                    if index in retried:
+                        results[index] = ExtractionResult(name, error="Extraction worker crashed (likely out of memory)")
+                    else:
+                        # ✅ The pool died under this file (maybe another caller's); give it one fresh worker
+                        retried.add(index)
+                        pool, task_id, future = _submit(config, name, data, timeout)
+                        pending[future] = (index, pool, task_id)
+                continue
+
+            started = _task_started_at(pool, task_id)
+            if started is not None and time.time() - started > hung_after:
+                del pending[future]
+                _forget_task(task_id)
+                results[index] = ExtractionResult(name, error="Extraction worker stopped responding")
+                _reset_pool(pool)  # the only way to reclaim a worker that ignores its alarm
+
+    return results
+
+
+def extract_text_isolated(file_name, data):
+    """Single-file extraction with the same timeout/memory guarantees."""
+    return extract_texts_parallel([(file_name, data)])[0]
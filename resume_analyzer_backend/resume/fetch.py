@@ -0,0 +1,127 @@
+import hashlib
+import os
+import tempfile
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+
+
+DEFAULT_FETCH_CONFIG = {
+    "CACHE_DIR": "/tmp/resume_file_cache",  # recently fetched resume files
+    "CACHE_MAX_MB": 512,                    # LRU-evicted by last access time
+    "CONNECT_TIMEOUT": 5,
+    "READ_TIMEOUT": 30,
+    "MAX_FILE_MB": 20,                      # refuse anything larger than this
+    "POOL_SIZE": 16,                        # keep-alive connections per host
+}
+
+
+def get_fetch_config():
+    config = dict(DEFAULT_FETCH_CONFIG)
+    config.update(getattr(settings, "RESUME_FETCH", {}))
+    return config
+
+
+class FetchError(Exception):
+    pass
+
+
+# ✅ One pooled keep-alive session per process
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = get_fetch_config()["POOL_SIZE"]
+                adapter = HTTPAdapter(
+                    pool_connections=pool_size,
+                    pool_maxsize=pool_size,
+                    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _cache_path(url, cache_dir):
+    return os.path.join(cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+
+def _evict(cache_dir, max_bytes):
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def fetch_resume_bytes(url):
+    """Returns the file at ``url``, served from the local disk cache when recently fetched.
+
+    Downloads stream through a pooled session with connect/read timeouts and a size cap.
+    Raises FetchError on failure.
+    """
+    if url.startswith("file://"):  # LocalResumeStorage
+        try:
+            with open(url[len("file://"):], "rb") as local_file:
+                return local_file.read()
+        except OSError as e:
+            raise FetchError(str(e)) from e
+
+    config = get_fetch_config()
+    cache_dir = config["CACHE_DIR"]
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _cache_path(url, cache_dir)
+
+    try:
+        with open(path, "rb") as cached:
+            data = cached.read()
+        os.utime(path)  # mark as recently used
+        return data
+    except FileNotFoundError:
+        pass
+
+    max_bytes = config["MAX_FILE_MB"] * 1024 * 1024
+    try:
+        with get_session().get(url, stream=True, timeout=(config["CONNECT_TIMEOUT"], config["READ_TIMEOUT"])) as response:
+            if response.status_code != 200:
+                raise FetchError(f"HTTP {response.status_code} for {url}")
+            chunks, size = [], 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise FetchError(f"{url} is larger than {config['MAX_FILE_MB']}MB")
+                chunks.append(chunk)
+    except requests.RequestException as e:
+        raise FetchError(str(e)) from e
+
+    data = b"".join(chunks)
+
+    # ✅ Atomic write so concurrent readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+    with os.fdopen(fd, "wb") as tmp:
+        tmp.write(data)
+    os.replace(tmp_path, path)
+    _evict(cache_dir, config["CACHE_MAX_MB"] * 1024 * 1024)
+    return data
@@ -0,0 +1,150 @@
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import numpy as np
+from .batching import MicroBatcher
+from .scoring import encode_texts
+
+
+# ✅ Wire format: every frame is a 4-byte big-endian length followed by the payload.
+# Request  = one JSON frame {"op": "encode", "texts": [...]} or {"op": "info"}
+# Response = one JSON frame (meta / error) + one raw float32 frame (empty for info / errors)
+_FRAME_HEADER = struct.Struct("!I")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+class InferenceError(RuntimeError):
+    pass
+
+
+def _send_frame(sock, payload):
+    sock.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise ConnectionError("Inference socket closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_frame(sock):
+    (size,) = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+    if size > MAX_FRAME_BYTES:
+        raise InferenceError(f"Frame of {size} bytes exceeds {MAX_FRAME_BYTES}")
+    return _recv_exact(sock, size)
+
+
+# 🧠 Server side
+class _EncodeHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                request = json.loads(_recv_frame(self.request))
+            except (ConnectionError, OSError, ValueError):
+                return
+
+            body = b""
+            try:
+                if request.get("op") == "info":
+                    meta = {"model_name": self.server.model_name, "pid": os.getpid(), "batching": self.server.batcher.metrics()}
+                else:
+                    matrix = self.server.batcher.run(request["texts"])
+                    meta = {"shape": list(matrix.shape)}
+                    body = matrix.tobytes()
+            except Exception as e:
+                meta = {"error": str(e)}
+
+            try:
+                _send_frame(self.request, json.dumps(meta).encode("utf-8"))
+                _send_frame(self.request, body)
+            except OSError:
+                return
+
+
+class InferenceServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """One process owns the encoder; gunicorn workers connect over a Unix socket instead of loading their own."""
+    daemon_threads = True
+
+    def __init__(self, socket_path, model, model_name, max_batch_size=64, max_wait_ms=5.0):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)  # ✅ Stale socket from a previous run
+        self.model_name = model_name
+        # ✅ Requests from every worker connection are micro-batched into one encode call
+        self.batcher = MicroBatcher(
+            lambda texts: encode_texts(model, texts), max_batch_size, max_wait_ms, name="inference-micro-batcher"
+        )
+        super().__init__(socket_path, _EncodeHandler)
+        os.chmod(socket_path, 0o660)
+
+    def server_close(self):
+        super().server_close()
+        self.batcher.close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+# 🔌 Client side
+class RemoteEncoderModel:
+    """Stands in for SentenceTransformer.encode in workers; one persistent connection per thread."""
+
+    def __init__(self, socket_path, timeout=30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            self._local.sock = sock
+        return sock
+
+    def _drop_connection(self):
+        sock = getattr(self._local, "sock", None)
+        self._local.sock = None
+        if sock is not None:
+            sock.close()
+
+    def _call(self, request):
+        payload = json.dumps(request).encode("utf-8")
+        for attempt in range(2):  # ✅ One reconnect, e.g. after the server restarted
+            try:
+                sock = self._connection()
+                _send_frame(sock, payload)
+                meta = json.loads(_recv_frame(sock))
+                body = _recv_frame(sock)
+                break
+            except (OSError, ConnectionError, ValueError) as e:
+                self._drop_connection()
+                if attempt:
+                    raise InferenceError(f"Inference server at {self.socket_path} unavailable: {e}")
+
+        if "error" in meta:
+            raise InferenceError(meta["error"])
+        return meta, body
+
+    def info(self):
+        return self._call({"op": "info"})[0]
+
+    def server_batch_metrics(self):
+        try:
+            return self.info().get("batching")
+        except InferenceError:
+            return None
+
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=True, **kwargs):
+        """Always returns L2-normalised float32 rows, which is all the scoring code asks for."""
+        single = isinstance(texts, str)
+        meta, body = self._call({"op": "encode", "texts": [texts] if single else list(texts)})
+        matrix = np.frombuffer(body, dtype=np.float32).reshape(meta["shape"])
+        return matrix[0] if single else matrix
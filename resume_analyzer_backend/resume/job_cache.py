@@ -0,0 +1,126 @@
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+import numpy as np
+from django.conf import settings
+from django.db import IntegrityError
+from .encoder import get_encoder
+from .scoring import encode_texts, job_field_texts
+
+
+DEFAULT_JOB_CACHE_CONFIG = {
+    "SIZE": 256,       # job profiles kept in memory per worker
+    "PERSIST": True,   # also store encoded profiles in the JobProfileEmbedding table
+}
+
+
+def get_job_cache_config():
+    config = dict(DEFAULT_JOB_CACHE_CONFIG)
+    config.update(getattr(settings, "RESUME_JOB_CACHE", {}))
+    return config
+
+
+def normalized_job_texts(job_data):
+    """Job field texts with whitespace collapsed, so cosmetic edits share one cache entry."""
+    return [re.sub(r"\s+", " ", text).strip() for text in job_field_texts(job_data)]
+
+
+def job_cache_key(job_texts, model_name):
+    payload = json.dumps({"model": model_name, "fields": job_texts}, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class JobEmbeddingLRU:
+    """Thread-safe in-process LRU of job-profile matrices."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            matrix = self._data.get(key)
+            if matrix is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return matrix
+
+    def put(self, key, matrix):
+        with self._lock:
+            self._data[key] = matrix
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+_memory_cache = JobEmbeddingLRU(get_job_cache_config()["SIZE"])
+
+
+def _load_persisted(key):
+    from .models import JobProfileEmbedding
+
+    row = JobProfileEmbedding.objects.filter(cache_key=key).values_list("dimensions", "vectors").first()
+    if row is None:
+        return None
+    dimensions, vectors = row
+    return np.frombuffer(bytes(vectors), dtype=np.float32).reshape(-1, dimensions)
+
+
+def _persist(key, model_name, matrix):
+    from .models import JobProfileEmbedding
+
+    try:
+        JobProfileEmbedding.objects.create(
+            cache_key=key,
+            model_name=model_name,
+            dimensions=matrix.shape[1],
+            vectors=matrix.astype(np.float32).tobytes(),
+        )
+    except IntegrityError:
+        pass  # another worker stored the same profile first
+
+
+def get_job_matrix(job_data, encoder=None):
+    """Returns the (fields x dims) job-profile matrix, encoding it only on a cache miss."""
+    encoder = encoder or get_encoder()
+    job_texts = normalized_job_texts(job_data)
+    key = job_cache_key(job_texts, encoder.model_name)
+
+    matrix = _memory_cache.get(key)
+    if matrix is not None:
+        return matrix
+
+    persist = get_job_cache_config()["PERSIST"]
+    if persist:
+        matrix = _load_persisted(key)
+
+    if matrix is None:
+        matrix = encode_texts(encoder.model, job_texts)
+        if persist:
+            _persist(key, encoder.model_name, matrix)
+
+    _memory_cache.put(key, matrix)
+    return matrix
+
+
+def job_cache_stats():
+    return {"entries": len(_memory_cache), "hits": _memory_cache.hits, "misses": _memory_cache.misses}
+
+
+def clear_job_cache():
+    _memory_cache.clear()
@@ -0,0 +1,21 @@
+import time
+from django.core.management.base import BaseCommand
+from resume.contacts import backfill_contacts
+
+
+class Command(BaseCommand):
+    help = "Re-extracts email / E.164 phone numbers from stored resume text in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true",
+                            help="Re-derive every resume (e.g. to normalise old phone formats), not only missing ones")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        scanned, updated = backfill_contacts(batch_size=options["batch_size"], only_missing=not options["all"])
+        elapsed = time.perf_counter() - started
+        rate = scanned / elapsed if elapsed else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"Scanned {scanned} resume(s), updated {updated} in {elapsed:.2f}s ({rate:.0f} rows/s)"
+        ))
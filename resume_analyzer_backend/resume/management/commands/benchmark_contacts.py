@@ -0,0 +1,50 @@
+import random
+import re
+import time
+from django.core.management.base import BaseCommand
+from resume.contacts import extract_contacts_batch
+
+
+def _legacy_extract(text):
+    """The previous utils.extract_email_and_phone, kept here as the baseline."""
+    email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+    phone_pattern = r"(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?(\d{3,4}[-.\s]?\d{4})"
+
+    email_matches = re.findall(email_pattern, text, re.IGNORECASE)
+    phone_matches = re.findall(phone_pattern, text)
+
+    email = email_matches[0] if email_matches else None
+    phone_number = "".join(phone_matches[0]).replace(" ", "").replace("-", "").replace(".", "").replace("(", "").replace(")", "") if phone_matches else None
+    return email, phone_number
+
+
+def _synthetic_resume(index, size_kb):
+    rng = random.Random(index)
+    header = f"Candidate {index}\ncandidate{index}@example.com | +91 98{rng.randint(10000000, 99999999)}\n"
+    body = "Python Django REST PostgreSQL 2019 - 2023 scored 98.5% in 12 projects. " * (size_kb * 1024 // 72)
+    return header + body
+
+
+class Command(BaseCommand):
+    help = "Measures contact-extraction throughput of the old regexes against resume.contacts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2000)
+        parser.add_argument("--text-kb", type=int, default=20)
+
+    def handle(self, *args, **options):
+        texts = [_synthetic_resume(i, options["text_kb"]) for i in range(options["rows"])]
+
+        started = time.perf_counter()
+        for text in texts:
+            _legacy_extract(text)
+        legacy = time.perf_counter() - started
+
+        started = time.perf_counter()
+        extract_contacts_batch(texts)
+        current = time.perf_counter() - started
+
+        rows = options["rows"]
+        self.stdout.write(f"Legacy regexes : {legacy:.2f}s ({rows / legacy:.0f} rows/s)")
+        self.stdout.write(f"contacts       : {current:.2f}s ({rows / current:.0f} rows/s)")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {legacy / current:.1f}x"))
@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+from django.core.management.base import BaseCommand
+
+
+# ✅ App modules first (what a worker imports at boot), then the heavy dependencies they now load lazily
+DEFAULT_MODULES = [
+    "resume.views",
+    "resume.utils",
+    "resume.pipeline",
+    "resume.reports",
+    "resume.ocr",
+    "resume.scoring",
+    "pdfplumber",
+    "docx",
+    "pytesseract",
+    "pdf2image",
+    "reportlab.platypus",
+    "xlsxwriter",
+    "spacy",
+    "sentence_transformers",
+]
+
+# Runs in a fresh interpreter so every module is measured cold, after django.setup()
+_PROBE = """
+import json, os, sys, time
+import django
+django.setup()
+
+def rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+module = sys.argv[1]
+before_modules = set(sys.modules)
+before_rss = rss()
+started = time.perf_counter()
+error = None
+try:
+    __import__(module)
+except Exception as e:
+    error = repr(e)
+seconds = time.perf_counter() - started
+heavy = [name for name in ("torch", "spacy", "sentence_transformers", "reportlab", "xlsxwriter", "pdfplumber")
+         if name in sys.modules and name not in before_modules]
+print(json.dumps({"seconds": seconds, "rss": max(rss() - before_rss, 0), "heavy": heavy, "error": error}))
+"""
+
+
+class Command(BaseCommand):
+    help = "Measures the cold import time and memory of app modules and heavy dependencies, one fresh process each."
+
+    def add_arguments(self, parser):
+        parser.add_argument("modules", nargs="*", help="Modules to measure (defaults to the app and its heavy deps)")
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, RESUME_ENCODER_WARMUP="False")
+        self.stdout.write(f"{'module':<24} {'seconds':>8} {'RSS MB':>8}  heavy deps pulled in")
+
+        for module in options["modules"] or DEFAULT_MODULES:
+            completed = subprocess.run(
+                [sys.executable, "-c", _PROBE, module], capture_output=True, text=True, env=env
+            )
+            try:
+                result = json.loads(completed.stdout.strip().splitlines()[-1])
+            except (IndexError, ValueError):
+                self.stdout.write(self.style.ERROR(f"{module:<24} probe failed: {completed.stderr.strip()[-200:]}"))
+                continue
+
+            if result["error"]:
+                self.stdout.write(self.style.WARNING(f"{module:<24} not importable: {result['error']}"))
+                continue
+            self.stdout.write(
+                f"{module:<24} {result['seconds']:>8.3f} {result['rss'] / 1024 / 1024:>8.1f}  "
+                f"{', '.join(result['heavy']) or '-'}"
+            )
@@ -0,0 +1,54 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Length
+from resume.models import Resume
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Compares list-style reads of Resume rows with and without extracted_text (synthetic rows, rolled back)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--text-kb", type=int, default=20, help="Size of the synthetic OCR text per resume")
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def _time(self, queryset, repeat):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for resume in queryset.iterator(chunk_size=2000):
+                resume.ats_score  # ✅ What a list endpoint actually touches
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    def handle(self, *args, **options):
+        text = ("Python Django PostgreSQL Docker Kubernetes " * 64)[:1024] * options["text_kb"]
+
+        try:
+            with transaction.atomic():
+                Resume.objects.bulk_create(
+                    [
+                        Resume(resume_file=f"https://example.com/bench_{i}.pdf", ats_score=i % 100, extracted_text=text)
+                        for i in range(options["rows"])
+                    ],
+                    batch_size=1000,
+                )
+
+                text_bytes = Resume.objects.aggregate(total=Sum(Length("extracted_text")))["total"] or 0
+                full = self._time(Resume.objects.with_text().order_by("-ats_score", "-id"), options["repeat"])
+                deferred = self._time(Resume.objects.order_by("-ats_score", "-id"), options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self.stdout.write(f"Rows            : {options['rows']}")
+        self.stdout.write(f"Text skipped    : {text_bytes / 1024 / 1024:.1f} MB per full scan")
+        self.stdout.write(f"With text       : {full:.3f}s")
+        self.stdout.write(f"Deferred (list) : {deferred:.3f}s")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {full / deferred:.2f}x"))
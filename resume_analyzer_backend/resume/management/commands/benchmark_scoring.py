@@ -0,0 +1,49 @@
+import time
+from django.core.management.base import BaseCommand
+from resume.encoder import get_encoder
+from resume.scoring import JOB_FIELDS, job_field_texts, score_resume
+from resume.utils import bert_match_keywords
+
+
+SAMPLE_JOB = {
+    "job_title": "Backend Engineer",
+    "job_description": "Build and operate Django REST APIs backed by PostgreSQL on the cloud.",
+    "required_skills": ["Python", "Django", "PostgreSQL", "REST", "Docker"],
+    "preferred_qualifications": ["B.Tech in Computer Science", "AWS certification"],
+    "responsibilities": ["Design APIs", "Review code", "Maintain CI pipelines"],
+}
+
+SAMPLE_RESUME = (
+    "Software engineer with {years} years of experience building Python services. "
+    "Worked with Django, Flask, PostgreSQL and Redis, deployed on Docker and Kubernetes. "
+    "Led a team of {team} engineers and maintained CI/CD pipelines on GitHub Actions. "
+)
+
+
+class Command(BaseCommand):
+    help = "Compares per-field BERT scoring with the batched scoring engine."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--resumes", type=int, default=50, help="Number of synthetic resumes to score")
+
+    def handle(self, *args, **options):
+        encoder = get_encoder()
+        model = encoder.model  # the per-field baseline calls the raw model directly
+        resumes = [SAMPLE_RESUME.format(years=i % 15 + 1, team=i % 7 + 2) * 4 for i in range(options["resumes"])]
+        job_texts = job_field_texts(SAMPLE_JOB)
+        model.encode(["warm-up"])
+
+        started = time.perf_counter()
+        for text in resumes:
+            {field: bert_match_keywords(model, text, job_text) for field, job_text in zip(JOB_FIELDS, job_texts)}
+        legacy_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for text in resumes:
+            score_resume(text, SAMPLE_JOB, encoder)
+        batched_seconds = time.perf_counter() - started
+
+        count = len(resumes)
+        self.stdout.write(f"Per-field encode : {legacy_seconds:.3f}s ({legacy_seconds / count * 1000:.1f} ms/resume)")
+        self.stdout.write(f"Batched engine   : {batched_seconds:.3f}s ({batched_seconds / count * 1000:.1f} ms/resume)")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {legacy_seconds / batched_seconds:.2f}x"))
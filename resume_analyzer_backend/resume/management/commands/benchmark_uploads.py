@@ -0,0 +1,44 @@
+import time
+from io import BytesIO
+from django.core.management.base import BaseCommand
+from docx import Document
+from resume.extraction import extract_texts_parallel
+from resume.storage import LocalResumeStorage, submit_upload
+
+
+def _sample_docx(index):
+    doc = Document()
+    doc.add_paragraph(f"Candidate {index}: Python, Django, PostgreSQL, Docker. " * 20)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class Command(BaseCommand):
+    help = "Times sequential upload+extract against the overlapped pipeline using the local storage backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--files", type=int, default=20)
+        parser.add_argument("--latency", type=float, default=0.25, help="Injected upload latency in seconds")
+        parser.add_argument("--root", default="/tmp/resume_benchmark_storage")
+
+    def handle(self, *args, **options):
+        storage = LocalResumeStorage(options["root"], latency_seconds=options["latency"])
+        files = [(f"resume_{i}.docx", _sample_docx(i)) for i in range(options["files"])]
+
+        started = time.perf_counter()
+        for name, data in files:
+            storage.upload(name, data)
+            extract_texts_parallel([(name, data)])
+        sequential = time.perf_counter() - started
+
+        started = time.perf_counter()
+        uploads = [submit_upload(storage, name, data) for name, data in files]
+        extract_texts_parallel(files)
+        for upload in uploads:
+            upload.result()
+        overlapped = time.perf_counter() - started
+
+        self.stdout.write(f"Sequential : {sequential:.2f}s")
+        self.stdout.write(f"Overlapped : {overlapped:.2f}s")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {sequential / overlapped:.2f}x"))
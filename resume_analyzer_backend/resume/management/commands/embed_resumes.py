@@ -0,0 +1,22 @@
+import time
+from django.core.management.base import BaseCommand
+from resume.embeddings import embed_missing_resumes, stale_embeddings
+from resume.encoder import get_encoder
+from resume.models import Resume
+
+
+class Command(BaseCommand):
+    help = "Encodes resumes with no stored vector, or one built before chunking / with other chunk settings."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=64, help="Resumes per encoder batch")
+
+    def handle(self, *args, **options):
+        encoder = get_encoder()
+        pending = stale_embeddings(encoder.model_name, Resume.objects.all()).count()
+        self.stdout.write(f"{pending} resume(s) need (re-)embedding with {encoder.model_name}")
+
+        started = time.perf_counter()
+        embedded = embed_missing_resumes(encoder.model_name, encoder, Resume.objects.all(), options["batch_size"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Embedded {embedded} resume(s) in {elapsed:.2f}s"))
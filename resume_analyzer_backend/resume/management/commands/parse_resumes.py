@@ -0,0 +1,26 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from resume.parsing import backfill_parsed_fields, get_nlp
+
+
+class Command(BaseCommand):
+    help = "Fills Resume.parsed_fields (names, skills, organizations, dates, education) with spaCy nlp.pipe."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Re-parse every resume, not only unparsed ones")
+        parser.add_argument("--batch-size", type=int, help="Texts per nlp.pipe batch")
+        parser.add_argument("--processes", type=int, help="nlp.pipe n_process")
+
+    def handle(self, *args, **options):
+        if get_nlp() is None:
+            raise CommandError("spaCy model is not installed (see RESUME_PARSING['MODEL'])")
+
+        started = time.perf_counter()
+        scanned, updated = backfill_parsed_fields(
+            only_missing=not options["all"], batch_size=options["batch_size"], n_process=options["processes"]
+        )
+        elapsed = time.perf_counter() - started
+        rate = scanned / elapsed if elapsed else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"Parsed {updated}/{scanned} resume(s) in {elapsed:.2f}s ({rate:.1f} docs/s)"
+        ))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from resume.upload_queue import drain_queue, requeue_stale_tasks, run_forever
+
+
+class Command(BaseCommand):
+    help = "Processes queued resume uploads (run alongside the web workers, or with RESUME_UPLOAD_WORKERS=0)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit")
+        parser.add_argument("--requeue-after", type=int, default=1800,
+                            help="Re-queue tasks stuck in processing for this many seconds")
+
+    def handle(self, *args, **options):
+        requeued = requeue_stale_tasks(options["requeue_after"])
+        if requeued:
+            self.stdout.write(f"Re-queued {requeued} stale task(s)")
+
+        if options["once"]:
+            self.stdout.write(self.style.SUCCESS(f"Processed {drain_queue()} task(s)"))
+            return
+        run_forever()
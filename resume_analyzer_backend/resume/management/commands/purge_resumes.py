@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from resume.purge import purge_status, run_purge, start_or_resume_purge
+
+
+class Command(BaseCommand):
+    help = "Deletes all resumes and their stored files, resuming an unfinished purge if there is one."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Files per storage delete call")
+        parser.add_argument("--workers", type=int, default=4, help="Concurrent storage delete calls")
+
+    def handle(self, *args, **options):
+        job, _ = start_or_resume_purge()
+        self.stdout.write(f"Purge {job.id}: resuming after resume #{job.last_resume_id}")
+        job = run_purge(job, batch_size=options["batch_size"], workers=options["workers"])
+        self.stdout.write(self.style.SUCCESS(str(purge_status(job))))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from resume.encoder import get_encoder_config, load_local_encoder
+from resume.inference import InferenceServer
+
+
+class Command(BaseCommand):
+    help = "Runs the shared sentence-encoder server; web workers with RESUME_ENCODER_SOCKET set send it their texts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--socket", help="Unix socket path (defaults to RESUME_ENCODER['SERVER_SOCKET'])")
+        parser.add_argument("--max-batch", type=int, help="Texts per encoder batch")
+
+    def handle(self, *args, **options):
+        config = get_encoder_config()
+        socket_path = options["socket"] or config["SERVER_SOCKET"]
+        if not socket_path:
+            raise CommandError("No socket path: pass --socket or set RESUME_ENCODER_SOCKET")
+
+        loaded = load_local_encoder()
+        loaded.model.encode(["warm-up"])
+        server = InferenceServer(
+            socket_path,
+            loaded.model,
+            loaded.model_name,
+            max_batch_size=options["max_batch"] or config["SERVER_MAX_BATCH"],
+            max_wait_ms=config["MICRO_BATCH_WAIT_MS"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Serving {loaded.model_name} on {socket_path}"))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-18 14:59
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0013_alter_resume_resume_file'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobProfileEmbedding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cache_key', models.CharField(max_length=64, unique=True)),
+                ('model_name', models.CharField(max_length=255)),
+                ('dimensions', models.PositiveIntegerField()),
+                ('vectors', models.BinaryField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0014_jobprofileembedding'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeEmbedding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(max_length=255)),
+                ('dimensions', models.PositiveIntegerField()),
+                ('vector', models.BinaryField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='embeddings', to='resume.resume')),
+            ],
+            options={
+                'unique_together': {('resume', 'model_name')},
+            },
+        ),
+    ]
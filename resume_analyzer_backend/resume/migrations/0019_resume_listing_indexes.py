@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0018_purgejob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['-ats_score', '-id'], name='resume_score_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['shortlisted', '-ats_score', '-id'], name='resume_shortlist_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['uploaded_at'], name='resume_uploaded_at_idx'),
+        ),
+    ]
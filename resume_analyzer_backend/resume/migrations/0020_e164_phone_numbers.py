@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0019_resume_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='extractioncache',
+            name='phone_number',
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='phone_number',
+            field=models.CharField(blank=True, max_length=16, null=True),
+        ),
+    ]
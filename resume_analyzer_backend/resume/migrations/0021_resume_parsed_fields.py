@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0020_e164_phone_numbers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='parsed_fields',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0021_resume_parsed_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='term_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ResumeTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('tf', models.PositiveIntegerField()),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='resume.resume')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term'], name='resume_term_idx')],
+                'unique_together': {('resume', 'term')},
+            },
+        ),
+    ]
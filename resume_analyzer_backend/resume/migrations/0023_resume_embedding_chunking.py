@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume', '0022_resume_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeembedding',
+            name='chunking',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+    ]
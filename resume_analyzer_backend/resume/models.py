@@ -1,3 +1,4 @@
+import uuid
 from django.db import models
 from django.utils import timezone
 from django.core.exceptions import ValidationError
@@ -12,6 +13,21 @@ def validate_resume_file(value):
         raise ValidationError("Only PDF and DOCX files are allowed.")
 
 
+# ✅ Columns left out of Resume querysets unless asked for with .with_text()
+RESUME_HEAVY_FIELDS = ("extracted_text",)
+
+
+class ResumeQuerySet(models.QuerySet):
+    def with_text(self):
+        """Loads every column, including the (possibly tens of KB) OCR text."""
+        return self.defer(None)
+
+
+class ResumeManager(models.Manager.from_queryset(ResumeQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().defer(*RESUME_HEAVY_FIELDS)
+
+
 class Resume(models.Model):
     resume_file = models.FileField(
         storage=RawMediaCloudinaryStorage(),  # Store in Cloudinary
@@ -23,8 +39,21 @@ class Resume(models.Model):
     ats_score = models.FloatField(default=0.0)  # Store ATS score
     shortlisted = models.BooleanField(default=False)  # Mark if shortlisted
     email = models.EmailField(null=True, blank=True)  # Store extracted email
-    phone_number = models.CharField(max_length=15, null=True, blank=True)  # Store extracted phone
+    phone_number = models.CharField(max_length=16, null=True, blank=True)  # Store extracted phone (E.164)
     extracted_text = models.TextField(blank=True, null=True)  # Store parsed text
+    content_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)  # SHA-256 of the file
+    parsed_fields = models.JSONField(null=True, blank=True)  # spaCy structured parse (see parsing.py)
+    term_count = models.PositiveIntegerField(null=True, blank=True)  # BM25 document length; null = not indexed yet
+
+    objects = ResumeManager()  # ✅ Defers extracted_text; list/report paths never pull it over the wire
+
+    class Meta:
+        indexes = [
+            # ✅ Keyset pagination on (ats_score, id), overall and within the shortlist
+            models.Index(fields=["-ats_score", "-id"], name="resume_score_id_idx"),
+            models.Index(fields=["shortlisted", "-ats_score", "-id"], name="resume_shortlist_score_idx"),
+            models.Index(fields=["uploaded_at"], name="resume_uploaded_at_idx"),
+        ]
 
     def __str__(self):
         return f"{self.resume_file.name} - ATS: {self.ats_score}" if self.resume_file else "Unnamed Resume"
@@ -35,3 +64,126 @@ class HRSettings(models.Model):
 
     def __str__(self):
         return f"ATS Threshold: {self.ats_threshold}"
+
+
+class ExtractionCache(models.Model):
+    """Extraction output keyed by file SHA-256 + extractor version; re-uploads skip upload & parsing."""
+    content_hash = models.CharField(max_length=64)
+    extractor_version = models.CharField(max_length=20)
+    resume_url = models.URLField(max_length=500)
+    extracted_text = models.TextField()
+    email = models.EmailField(null=True, blank=True)
+    phone_number = models.CharField(max_length=16, null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ("content_hash", "extractor_version")
+
+    def __str__(self):
+        return f"{self.content_hash[:12]} (v{self.extractor_version})"
+
+
+class JobProfileEmbedding(models.Model):
+    """Encoded job fields, keyed by a hash of the normalised job text and the encoder name."""
+    cache_key = models.CharField(max_length=64, unique=True)
+    model_name = models.CharField(max_length=255)
+    dimensions = models.PositiveIntegerField()
+    vectors = models.BinaryField()  # float32 matrix, one row per scored job field
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.model_name} - {self.cache_key[:12]}"
+
+
+class ResumeEmbedding(models.Model):
+    """Encoded resume text, one row per resume and encoder, so re-scoring never re-encodes."""
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="embeddings")
+    model_name = models.CharField(max_length=255)
+    dimensions = models.PositiveIntegerField()
+    vector = models.BinaryField()  # L2-normalised float32, one row per text chunk
+    chunking = models.CharField(max_length=32, blank=True, default="")  # chunking_signature() it was built with
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ("resume", "model_name")
+
+    def __str__(self):
+        return f"Resume {self.resume_id} - {self.model_name}"
+
+
+class ResumeTerm(models.Model):
+    """Inverted-index posting: one row per (term, resume) with the term frequency (see search.py)."""
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="terms")
+    term = models.CharField(max_length=64)
+    tf = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = ("resume", "term")
+        indexes = [models.Index(fields=["term"], name="resume_term_idx")]
+
+    def __str__(self):
+        return f"{self.term} x{self.tf} (resume {self.resume_id})"
+
+
+class UploadBatch(models.Model):
+    """A multi-file upload accepted by the API and processed by the upload workers."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    STATUS_CHOICES = [(PENDING, "Pending"), (PROCESSING, "Processing"), (COMPLETED, "Completed")]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    job_data = models.JSONField()
+    ats_threshold = models.FloatField(default=60)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    total_files = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Batch {self.id} ({self.status})"
+
+
+class UploadTask(models.Model):
+    """One file of an UploadBatch; the table doubles as the work queue."""
+    QUEUED = "queued"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [(QUEUED, "Queued"), (PROCESSING, "Processing"), (DONE, "Done"), (FAILED, "Failed")]
+
+    batch = models.ForeignKey(UploadBatch, on_delete=models.CASCADE, related_name="tasks")
+    file_name = models.CharField(max_length=255)
+    spool_path = models.CharField(max_length=500)  # local copy of the upload until processed
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    error = models.TextField(blank=True, default="")
+    resume = models.ForeignKey(Resume, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    ats_score = models.FloatField(null=True, blank=True)
+    shortlisted = models.BooleanField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.file_name} ({self.status})"
+
+
+class PurgeJob(models.Model):
+    """Progress of a bulk 'delete all resumes' run; the cursor makes it resumable after a crash."""
+    RUNNING = "running"
+    COMPLETED = "completed"
+    STATUS_CHOICES = [(RUNNING, "Running"), (COMPLETED, "Completed")]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=RUNNING)
+    max_resume_id = models.BigIntegerField(default=0)   # snapshot: resumes uploaded later are kept
+    last_resume_id = models.BigIntegerField(default=0)  # everything up to here is purged
+    deleted_rows = models.PositiveIntegerField(default=0)
+    deleted_files = models.PositiveIntegerField(default=0)
+    failed_urls = models.JSONField(default=list, blank=True)  # assets to retry, rows are already gone
+    started_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Purge {self.id} ({self.status}, up to #{self.last_resume_id})"
@@ -0,0 +1,88 @@
+import base64
+import json
+from urllib.parse import urlencode
+from django.conf import settings
+from django.db.models import Q
+
+
+DEFAULT_LISTING_CONFIG = {
+    "PAGE_SIZE": 50,       # rows per page when paging with ?cursor= but no ?limit=
+    "MAX_PAGE_SIZE": 500,  # hard cap on ?limit=
+}
+
+# ✅ Every listing is ordered best-first; id breaks ties so the order is total
+LISTING_ORDER = ("-ats_score", "-id")
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def get_listing_config():
+    config = dict(DEFAULT_LISTING_CONFIG)
+    config.update(getattr(settings, "RESUME_LISTING", {}))
+    return config
+
+
+def encode_cursor(ats_score, resume_id):
+    raw = json.dumps([ats_score, resume_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        ats_score, resume_id = json.loads(raw)
+        return float(ats_score), int(resume_id)
+    except (ValueError, TypeError):
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+
+
+def page_limit(params):
+    """Rows per page, or None when the client asked for no page (existing clients get every row)."""
+    if "limit" not in params and "cursor" not in params:
+        return None
+    config = get_listing_config()
+    try:
+        limit = int(params.get("limit", config["PAGE_SIZE"]))
+    except (TypeError, ValueError):
+        limit = config["PAGE_SIZE"]
+    return max(1, min(limit, config["MAX_PAGE_SIZE"]))
+
+
+def keyset_page(queryset, cursor=None, limit=50):
+    """One page of `queryset` after `cursor`, seeking on (ats_score, id) instead of OFFSET.
+
+    `queryset` may be a model or a .values() queryset. Returns (rows, next_cursor); next_cursor is
+    None on the last page. ``limit=None`` returns every row in listing order.
+    """
+    queryset = queryset.order_by(*LISTING_ORDER)
+    if limit is None and not cursor:
+        return list(queryset), None
+    if cursor:
+        ats_score, resume_id = decode_cursor(cursor)
+        queryset = queryset.filter(Q(ats_score__lt=ats_score) | Q(ats_score=ats_score, id__lt=resume_id))
+
+    rows = list(queryset[:limit + 1])  # ✅ One extra row tells us whether there is a next page
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    if isinstance(last, dict):
+        return rows, encode_cursor(last["ats_score"], last["id"])
+    return rows, encode_cursor(last.ats_score, last.id)
+
+
+def next_page_url(request, next_cursor):
+    params = request.GET.copy()
+    params["cursor"] = next_cursor
+    return request.build_absolute_uri(f"{request.path}?{urlencode(list(params.lists()), doseq=True)}")
+
+
+def set_pagination_headers(response, request, next_cursor):
+    """The list endpoints keep their plain array bodies; the next page is advertised in headers."""
+    if next_cursor:
+        response["X-Next-Cursor"] = next_cursor
+        response["Link"] = f'<{next_page_url(request, next_cursor)}>; rel="next"'
+    return response
@@ -0,0 +1,189 @@
+import itertools
+import re
+import threading
+from django.conf import settings
+from .skills import SKILL_VOCABULARY
+
+
+PARSER_VERSION = "1"
+
+DEFAULT_PARSING_CONFIG = {
+    "MODEL": "en_core_web_sm",
+    # ✅ Only tok2vec + ner are needed for entities; skipping the rest makes nlp.pipe much cheaper
+    "DISABLE": ("tagger", "parser", "attribute_ruler", "lemmatizer"),
+    "BATCH_SIZE": 64,
+    "N_PROCESS": 1,          # backfills can raise this (nlp.pipe forks worker processes)
+    "MAX_CHARS": 20000,      # long OCR dumps are truncated before parsing
+    "PARSE_ON_UPLOAD": True,
+}
+
+MAX_LIST_ITEMS = 20
+NAME_REGION_CHARS = 500
+
+DEGREE_RE = re.compile(
+    r"\b(?:B\.?\s?Tech|M\.?\s?Tech|B\.\s?E|M\.\s?E|B\.?\s?Sc|M\.?\s?Sc|B\.?\s?Com|M\.?\s?Com|BCA|MCA|MBA|Ph\.?\s?D"
+    r"|Bachelor(?:'s)? of [A-Z][A-Za-z ]{2,40}|Master(?:'s)? of [A-Z][A-Za-z ]{2,40}|Diploma in [A-Z][A-Za-z ]{2,40})\b\.?"
+)
+INSTITUTION_RE = re.compile(r"\b(?:University|College|Institute|School|Academy|IIT|NIT|IIIT)\b")
+
+_lock = threading.Lock()
+_nlp = None
+_load_failed = False
+
+
+def get_parsing_config():
+    config = dict(DEFAULT_PARSING_CONFIG)
+    config.update(getattr(settings, "RESUME_PARSING", {}))
+    return config
+
+
+def _build_nlp(config):
+    import spacy
+
+    nlp = spacy.load(config["MODEL"], disable=list(config["DISABLE"]))
+    return _add_skill_matcher(nlp)
+
+
+def _add_skill_matcher(nlp):
+    """Skill phrases are matched case-insensitively on the token text (no tagger/lemmatizer needed)."""
+    from spacy.matcher import PhraseMatcher
+
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    matcher.add("SKILL", list(nlp.tokenizer.pipe(SKILL_VOCABULARY)))
+    nlp.skill_matcher = matcher
+    return nlp
+
+
+def get_nlp():
+    """The process-wide spaCy pipeline, or None if the model is not installed (parsing is then skipped)."""
+    global _nlp, _load_failed
+    if _nlp is None and not _load_failed:
+        with _lock:
+            if _nlp is None and not _load_failed:
+                try:
+                    _nlp = _build_nlp(get_parsing_config())
+                except (ImportError, OSError) as e:
+                    _load_failed = True
+                    print(f"⚠️ spaCy model unavailable, structured parsing disabled: {e}")
+    return _nlp
+
+
+def set_nlp(nlp):
+    """Installs a custom pipeline (tests, or callers that built one with other components)."""
+    global _nlp, _load_failed
+    with _lock:
+        _nlp = _add_skill_matcher(nlp) if nlp is not None and not hasattr(nlp, "skill_matcher") else nlp
+        _load_failed = False
+
+
+def _unique(values, limit=MAX_LIST_ITEMS):
+    seen, result = set(), []
+    for value in values:
+        value = " ".join(value.split())
+        key = value.lower()
+        if value and key not in seen:
+            seen.add(key)
+            result.append(value)
+            if len(result) >= limit:
+                break
+    return result
+
+
+def fields_from_doc(doc, nlp):
+    """The structured fields stored in Resume.parsed_fields for one parsed document."""
+    entities = {"PERSON": [], "ORG": [], "DATE": []}
+    for ent in doc.ents:
+        if ent.label_ in entities:
+            entities[ent.label_].append(ent)
+
+    name = next((ent.text for ent in entities["PERSON"] if ent.start_char < NAME_REGION_CHARS), None)
+    organizations = _unique(ent.text for ent in entities["ORG"])
+    from spacy.util import filter_spans
+
+    # ✅ Longest match wins ("django rest framework", not also "django")
+    skill_spans = filter_spans([doc[start:end] for _, start, end in nlp.skill_matcher(doc)])
+    skills = _unique((span.text.lower() for span in skill_spans), limit=100)
+
+    return {
+        "version": PARSER_VERSION,
+        "name": " ".join(name.split()) if name else None,
+        "skills": skills,
+        "organizations": organizations,
+        "dates": _unique(ent.text for ent in entities["DATE"]),
+        "education": {
+            "degrees": _unique(match.group().rstrip(".") for match in DEGREE_RE.finditer(doc.text)),
+            "institutions": [org for org in organizations if INSTITUTION_RE.search(org)],
+        },
+    }
+
+
+def parse_texts(texts, batch_size=None, n_process=None):
+    """Yields parsed_fields dicts (None where there is no model or no text) in input order, via nlp.pipe.
+
+    ``texts`` is consumed lazily, so a whole table can be streamed through one call (and one
+    worker pool when n_process > 1).
+    """
+    config = get_parsing_config()
+    nlp = get_nlp()
+    if nlp is None:
+        yield from (None for _ in texts)
+        return
+
+    texts, for_nlp = itertools.tee(texts)
+    docs = nlp.pipe(
+        ((text or "")[:config["MAX_CHARS"]] for text in for_nlp),
+        batch_size=batch_size or config["BATCH_SIZE"],
+        n_process=n_process or config["N_PROCESS"],
+    )
+    for text, doc in zip(texts, docs):
+        yield fields_from_doc(doc, nlp) if text else None
+
+
+def parse_resume_text(text):
+    return next(parse_texts([text], n_process=1))
+
+
+def parse_on_upload(text):
+    """Upload-time hook: never fails the upload; a missing model or parse error leaves the field empty."""
+    if not get_parsing_config()["PARSE_ON_UPLOAD"] or not text or text.startswith("❌"):
+        return None
+    try:
+        return parse_resume_text(text)
+    except Exception as e:
+        print(f"⚠️ Structured parse failed: {e}")
+        return None
+
+
+def backfill_parsed_fields(only_missing=True, batch_size=None, n_process=None):
+    """Streams stored extracted_text through a single nlp.pipe call and bulk-updates parsed_fields
+    every ``batch_size`` parsed rows. Returns (scanned, updated).
+    """
+    from .models import Resume
+
+    config = get_parsing_config()
+    batch_size = batch_size or config["BATCH_SIZE"]
+    if get_nlp() is None:
+        return 0, 0
+
+    queryset = Resume.objects.exclude(extracted_text__isnull=True).exclude(extracted_text="")
+    if only_missing:
+        queryset = queryset.filter(parsed_fields__isnull=True)
+
+    rows = queryset.order_by("id").values_list("id", "extracted_text").iterator(chunk_size=batch_size * 4)
+    rows, for_parse = itertools.tee(rows)
+    parsed = parse_texts((text for _, text in for_parse), batch_size, n_process)
+
+    scanned = updated = 0
+    changed = []
+    for (resume_id, _), fields in zip(rows, parsed):
+        scanned += 1
+        if fields:
+            changed.append(Resume(id=resume_id, parsed_fields=fields))
+        if len(changed) >= batch_size:
+            Resume.objects.bulk_update(changed, ["parsed_fields"])
+            updated += len(changed)
+            changed = []
+    if changed:
+        Resume.objects.bulk_update(changed, ["parsed_fields"])
+        updated += len(changed)
+    return scanned, updated
@@ -0,0 +1,224 @@
+import hashlib
+from dataclasses import dataclass
+from .chunking import chunking_signature
+from .embeddings import bytes_to_vector, store_resume_embedding
+from .encoder import get_encoder
+from .job_cache import get_job_matrix
+from .scoring import encode_resume, score_vector
+from .fetch import FetchError, fetch_resume_bytes
+from .extraction import EXTRACTOR_VERSION, extract_text_isolated, extract_texts_parallel
+from .storage import get_resume_storage, submit_upload
+from .contacts import extract_email_and_phone
+from .parsing import parse_on_upload
+from .search import index_on_upload
+from .skills import match_skills
+from .thresholds import materialize_shortlisted
+
+
+class ResumeProcessingError(Exception):
+    """A single resume could not be processed; the message is safe to show to HR."""
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_all(file_obj):
+    file_obj.seek(0)
+    data = file_obj.read()
+    file_obj.seek(0)
+    return data
+
+
+# ✅ Content-addressed extraction cache
+def cache_extraction(digest, resume_url, resume_text, email, phone_number):
+    from .models import ExtractionCache
+
+    if resume_text.startswith("❌"):
+        return  # extractor error message, let the next upload try again
+    ExtractionCache.objects.get_or_create(
+        content_hash=digest,
+        extractor_version=EXTRACTOR_VERSION,
+        defaults={"resume_url": resume_url, "extracted_text": resume_text, "email": email, "phone_number": phone_number},
+    )
+
+
+@dataclass
+class _PendingFile:
+    file_obj: object
+    data: bytes
+    digest: str
+    cached: object = None
+    same_as: object = None     # earlier _PendingFile of this batch with the same bytes
+    upload: object = None      # Future -> stored URL
+    extraction: object = None  # ExtractionResult
+
+
+def _existing_vector(digest, model_name):
+    """Vector of an earlier upload of the same file, so duplicates skip encoding too."""
+    from .models import ResumeEmbedding
+
+    row = (
+        ResumeEmbedding.objects.filter(resume__content_hash=digest, model_name=model_name, chunking=chunking_signature())
+        .values_list("vector", "dimensions")
+        .first()
+    )
+    return bytes_to_vector(*row) if row is not None else None
+
+
+# ✅ Upload → extract → score → save, for every file of a batch
+def process_batch(files, job_data, ats_threshold, encoder=None):
+    """Runs the pipeline for a batch of uploaded files.
+
+    Uploads start first on the storage pool, text extraction runs meanwhile on the process
+    pool, and each file is then scored and saved. Files seen before (same SHA-256 and
+    extractor version) skip upload and extraction. Returns, per file, the result dict or
+    the ResumeProcessingError that stopped it.
+    """
+    from .models import ExtractionCache
+
+    encoder = encoder or get_encoder()
+    pending = []
+    for file_obj in files:
+        data = _read_all(file_obj)
+        pending.append(_PendingFile(file_obj, data, content_hash(data)))
+
+    cached = {
+        entry.content_hash: entry
+        for entry in ExtractionCache.objects.filter(
+            content_hash__in=[item.digest for item in pending], extractor_version=EXTRACTOR_VERSION
+        )
+    }
+    misses, first_by_digest = [], {}
+    storage = get_resume_storage()
+    for item in pending:
+        item.cached = cached.get(item.digest)
+        if item.cached is not None:
+            continue
+        item.same_as = first_by_digest.get(item.digest)
+        if item.same_as is None:
+            # ✅ Identical files in one batch are uploaded and extracted once
+            print("✅ Uploading file:", item.file_obj.name)
+            item.upload = submit_upload(storage, item.file_obj.name, item.data, item.digest)
+            first_by_digest[item.digest] = item
+            misses.append(item)
+
+    # ✅ Extract text (process pool, timeout & memory cap) while uploads are in flight
+    extractions = extract_texts_parallel([(item.file_obj.name, item.data) for item in misses])
+    for item, extraction in zip(misses, extractions):
+        item.extraction = extraction
+    for item in pending:
+        if item.same_as is not None:
+            item.upload, item.extraction = item.same_as.upload, item.same_as.extraction
+
+    results = []
+    for item in pending:
+        try:
+            results.append(_finish_file(item, job_data, ats_threshold, encoder))
+        except ResumeProcessingError as e:
+            results.append(e)
+    return results
+
+
+def process_resume_file(file_obj, job_data, ats_threshold, encoder=None):
+    """Single-file pipeline (used by the upload queue workers); raises ResumeProcessingError."""
+    result = process_batch([file_obj], job_data, ats_threshold, encoder)[0]
+    if isinstance(result, ResumeProcessingError):
+        raise result
+    return result
+
+
+def _finish_file(item, job_data, ats_threshold, encoder):
+    from .models import Resume
+
+    file_name = item.file_obj.name
+    if item.cached is not None:
+        print("♻️ Duplicate resume, reusing stored asset:", item.cached.resume_url)
+        cloudinary_url = item.cached.resume_url
+        resume_text, email, phone_number = item.cached.extracted_text, item.cached.email, item.cached.phone_number
+    else:
+        try:
+            cloudinary_url = item.upload.result()
+        except Exception as e:
+            raise ResumeProcessingError(f"Failed to upload {file_name}: {e}")
+        print("📂 File stored at:", cloudinary_url)
+
+        if item.extraction.error:
+            raise ResumeProcessingError(f"Failed to extract text from {file_name}: {item.extraction.error}")
+        resume_text = item.extraction.text
+        if not resume_text or resume_text.startswith("❌"):
+            # ✅ Extractors report failures as "❌ ..." text; never score or save those as a resume
+            reason = resume_text.lstrip("❌ ") if resume_text else "no text found"
+            raise ResumeProcessingError(f"Failed to extract text from {file_name}: {reason}")
+
+        email, phone_number = extract_email_and_phone(resume_text)
+        cache_extraction(item.digest, cloudinary_url, resume_text, email, phone_number)
+
+    print("📝 Extracted text:", resume_text[:100])
+
+    # ✅ Compute ATS Score (job fields are encoded once per batch via the job-profile cache)
+    duplicate = item.cached is not None or item.same_as is not None
+    resume_vector = _existing_vector(item.digest, encoder.model_name) if duplicate else None
+    if resume_vector is None:
+        resume_vector = encode_resume(resume_text, encoder)
+    ats_score = score_vector(resume_vector, get_job_matrix(job_data, encoder))
+    print(f"⭐ ATS Score for {file_name}: {ats_score['final_ats_score']}")
+
+    # ✅ Determine Shortlisting Status (the job's threshold for this response, the HR threshold for the stored flag)
+    is_shortlisted = ats_score["final_ats_score"] >= ats_threshold
+
+    # ✅ Save resume to the database (store Cloudinary URL)
+    resume_instance = Resume.objects.create(
+        resume_file=cloudinary_url,  # Store Cloudinary URL instead of file path
+        content_hash=item.digest,
+        extracted_text=resume_text,
+        email=email,
+        phone_number=phone_number,
+        ats_score=ats_score["final_ats_score"],
+        parsed_fields=parse_on_upload(resume_text),  # ✅ Names / skills / orgs / dates / education as JSON
+    )
+    materialize_shortlisted(Resume.objects.filter(id=resume_instance.id))
+
+    # ✅ Keep the vector so later jobs can re-score without re-encoding
+    store_resume_embedding(resume_instance, resume_vector, encoder.model_name)
+    index_on_upload(resume_instance.id, resume_text)  # ✅ Incremental BM25 postings for /search/
+
+    return {
+        "resume_id": resume_instance.id,
+        "file_name": file_name,
+        "resume_url": cloudinary_url,
+        "ats_score": ats_score["final_ats_score"],
+        "email": email,
+        "phone_number": phone_number,
+        "shortlisted": is_shortlisted,
+        "duplicate": duplicate,
+        "chunks": len(resume_vector),
+        "skills": match_skills(resume_text, job_data),  # ✅ Automaton is compiled once per job skill list
+    }
+
+
+def resume_file_url(resume):
+    """The stored asset URL (uploads save the Cloudinary URL itself as the file name)."""
+    name = resume.resume_file.name
+    return name if name.startswith(("http://", "https://")) else resume.resume_file.url
+
+
+def load_resume_text(resume):
+    """Returns the stored extracted_text, fetching and re-extracting the file only if it is missing."""
+    if resume.extracted_text:
+        return resume.extracted_text
+
+    url = resume_file_url(resume)
+    try:
+        data = fetch_resume_bytes(url)
+    except FetchError as e:
+        raise ResumeProcessingError(f"Failed to download resume {resume.id}: {e}")
+
+    extraction = extract_text_isolated(url.rsplit("/", 1)[-1], data)
+    if extraction.error or not extraction.text:
+        raise ResumeProcessingError(f"Failed to extract text from resume {resume.id}: {extraction.error}")
+
+    resume.extracted_text = extraction.text
+    resume.content_hash = resume.content_hash or content_hash(data)
+    resume.save(update_fields=["extracted_text", "content_hash"])
+    return resume.extracted_text
@@ -0,0 +1,127 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.db import close_old_connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+from .storage import get_resume_storage
+
+
+MAX_RECORDED_FAILURES = 1000
+STALE_AFTER_SECONDS = 120  # a running job without progress for this long is assumed dead
+
+
+def start_or_resume_purge():
+    """Returns (job, should_run): the unfinished PurgeJob if there is one, else a new one.
+
+    ``should_run`` is False while another thread/process is still making progress on it.
+    """
+    from .models import PurgeJob, Resume
+
+    job = PurgeJob.objects.filter(status=PurgeJob.RUNNING).order_by("started_at").first()
+    if job is None:
+        max_id = Resume.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+        return PurgeJob.objects.create(max_resume_id=max_id), True
+
+    stale = (timezone.now() - job.updated_at).total_seconds() > STALE_AFTER_SECONDS
+    return job, stale and job.id not in _running
+
+
+def _iter_windows(job, batch_size, workers):
+    """Streams (id, url) rows past the job cursor and yields them as windows of ``workers`` batches."""
+    from .models import Resume
+
+    rows = (
+        Resume.objects.filter(id__gt=job.last_resume_id, id__lte=job.max_resume_id)
+        .order_by("id")
+        .values_list("id", "resume_file")
+        .iterator(chunk_size=batch_size)
+    )
+    window, batch = [], []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            window.append(batch)
+            batch = []
+            if len(window) == workers:
+                yield window
+                window = []
+    if batch:
+        window.append(batch)
+    if window:
+        yield window
+
+
+def run_purge(job, batch_size=100, workers=4):
+    """Deletes stored files in concurrent batches, then the matching rows, checkpointing as it goes.
+
+    After every window the rows up to the window's last id are deleted and the cursor is
+    saved in the same transaction, so a crashed purge resumes where it stopped.
+    """
+    from .models import ExtractionCache, PurgeJob, Resume
+
+    storage = get_resume_storage()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resume-purge") as pool:
+        for window in _iter_windows(job, batch_size, workers):
+            urls_per_batch = [sorted({url for _, url in batch}) for batch in window]
+            # ✅ Uploads made after the purge started may reuse a content-addressed file; keep those
+            in_use = set(
+                Resume.objects.filter(
+                    id__gt=job.max_resume_id, resume_file__in=[url for urls in urls_per_batch for url in urls]
+                ).values_list("resume_file", flat=True)
+            )
+            urls_per_batch = [[url for url in urls if url not in in_use] for urls in urls_per_batch]
+            failed_per_batch = list(pool.map(storage.delete_many, urls_per_batch))
+
+            window_urls = [url for urls in urls_per_batch for url in urls]
+            failed = [url for failed_urls in failed_per_batch for url in failed_urls]
+            last_id = window[-1][-1][0]
+
+            with transaction.atomic():
+                deleted_rows = Resume.objects.filter(id__gt=job.last_resume_id, id__lte=last_id).delete()[1].get("resume.Resume", 0)
+                ExtractionCache.objects.filter(resume_url__in=window_urls).delete()
+                job.last_resume_id = last_id
+                job.deleted_rows += deleted_rows
+                job.deleted_files += len(window_urls) - len(failed)
+                job.failed_urls = (job.failed_urls + failed)[:MAX_RECORDED_FAILURES]
+                job.updated_at = timezone.now()
+                job.save()
+            print(f"🗑️ Purge {job.id}: {job.deleted_rows} rows, {job.deleted_files} files (up to #{last_id})")
+
+    job.status = PurgeJob.COMPLETED
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at"])
+    return job
+
+
+_running = set()  # purge ids with a live thread in this process
+
+
+def run_purge_in_background(job):
+    def target():
+        _running.add(job.id)
+        try:
+            run_purge(job)
+        except Exception as e:
+            print(f"❌ Purge {job.id} stopped: {e} (it resumes on the next delete_all request)")
+        finally:
+            _running.discard(job.id)
+            close_old_connections()
+
+    thread = threading.Thread(target=target, name=f"resume-purge-{job.id}", daemon=True)
+    thread.start()
+    return thread
+
+
+def purge_status(job):
+    return {
+        "purge_id": str(job.id),
+        "status": job.status,
+        "deleted_rows": job.deleted_rows,
+        "deleted_files": job.deleted_files,
+        "failed_files": len(job.failed_urls),
+        "last_resume_id": job.last_resume_id,
+        "max_resume_id": job.max_resume_id,
+        "started_at": job.started_at,
+        "updated_at": job.updated_at,
+        "finished_at": job.finished_at,
+    }
@@ -0,0 +1,229 @@
+import csv
+import hashlib
+import os
+import tempfile
+from django.conf import settings
+
+
+# ✅ Columns shared by every export format
+REPORT_FIELDS = ("resume_file", "email", "phone_number", "ats_score", "shortlisted")
+REPORT_HEADERS = ("Resume File", "Email", "Phone Number", "ATS Score (%)", "Shortlisted")
+EXPORT_CHUNK_SIZE = 2000
+
+DEFAULT_REPORTS_CONFIG = {
+    "CACHE_DIR": "/tmp/resume_reports",  # pre-rendered PDF reports, one per resume-set fingerprint
+    "PDF_ROWS_PER_TABLE": 40,            # roughly one letter page per table
+}
+
+
+def get_reports_config():
+    config = dict(DEFAULT_REPORTS_CONFIG)
+    config.update(getattr(settings, "RESUME_REPORTS", {}))
+    return config
+
+
+def filtered_resumes(filter_type):
+    """all / shortlisted / not_shortlisted, as used by every report endpoint."""
+    from .models import Resume
+
+    if filter_type == "shortlisted":
+        return Resume.objects.filter(shortlisted=True)
+    if filter_type == "not_shortlisted":
+        return Resume.objects.filter(shortlisted=False)
+    return Resume.objects.all()
+
+
+def iter_report_rows(resumes, fields=REPORT_FIELDS, chunk_size=EXPORT_CHUNK_SIZE):
+    """Streams plain tuples from the database with a server-side cursor (no model instances)."""
+    return resumes.order_by("id").values_list(*fields).iterator(chunk_size=chunk_size)
+
+
+def shortlisted_label(value):
+    return "✅ Yes" if value else "❌ No"
+
+
+# 📂 Excel
+def write_excel_report(resumes, path):
+    """Writes the report with xlsxwriter's constant_memory mode (rows are flushed as written).
+
+    Returns the number of data rows.
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    worksheet = workbook.add_worksheet("Resumes")
+
+    # ✅ Formatting
+    header_format = workbook.add_format({"bold": True, "align": "center", "bg_color": "#D3D3D3", "border": 1})
+    percent_format = workbook.add_format({"num_format": "0.00%", "align": "center"})
+    yes_format = workbook.add_format({"bg_color": "#C6EFCE", "bold": True})
+    no_format = workbook.add_format({"bg_color": "#FFC7CE", "bold": True})
+    center_format = workbook.add_format({"align": "center"})
+
+    # ✅ Column widths must be set before rows are flushed
+    worksheet.set_column(0, len(REPORT_HEADERS) - 1, 20, center_format)
+    worksheet.set_column("D:D", 15, percent_format)
+    worksheet.write_row(0, 0, REPORT_HEADERS, header_format)
+
+    row_count = 0
+    for row_count, (resume_file, email, phone_number, ats_score, shortlisted) in enumerate(iter_report_rows(resumes), start=1):
+        worksheet.write_string(row_count, 0, resume_file or "")
+        worksheet.write_string(row_count, 1, email or "")
+        worksheet.write_string(row_count, 2, phone_number or "")
+        worksheet.write_number(row_count, 3, (ats_score or 0) / 100, percent_format)
+        worksheet.write_string(row_count, 4, shortlisted_label(shortlisted))
+
+    # ✅ Conditional Formatting for "Shortlisted"
+    if row_count:
+        cells = f"E2:E{row_count + 1}"
+        worksheet.conditional_format(cells, {"type": "text", "criteria": "containing", "value": "Yes", "format": yes_format})
+        worksheet.conditional_format(cells, {"type": "text", "criteria": "containing", "value": "No", "format": no_format})
+
+    workbook.close()
+    return row_count
+
+
+def build_excel_report_file(resumes):
+    """Writes the workbook to a temp file and returns an open handle; the path is already unlinked."""
+    fd, path = tempfile.mkstemp(suffix=".xlsx", prefix="resumes_")
+    os.close(fd)
+    try:
+        write_excel_report(resumes, path)
+        handle = open(path, "rb")
+    finally:
+        os.unlink(path)  # the open handle keeps the data until FileResponse closes it
+    return handle
+
+
+# 📄 CSV
+class _Echo:
+    """File-like object whose write() just returns the line, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv_report(resumes):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(REPORT_HEADERS)
+    for resume_file, email, phone_number, ats_score, shortlisted in iter_report_rows(resumes):
+        yield writer.writerow([resume_file, email or "", phone_number or "", f"{ats_score:.2f}", "Yes" if shortlisted else "No"])
+
+
+# 📝 PDF
+PDF_HEADERS = ["ID", "Email", "Phone", "ATS Score", "Shortlisted"]
+PDF_FIELDS = ("id", "email", "phone_number", "ats_score", "shortlisted")
+PDF_COL_WIDTHS_INCHES = (1, 2.5, 2, 1.5, 1.5)
+
+
+def _pdf_table_style():
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ])
+
+
+def report_fingerprint(resumes, filter_type):
+    """Hash of every reported column of the set, so any added, removed or edited row (score,
+    shortlist, email, phone...) renders a fresh PDF. Streams the narrow columns only."""
+    digest = hashlib.sha256(f"{filter_type}|".encode("utf-8"))
+    for row in iter_report_rows(resumes, PDF_FIELDS):
+        digest.update(repr(row).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class _FlowableStream(list):
+    """The list Platypus drains from the front, refilled one flowable at a time from a generator.
+
+    doc.build() only ever holds the table being laid out (and any split remainder), instead of
+    every table of the report.
+    """
+
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = iter(flowables)
+
+    def __len__(self):
+        if not super().__len__():
+            flowable = next(self._source, None)
+            if flowable is not None:
+                self.append(flowable)
+        return super().__len__()
+
+
+def _pdf_tables(resumes, rows_per_table):
+    """Yields one small Table per page-sized chunk (Platypus splits huge tables quadratically)."""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Table
+
+    col_widths = [width * inch for width in PDF_COL_WIDTHS_INCHES]
+    style = _pdf_table_style()
+    chunk = []
+    for resume_id, email, phone_number, ats_score, shortlisted in iter_report_rows(resumes, PDF_FIELDS):
+        chunk.append([str(resume_id), email or "N/A", phone_number or "N/A", f"{ats_score:.2f}%", shortlisted_label(shortlisted)])
+        if len(chunk) == rows_per_table:
+            yield Table([PDF_HEADERS] + chunk, colWidths=col_widths, style=style)
+            chunk = []
+    if chunk:
+        yield Table([PDF_HEADERS] + chunk, colWidths=col_widths, style=style)
+
+
+def write_pdf_report(resumes, filter_type, path):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate
+
+    doc = SimpleDocTemplate(path, pagesize=letter)
+    styles = getSampleStyleSheet()
+
+    def elements():
+        # ✅ Title
+        yield Paragraph(f"<b>Resume Report ({filter_type.capitalize()} Candidates)</b>", styles["Title"])
+        yield Paragraph("<br/><br/>", styles["Normal"])
+        empty = True
+        for table in _pdf_tables(resumes, get_reports_config()["PDF_ROWS_PER_TABLE"]):
+            empty = False
+            yield table
+        if empty:
+            yield Paragraph("No resumes found.", styles["Normal"])
+
+    # ✅ Build PDF (tables are generated as the layout reaches them)
+    doc.build(_FlowableStream(elements()))
+
+
+def get_pdf_report_path(filter_type):
+    """Path of the rendered PDF for the current resume set, rendering it only if the set changed."""
+    resumes = filtered_resumes(filter_type)
+    cache_dir = get_reports_config()["CACHE_DIR"]
+    os.makedirs(cache_dir, exist_ok=True)
+
+    prefix = f"resumes_{filter_type}_"
+    path = os.path.join(cache_dir, f"{prefix}{report_fingerprint(resumes, filter_type)}.pdf")
+    if os.path.exists(path):
+        return path
+
+    fd, tmp_path = tempfile.mkstemp(suffix=".pdf", dir=cache_dir)
+    os.close(fd)
+    try:
+        write_pdf_report(resumes, filter_type, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+    # ✅ Drop renders of older resume sets for this filter
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and os.path.join(cache_dir, name) != path:
+            try:
+                os.unlink(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+    return path
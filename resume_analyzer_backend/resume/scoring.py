@@ -0,0 +1,172 @@
+import time
+import numpy as np
+from .chunking import chunk_text, get_chunking_config
+from .encoder import get_encoder
+from .skills import match_skills
+
+
+# ✅ Job fields compared against the resume, in matrix row order
+JOB_FIELDS = ("job_title", "job_description", "required_skills", "preferred_qualifications", "responsibilities")
+ATS_WEIGHTS = {"job_title": 20, "job_description": 30, "required_skills": 25, "preferred_qualifications": 10, "responsibilities": 15}
+
+
+def job_field_texts(job_data):
+    """Returns one text per JOB_FIELDS entry (list fields are space-joined)."""
+    texts = []
+    for field in JOB_FIELDS:
+        value = job_data.get(field) or ""
+        texts.append(value if isinstance(value, str) else " ".join(value))
+    return texts
+
+
+def encode_texts(model, texts):
+    """Encodes texts in one batch into L2-normalised float32 rows (so dot product == cosine)."""
+    embeddings = model.encode(list(texts), convert_to_numpy=True, normalize_embeddings=True)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def similarity_scores(resume_vector, job_matrix):
+    """Cosine similarity of one resume vector against every job field row, as percentages."""
+    similarities = job_matrix @ resume_vector
+    return {field: round(float(value) * 100, 2) for field, value in zip(JOB_FIELDS, similarities)}
+
+
+def final_ats_score(scores):
+    """Weighted sum of the per-field scores plus the range bonus."""
+    final_score = sum(scores[key] * ATS_WEIGHTS[key] / 100 for key in scores) + 30
+
+    # Add points based on ATS score range
+    if final_score < 30:
+        final_score += 30
+    elif final_score <= 40:
+        final_score += 35
+    elif final_score <= 50:
+        final_score += 40
+    elif final_score <= 70:
+        final_score += 25
+    elif final_score <= 80:
+        final_score += 10
+    elif final_score <= 90:
+        final_score += 5
+
+    return round(final_score, 2)
+
+
+def final_ats_scores(score_matrix):
+    """Vectorised final_ats_score over an (n_resumes x fields) matrix of rounded percentages."""
+    weights = np.array([ATS_WEIGHTS[field] for field in JOB_FIELDS], dtype=np.float64) / 100
+    final_scores = score_matrix @ weights + 30
+    bonus = np.select(
+        [final_scores < 30, final_scores <= 40, final_scores <= 50, final_scores <= 70, final_scores <= 80, final_scores <= 90],
+        [30, 35, 40, 25, 10, 5],
+        default=0,
+    )
+    return np.round(final_scores + bonus, 2)
+
+
+def aggregate_chunk_groups(similarities, counts, aggregation="max", top_k=1):
+    """Collapses per-chunk similarity rows into one row per resume.
+
+    ``similarities`` is (total chunks x fields) with each resume's chunks contiguous and
+    ``counts`` the number of chunks per resume. Single-chunk resumes pass through unchanged.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    if aggregation == "max":
+        return np.maximum.reduceat(similarities, offsets, axis=0)
+    if aggregation == "mean":
+        return np.add.reduceat(similarities, offsets, axis=0) / counts[:, None]
+
+    # ✅ topk: mean of each resume's best min(top_k, chunks) rows, per field
+    padded = np.full((len(counts), int(counts.max()), similarities.shape[1]), -np.inf, dtype=similarities.dtype)
+    padded[np.repeat(np.arange(len(counts)), counts), np.arange(len(similarities)) - np.repeat(offsets, counts)] = similarities
+    best = -np.sort(-padded, axis=1)[:, :top_k]
+    taken = np.minimum(counts, top_k)
+    mask = np.arange(best.shape[1])[None, :, None] < taken[:, None, None]
+    return np.where(mask, best, 0).sum(axis=1) / taken[:, None]
+
+
+def score_chunk_groups(chunk_matrix, counts, job_matrix, config=None):
+    """score_matrix for stored chunk matrices: one product over every chunk, then per-resume aggregation."""
+    config = config or get_chunking_config()
+    similarities = aggregate_chunk_groups(chunk_matrix @ job_matrix.T, counts, config["AGGREGATION"], config["TOP_K"])
+    similarities = np.round(similarities.astype(np.float64) * 100, 2)
+    return similarities, final_ats_scores(similarities)
+
+
+def score_matrix(resume_matrix, job_matrix):
+    """Scores many stored resume vectors against one job profile with a single matrix product."""
+    similarities = np.round((resume_matrix @ job_matrix.T).astype(np.float64) * 100, 2)
+    return similarities, final_ats_scores(similarities)
+
+
+def score_vector(resume_vectors, job_matrix):
+    """Scores one resume, given as a single vector or as its (chunks x dims) matrix."""
+    resume_vectors = np.atleast_2d(resume_vectors)
+    if len(resume_vectors) == 1:
+        scores = similarity_scores(resume_vectors[0], job_matrix)
+    else:
+        config = get_chunking_config()
+        similarities = aggregate_chunk_groups(
+            resume_vectors @ job_matrix.T, [len(resume_vectors)], config["AGGREGATION"], config["TOP_K"]
+        )[0]
+        scores = {field: round(float(value) * 100, 2) for field, value in zip(JOB_FIELDS, similarities)}
+    return {"scores": scores, "final_ats_score": final_ats_score(scores)}
+
+
+def encode_resumes(resume_texts, encoder=None):
+    """Encodes every chunk of every resume in one batch.
+
+    Returns (list of (chunks x dims) matrices, list of chunk stats dicts). With chunking
+    disabled each resume is a single, model-truncated chunk.
+    """
+    encoder = encoder or get_encoder()
+    config = get_chunking_config()
+
+    started = time.perf_counter()
+    if config["ENABLED"]:
+        chunked = [chunk_text(text, config) for text in resume_texts]
+    else:
+        chunked = [None for _ in resume_texts]
+    chunk_lists = [item.chunks if item else [text] for item, text in zip(chunked, resume_texts)]
+    chunked_at = time.perf_counter()
+
+    matrix = encode_texts(encoder.model, [chunk for chunks in chunk_lists for chunk in chunks])
+    encode_seconds = time.perf_counter() - chunked_at
+    chunk_seconds = chunked_at - started
+    total = sum(len(chunks) for chunks in chunk_lists) or 1
+
+    matrices, stats, offset = [], [], 0
+    for item, chunks in zip(chunked, chunk_lists):
+        matrices.append(matrix[offset:offset + len(chunks)])
+        offset += len(chunks)
+        stats.append({
+            "chunks": len(chunks),
+            "total_chunks": item.total_chunks if item else 1,
+            "sections": item.sections if item else 1,
+            "chunk_ms": round(chunk_seconds * 1000 * len(chunks) / total, 3),
+            "encode_ms": round(encode_seconds * 1000 * len(chunks) / total, 3),
+        })
+    return matrices, stats
+
+
+def encode_resume(resume_text, encoder=None):
+    """(chunks x dims) matrix for one resume."""
+    return encode_resumes([resume_text], encoder)[0][0]
+
+
+def score_resume(resume_text, job_data, encoder=None):
+    """Encodes the resume's chunks once and scores them against the cached job-profile matrix.
+
+    ``skills`` lists the job's required skills found (or not) verbatim in the text.
+    """
+    from .job_cache import get_job_matrix
+
+    encoder = encoder or get_encoder()
+    job_matrix = get_job_matrix(job_data, encoder)
+    matrices, stats = encode_resumes([resume_text], encoder)
+    started = time.perf_counter()
+    result = score_vector(matrices[0], job_matrix)
+    result["chunks"] = {**stats[0], "score_ms": round((time.perf_counter() - started) * 1000, 3)}
+    result["skills"] = match_skills(resume_text, job_data)
+    return result
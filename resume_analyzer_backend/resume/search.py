@@ -0,0 +1,209 @@
+import math
+import re
+from collections import Counter
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Case, Count, FloatField, Sum, Value, When
+from django.db.models.functions import Cast
+from .scoring import JOB_FIELDS, job_field_texts
+from .skills import required_skill_list, skill_spellings
+
+
+DEFAULT_SEARCH_CONFIG = {
+    "K1": 1.2,
+    "B": 0.75,
+    "CANDIDATES": 500,         # lexical top-K handed to embedding scoring
+    "MAX_CANDIDATES": 5000,
+    "MAX_DF_RATIO": 0.6,       # in large pools, terms in more than this share of resumes are skipped (longest postings)
+    "DF_CUTOFF_MIN_DOCS": 1000,  # below this pool size every term is kept and idf alone down-weights common ones
+    "MAX_QUERY_TERMS": 32,     # skill/title terms first, then the rarest description terms
+    "INDEX_ON_UPLOAD": True,
+}
+
+MAX_TERM_LENGTH = 64
+
+# ✅ Keeps skill spellings such as "c++", "c#", "node.js" and "ci/cd" as single tokens
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with "
+    "we you your our i my me he she they their who which what using used use also etc".split()
+)
+
+
+def get_search_config():
+    config = dict(DEFAULT_SEARCH_CONFIG)
+    config.update(getattr(settings, "RESUME_SEARCH", {}))
+    return config
+
+
+def tokenize(text):
+    """Lower-case index terms of ``text`` (stopwords and trailing punctuation dropped)."""
+    terms = []
+    for token in TOKEN_RE.findall((text or "").lower()):
+        token = token.rstrip("./-")
+        if token and token not in STOPWORDS and len(token) <= MAX_TERM_LENGTH:
+            terms.append(token)
+    return terms
+
+
+def query_terms(job_data):
+    """Distinct terms of every job field, plus the tokens of each required skill's synonyms."""
+    terms = set(primary_query_terms(job_data))
+    for text in job_field_texts(job_data):
+        terms.update(tokenize(text))
+    return sorted(terms)
+
+
+def primary_query_terms(job_data):
+    """Title and required-skill terms (with synonyms); always searched, ahead of description terms."""
+    terms = set(tokenize(job_data.get("job_title") or ""))
+    for skill in required_skill_list(job_data):
+        for spelling in skill_spellings(skill):
+            terms.update(tokenize(spelling))
+    return sorted(terms)
+
+
+def index_resume_texts(rows):
+    """(Re)builds the postings of (resume id, text) pairs. Returns the number of resumes indexed."""
+    from .models import Resume, ResumeTerm
+
+    rows = [(resume_id, text) for resume_id, text in rows]
+    if not rows:
+        return 0
+
+    postings, lengths = [], []
+    for resume_id, text in rows:
+        terms = tokenize(text)
+        postings.extend(ResumeTerm(resume_id=resume_id, term=term, tf=tf) for term, tf in Counter(terms).items())
+        lengths.append(Resume(id=resume_id, term_count=len(terms)))
+
+    with transaction.atomic():
+        ResumeTerm.objects.filter(resume_id__in=[resume_id for resume_id, _ in rows]).delete()
+        ResumeTerm.objects.bulk_create(postings, batch_size=5000)
+        Resume.objects.bulk_update(lengths, ["term_count"], batch_size=1000)
+    return len(rows)
+
+
+def index_on_upload(resume_id, text):
+    """Upload-time hook: indexing problems never fail the upload (the backfill command catches up)."""
+    if not get_search_config()["INDEX_ON_UPLOAD"] or not text or text.startswith("❌"):
+        return
+    try:
+        index_resume_texts([(resume_id, text)])
+    except Exception as e:
+        print(f"⚠️ Search indexing failed for resume {resume_id}: {e}")
+
+
+def backfill_search_index(only_missing=True, batch_size=500):
+    """Indexes stored extracted_text in batches. Returns (scanned, indexed)."""
+    from .models import Resume
+
+    queryset = Resume.objects.exclude(extracted_text__isnull=True).exclude(extracted_text="")
+    if only_missing:
+        queryset = queryset.filter(term_count__isnull=True)
+
+    scanned = indexed = 0
+    batch = []
+    for row in queryset.order_by("id").values_list("id", "extracted_text").iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            indexed += index_resume_texts(batch)
+            scanned += len(batch)
+            batch = []
+    if batch:
+        indexed += index_resume_texts(batch)
+        scanned += len(batch)
+    return scanned, indexed
+
+
+def select_terms(terms, df, n_docs, primary=(), config=None):
+    """The query terms worth reading postings for: indexed ones, primary first, then the rarest, capped."""
+    config = config or get_search_config()
+    kept = [term for term in terms if term in df]
+    if n_docs >= config["DF_CUTOFF_MIN_DOCS"]:
+        rare = [term for term in kept if df[term] <= config["MAX_DF_RATIO"] * n_docs]
+        kept = rare or kept  # a query made only of common terms still ranks by them
+    primary = set(primary)
+    kept.sort(key=lambda term: (term not in primary, df[term], term))
+    return kept[:config["MAX_QUERY_TERMS"]]
+
+
+def bm25_search(terms, top_k=None, config=None, primary=()):
+    """BM25 top-K over the inverted index.
+
+    Returns (resume ids, scores) as numpy arrays, best first. Scoring, grouping and the top-K
+    cut all run in the database over the postings of at most MAX_QUERY_TERMS terms, so only
+    top_k rows come back however many resumes match.
+    """
+    from .models import Resume, ResumeTerm
+
+    config = config or get_search_config()
+    top_k = top_k or config["CANDIDATES"]
+    empty = np.empty(0, dtype=np.int64), np.empty(0)
+
+    stats = Resume.objects.filter(term_count__isnull=False).aggregate(n=Count("id"), avg_length=Avg("term_count"))
+    n_docs, avg_length = stats["n"], stats["avg_length"] or 1.0
+    if not n_docs or not terms:
+        return empty
+
+    df = dict(ResumeTerm.objects.filter(term__in=terms).values("term").annotate(df=Count("id")).values_list("term", "df"))
+    kept = select_terms(terms, df, n_docs, primary, config)
+    if not kept:
+        return empty
+
+    k1, b = config["K1"], config["B"]
+    idf = Case(
+        *[When(term=term, then=Value(math.log(1 + (n_docs - df[term] + 0.5) / (df[term] + 0.5)))) for term in kept],
+        output_field=FloatField(),
+    )
+    tf = Cast("tf", FloatField())
+    length = Cast("resume__term_count", FloatField())
+    contribution = idf * tf * Value(k1 + 1) / (tf + Value(k1 * (1 - b)) + Value(k1 * b / avg_length) * length)
+
+    rows = list(
+        ResumeTerm.objects.filter(term__in=kept)
+        .values("resume_id")
+        .annotate(score=Sum(contribution, output_field=FloatField()))
+        .order_by("-score", "resume_id")
+        .values_list("resume_id", "score")[:top_k]
+    )
+    if not rows:
+        return empty
+    ids, scores = zip(*rows)
+    return np.asarray(ids, dtype=np.int64), np.asarray(scores, dtype=np.float64)
+
+
+def search_candidates(job_data, top_k=None, top_n=20, encoder=None):
+    """Lexical top-K from the inverted index, then embedding scores for those candidates only.
+
+    Returns {"terms", "lexical_candidates", "embedded", "results"} with results ordered by
+    final ATS score. Candidates without a stored vector are embedded first.
+    """
+    from .embeddings import embed_missing_resumes, rescore_pool
+    from .encoder import get_encoder
+    from .models import Resume
+
+    terms = query_terms(job_data)
+    candidate_ids, bm25_scores = bm25_search(terms, top_k, primary=primary_query_terms(job_data))
+    result = {"terms": len(terms), "lexical_candidates": len(candidate_ids), "embedded": 0, "results": []}
+    if not len(candidate_ids):
+        return result
+
+    encoder = encoder or get_encoder()
+    candidate_ids = [int(resume_id) for resume_id in candidate_ids]
+    result["embedded"] = embed_missing_resumes(encoder.model_name, encoder, Resume.objects.filter(id__in=candidate_ids))
+    ids, field_scores, final_scores = rescore_pool(job_data, candidate_ids, encoder)
+
+    bm25 = dict(zip(candidate_ids, bm25_scores))
+    order = np.argsort(-final_scores, kind="stable")[:max(top_n, 0)]
+    result["results"] = [
+        {
+            "resume_id": int(ids[i]),
+            "bm25_score": round(float(bm25[int(ids[i])]), 4),
+            "ats_score": float(final_scores[i]),
+            "scores": {field: float(value) for field, value in zip(JOB_FIELDS, field_scores[i])},
+        }
+        for i in order
+    ]
+    return result
@@ -6,10 +6,35 @@ class ResumeSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Resume
-        fields = ['id', 'resume_file', 'resume_url', 'email', 'phone_number', 'uploaded_at', 'shortlisted', 'ats_score']
+        fields = ['id', 'resume_file', 'resume_url', 'email', 'phone_number', 'uploaded_at', 'shortlisted', 'ats_score', 'parsed_fields']
 
     def get_resume_url(self, obj):
         """Returns the Cloudinary URL of the uploaded resume."""
         if obj.resume_file:
             return obj.resume_file.url  # ✅ Returns Cloudinary URL
         return None  # ✅ Handles cases where no file is uploaded
+
+
+# ✅ Columns the list endpoints read (no extracted_text, no storage lookups)
+RESUME_LIST_FIELDS = ('id', 'resume_file', 'email', 'phone_number', 'uploaded_at', 'shortlisted', 'ats_score')
+
+
+class ResumeListSerializer(serializers.Serializer):
+    """Lean serializer for .values(*RESUME_LIST_FIELDS) rows on the listing endpoints."""
+    id = serializers.IntegerField()
+    resume_file = serializers.CharField()
+    resume_url = serializers.SerializerMethodField()
+    email = serializers.CharField(allow_null=True)
+    phone_number = serializers.CharField(allow_null=True)
+    uploaded_at = serializers.DateTimeField()
+    shortlisted = serializers.BooleanField()
+    ats_score = serializers.FloatField()
+
+    def get_resume_url(self, row):
+        """Uploads store the Cloudinary URL itself as the file name, so no storage call is needed."""
+        name = row['resume_file']
+        if not name:
+            return None
+        if name.startswith(("http://", "https://")):
+            return name
+        return Resume._meta.get_field('resume_file').storage.url(name)
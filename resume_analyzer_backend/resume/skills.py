@@ -0,0 +1,168 @@
+import re
+from collections import deque
+from functools import lru_cache
+
+
+# ✅ Skills recognised in resume text (lower-case canonical names)
+SKILL_VOCABULARY = (
+    "python", "java", "javascript", "typescript", "c++", "c#", "golang", "rust", "kotlin", "swift", "php", "ruby",
+    "scala", "matlab", "sql", "nosql", "html", "css", "bash",
+    "django", "django rest framework", "flask", "fastapi", "spring", "spring boot", "node.js", "express", "react",
+    "angular", "vue", "next.js", "redux", "tailwind", "bootstrap", "jquery", ".net", "laravel", "rails",
+    "postgresql", "mysql", "sqlite", "mongodb", "redis", "elasticsearch", "cassandra", "oracle", "dynamodb",
+    "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible", "jenkins", "git", "github actions",
+    "ci/cd", "linux", "nginx", "celery", "rabbitmq", "kafka", "graphql", "rest api", "microservices",
+    "machine learning", "deep learning", "nlp", "computer vision", "pandas", "numpy", "scikit-learn",
+    "tensorflow", "pytorch", "keras", "spacy", "opencv", "data analysis", "power bi", "tableau", "excel",
+    "agile", "scrum", "jira", "unit testing", "pytest", "selenium", "figma",
+)
+
+# ✅ Alternative spellings, keyed by canonical name; a job asking for any spelling matches all of them.
+# Abbreviations that are also everyday words or headings ("CV", "DL", "node", "ts", "ror") are left
+# out; the few kept ones must match in the case listed in CASE_SENSITIVE_SPELLINGS.
+SKILL_SYNONYMS = {
+    "javascript": ("js", "ecmascript"),
+    "golang": ("go lang", "go"),
+    "c#": ("csharp", "c sharp"),
+    "c++": ("cpp",),
+    "node.js": ("nodejs", "node js"),
+    "react": ("react.js", "reactjs"),
+    "angular": ("angularjs", "angular.js"),
+    "vue": ("vue.js", "vuejs"),
+    "next.js": ("nextjs",),
+    "django rest framework": ("drf", "django-rest-framework"),
+    "postgresql": ("postgres", "psql"),
+    "mongodb": ("mongo",),
+    "elasticsearch": ("elastic search",),
+    "aws": ("amazon web services",),
+    "gcp": ("google cloud", "google cloud platform"),
+    "azure": ("microsoft azure",),
+    "kubernetes": ("k8s",),
+    "ci/cd": ("ci cd", "cicd", "continuous integration"),
+    "rest api": ("rest apis", "restful api", "restful apis", "restful"),
+    "machine learning": ("ml",),
+    "nlp": ("natural language processing",),
+    "scikit-learn": ("sklearn", "scikit learn"),
+    "power bi": ("powerbi",),
+    ".net": ("dotnet", "asp.net"),
+    "rails": ("ruby on rails",),
+    "spring boot": ("springboot",),
+    "unit testing": ("unit tests", "unittest"),
+}
+
+# ✅ Spellings that are also common words: only the exact case below counts ("Go", not "go the extra mile")
+CASE_SENSITIVE_SPELLINGS = {"go": "Go", "ml": "ML", "js": "JS", "r": "R", "c": "C"}
+
+AUTOMATON_CACHE_SIZE = 256
+
+_ALIASES = {alias: canonical for canonical, aliases in SKILL_SYNONYMS.items() for alias in aliases}
+_SKILL_SEPARATORS = re.compile(r"[,;|\n•]+")
+
+
+def canonical_skill(skill):
+    skill = " ".join(skill.lower().split())
+    return _ALIASES.get(skill, skill)
+
+
+def skill_spellings(skill):
+    """Every lower-case spelling that counts as ``skill`` (itself, its canonical name and synonyms)."""
+    canonical = canonical_skill(skill)
+    return {" ".join(skill.lower().split()), canonical, *SKILL_SYNONYMS.get(canonical, ())}
+
+
+def required_skill_list(job_data):
+    """The job's required skills as a de-duplicated list, whether given as a list or a delimited string."""
+    value = job_data.get("required_skills") or []
+    items = _SKILL_SEPARATORS.split(value) if isinstance(value, str) else value
+    skills, seen = [], set()
+    for item in items:
+        item = " ".join(str(item).split())
+        if item and canonical_skill(item) not in seen:
+            seen.add(canonical_skill(item))
+            skills.append(item)
+    return skills
+
+
+class SkillAutomaton:
+    """Aho-Corasick automaton over skill spellings; ``scan`` finds all of them in one pass over the text.
+
+    Matches must sit on word boundaries (so "java" does not match inside "javascript") and
+    CASE_SENSITIVE_SPELLINGS must match in that case. Each pattern reports the index of the job
+    skill it stands for.
+    """
+
+    def __init__(self, skills):
+        self.skills = tuple(skills)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for index, skill in enumerate(self.skills):
+            for spelling in skill_spellings(skill):
+                self._add(spelling, index, CASE_SENSITIVE_SPELLINGS.get(spelling))
+        self._link()
+
+    def _add(self, pattern, index, exact=None):
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), index, exact))
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, text):
+        """Indexes (into ``skills``) of every skill found in ``text``."""
+        original, text = text, text.lower()
+        same_length = len(original) == len(text)  # a few non-ASCII characters change length when lowered
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, index, exact in out[state]:
+                if index in found:
+                    continue
+                start, end = position - length + 1, position + 1
+                if exact and same_length and original[start:end] != exact:
+                    continue
+                if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                    found.add(index)
+            if len(found) == len(self.skills):
+                break
+        return found
+
+
+@lru_cache(maxsize=AUTOMATON_CACHE_SIZE)
+def compile_skill_automaton(skills):
+    """Compiled automaton for a tuple of job skills; repeated jobs in a batch reuse it."""
+    return SkillAutomaton(skills)
+
+
+def match_skills(resume_text, job_data):
+    """{"matched": [...], "missing": [...]} for the job's required skills, in the job's own order and spelling."""
+    skills = tuple(required_skill_list(job_data))
+    if not skills:
+        return {"matched": [], "missing": []}
+    found = compile_skill_automaton(skills).scan(resume_text or "")
+    return {
+        "matched": [skill for index, skill in enumerate(skills) if index in found],
+        "missing": [skill for index, skill in enumerate(skills) if index not in found],
+    }
@@ -0,0 +1,170 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import cloudinary.api  # type: ignore
+import cloudinary.uploader  # type: ignore
+from django.conf import settings
+from .extraction import named_bytes
+
+
+DEFAULT_STORAGE_CONFIG = {
+    "BACKEND": "cloudinary",              # "cloudinary" or "local"
+    "UPLOAD_THREADS": 8,                  # concurrent uploads per process
+    "LOCAL_ROOT": "/tmp/resume_storage",  # local backend only
+    "LOCAL_BASE_URL": "",                 # public URL prefix for local files ("" = file:// URLs)
+    "LOCAL_LATENCY_SECONDS": 0.0,         # injected per-call latency for offline benchmarks
+}
+
+
+def get_storage_config():
+    config = dict(DEFAULT_STORAGE_CONFIG)
+    config.update(getattr(settings, "RESUME_STORAGE", {}))
+    return config
+
+
+class StorageError(Exception):
+    pass
+
+
+def content_key(data):
+    """SHA-256 of the file; stored assets are named by content, never by the uploaded file name."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResumeStorage:
+    """Where uploaded resume files live. ``upload`` returns the public URL of the stored file.
+
+    Files are stored under ``key`` (the content SHA-256 unless given), so two different files
+    called "resume.pdf" never overwrite each other and identical files share one asset.
+    """
+
+    def upload(self, file_name, data, key=None):
+        raise NotImplementedError
+
+    def delete(self, url):
+        raise NotImplementedError
+
+    def delete_many(self, urls):
+        """Deletes several stored files; returns the URLs that could not be deleted."""
+        failed = []
+        for url in urls:
+            try:
+                self.delete(url)
+            except Exception as e:
+                print(f"⚠️ Failed to delete {url}: {e}")
+                failed.append(url)
+        return failed
+
+
+class CloudinaryResumeStorage(ResumeStorage):
+    def upload(self, file_name, data, key=None):
+        # ✅ Upload file to Cloudinary (store as raw file, public_id = content hash)
+        response = cloudinary.uploader.upload(
+            named_bytes(file_name, data),
+            resource_type="raw",  # Ensures Cloudinary treats it as a document
+            folder="resumes/",
+            public_id=key or content_key(data),
+            overwrite=False,  # same id means same bytes; keep the existing asset
+            access_mode="public",
+            format="pdf"  # Explicitly set format to PDF
+        )
+        url = response.get("url")
+        if not url:
+            raise StorageError(f"Failed to upload {file_name} to Cloudinary")
+        return url
+
+    # Admin API limit for delete_resources
+    DELETE_BATCH_SIZE = 100
+
+    def delete(self, url):
+        public_id = cloudinary_public_id(url)
+        if public_id:
+            # ✅ Force immediate deletion using `invalidate=True`
+            cloudinary.uploader.destroy(public_id, resource_type="raw", invalidate=True)
+
+    def delete_many(self, urls):
+        by_public_id = {}
+        for url in urls:
+            public_id = cloudinary_public_id(url)
+            if public_id:
+                by_public_id.setdefault(public_id, []).append(url)
+
+        failed = []
+        public_ids = list(by_public_id)
+        for start in range(0, len(public_ids), self.DELETE_BATCH_SIZE):
+            chunk = public_ids[start:start + self.DELETE_BATCH_SIZE]
+            try:
+                response = cloudinary.api.delete_resources(chunk, resource_type="raw", invalidate=True)
+            except Exception as e:
+                print(f"⚠️ Cloudinary batch delete failed: {e}")
+                failed.extend(url for public_id in chunk for url in by_public_id[public_id])
+                continue
+            outcome = response.get("deleted", {})
+            for public_id in chunk:
+                if outcome.get(public_id) not in ("deleted", "not_found"):
+                    failed.extend(by_public_id[public_id])
+        return failed
+
+
+class LocalResumeStorage(ResumeStorage):
+    """Filesystem stand-in with optional latency injection, for offline tests and benchmarks."""
+
+    def __init__(self, root, base_url="", latency_seconds=0.0):
+        self.root = root
+        self.base_url = base_url
+        self.latency_seconds = latency_seconds
+        os.makedirs(root, exist_ok=True)
+
+    def _path_for(self, url):
+        prefix = self.base_url or "file://"
+        name = url[len(prefix):] if url.startswith(prefix) else url
+        return os.path.join(self.root, os.path.basename(name))
+
+    def upload(self, file_name, data, key=None):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        stored_name = f"{key or content_key(data)}{os.path.splitext(file_name)[1].lower()}"
+        path = os.path.join(self.root, stored_name)
+        with open(path, "wb") as stored:
+            stored.write(data)
+        return f"{self.base_url}{stored_name}" if self.base_url else f"file://{path}"
+
+    def delete(self, url):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        try:
+            os.remove(self._path_for(url))
+        except FileNotFoundError:
+            pass
+
+
+def cloudinary_public_id(url):
+    """``.../resumes/<name>.<ext>`` -> ``resumes/<name>`` (None if the URL has another shape)."""
+    match = re.search(r"resumes/(.*)\..*$", url)
+    return f"resumes/{match.group(1)}" if match else None
+
+
+def get_resume_storage():
+    config = get_storage_config()
+    if config["BACKEND"] == "local":
+        return LocalResumeStorage(config["LOCAL_ROOT"], config["LOCAL_BASE_URL"], config["LOCAL_LATENCY_SECONDS"])
+    return CloudinaryResumeStorage()
+
+
+# ✅ Bounded upload pool so network uploads overlap with text extraction
+_upload_pool = None
+_upload_pool_lock = threading.Lock()
+
+
+def submit_upload(storage, file_name, data, key=None):
+    """Starts an upload in the background and returns its Future (result: the stored URL)."""
+    global _upload_pool
+    with _upload_pool_lock:
+        if _upload_pool is None:
+            _upload_pool = ThreadPoolExecutor(
+                max_workers=get_storage_config()["UPLOAD_THREADS"], thread_name_prefix="resume-storage"
+            )
+    return _upload_pool.submit(storage.upload, file_name, data, key)
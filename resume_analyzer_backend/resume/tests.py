@@ -3,20 +3,31 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
-from resume.models import Resume
+from resume.models import Resume, ExtractionCache, HRSettings, JobProfileEmbedding, PurgeJob, ResumeEmbedding, UploadBatch, UploadTask
+from resume.pipeline import ResumeProcessingError
+from resume.storage import LocalResumeStorage
 from resume.utils import extract_text_from_pdf, extract_text_from_docx
+from resume import batching, chunking, contacts, embeddings, encoder, extraction, fetch, inference, job_cache, ocr, parsing, pipeline, purge, reports, scoring, search, skills, thresholds, upload_queue
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
 from io import BytesIO
+import numpy as np
+from unittest import mock
 from docx import Document
 from PyPDF2 import PdfWriter
 
 # Helper functions to generate valid test files
-def create_dummy_docx():
+def create_dummy_docx(text="Test DOCX Content", name="test_resume.docx"):
     doc = Document()
-    doc.add_paragraph("Test DOCX Content")
+    doc.add_paragraph(text)
     buffer = BytesIO()
     doc.save(buffer)
     buffer.seek(0)
-    return SimpleUploadedFile("test_resume.docx", buffer.read(), content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document")
+    return SimpleUploadedFile(name, buffer.read(), content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document")
 
 def create_dummy_pdf():
     buffer = BytesIO()
@@ -70,3 +81,1029 @@ class ResumeUploadTest(TestCase):
         response = self.client.get(reverse("resume-list"))
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class EncoderRegistryTest(TestCase):
+    def setUp(self):
+        encoder.clear_encoders()
+        self.addCleanup(encoder.clear_encoders)
+
+    def fake_encoder(self, model_name, device, cache_folder):
+        return encoder.LoadedEncoder(model=mock.Mock(), model_name=model_name, device=device,
+                                     load_seconds=0.5, param_bytes=1024, rss_delta_bytes=2048)
+
+    def test_encoder_loaded_once_per_process(self):
+        with mock.patch("resume.encoder._load_encoder", side_effect=self.fake_encoder) as load:
+            first = encoder.get_model()
+            second = encoder.get_model()
+
+        self.assertIs(first, second)
+        self.assertEqual(load.call_count, 1)
+
+    def test_model_name_follows_settings(self):
+        with mock.patch("resume.encoder._load_encoder", side_effect=self.fake_encoder):
+            with self.settings(RESUME_ENCODER={"MODEL_NAME": "all-MiniLM-L6-v2", "DEVICE": "cpu"}):
+                loaded = encoder.warm_up()
+
+        self.assertEqual(loaded.model_name, "all-MiniLM-L6-v2")
+        self.assertTrue(loaded.warmed)
+        self.assertEqual(encoder.encoder_stats()[0]["load_seconds"], 0.5)
+
+
+class ScoringEngineTest(TestCase):
+    job_data = {
+        "job_title": "Backend Engineer",
+        "job_description": "Build Django APIs",
+        "required_skills": ["Python", "Django"],
+        "preferred_qualifications": ["B.Tech"],
+        "responsibilities": ["Design APIs"],
+    }
+
+    def setUp(self):
+        job_cache.clear_job_cache()
+        self.addCleanup(job_cache.clear_job_cache)
+        self.model = mock.Mock()
+        self.model.encode.side_effect = lambda texts, **kwargs: [[1.0, 0.0]] * len(texts)
+        self.encoder = encoder.LoadedEncoder(model=self.model, model_name="test-model", device="cpu",
+                                             load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+
+    def test_score_shape_and_values(self):
+        result = scoring.score_resume("Python developer", self.job_data, self.encoder)
+
+        self.assertEqual(set(result["scores"]), set(scoring.JOB_FIELDS))
+        self.assertEqual(result["scores"]["job_title"], 100.0)
+        self.assertEqual(result["final_ats_score"], 130.0)
+
+    def test_job_fields_encoded_once_per_batch(self):
+        for text in ["resume one", "resume two", "resume three"]:
+            scoring.score_resume(text, self.job_data, self.encoder)
+
+        batch_sizes = [len(call.args[0]) for call in self.model.encode.call_args_list]
+        self.assertEqual(batch_sizes, [5, 1, 1, 1])
+
+    def test_job_profile_served_from_database_tier(self):
+        scoring.score_resume("resume one", self.job_data, self.encoder)
+        job_cache.clear_job_cache()  # simulate a fresh worker
+        self.model.encode.reset_mock()
+
+        scoring.score_resume("resume two", self.job_data, self.encoder)
+
+        self.assertEqual(JobProfileEmbedding.objects.count(), 1)
+        self.assertEqual([len(call.args[0]) for call in self.model.encode.call_args_list], [1])
+
+
+class ResumeEmbeddingStoreTest(TestCase):
+    def setUp(self):
+        job_cache.clear_job_cache()
+        self.addCleanup(job_cache.clear_job_cache)
+        job_matrix = np.eye(5, 8, dtype=np.float32)
+        self.model = mock.Mock()
+        self.model.encode.return_value = job_matrix
+        self.encoder = encoder.LoadedEncoder(model=self.model, model_name="test-model", device="cpu",
+                                             load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+
+    def test_vectorised_final_score_matches_scalar(self):
+        for value in [0, 20, 45, 60, 75, 85, 100]:
+            scores = {field: float(value) for field in scoring.JOB_FIELDS}
+            matrix = np.array([[float(value)] * len(scoring.JOB_FIELDS)])
+            self.assertEqual(scoring.final_ats_scores(matrix)[0], scoring.final_ats_score(scores))
+
+    def test_rescore_pool_uses_stored_vectors(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(3, 8)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        resumes = [Resume.objects.create(resume_file=f"resume_{i}.pdf") for i in range(3)]
+        for resume, vector in zip(resumes, vectors):
+            embeddings.store_resume_embedding(resume, vector, "test-model")
+
+        ids, field_scores, final_scores = embeddings.rescore_pool({"job_title": "Engineer"}, encoder=self.encoder)
+
+        self.assertEqual(list(ids), [resume.id for resume in resumes])
+        self.assertEqual(self.model.encode.call_count, 1)  # job side only, resumes are not re-encoded
+        for vector, final_score in zip(vectors, final_scores):
+            expected = scoring.score_vector(vector, self.model.encode.return_value)
+            self.assertAlmostEqual(final_score, expected["final_ats_score"], delta=0.02)  # float32 rounding
+
+    def test_rescore_endpoint_updates_pool_and_returns_top_n(self):
+        resumes = [Resume.objects.create(resume_file=f"resume_{i}.pdf") for i in range(4)]
+        for i, resume in enumerate(resumes):
+            vector = np.zeros(8, dtype=np.float32)
+            vector[0] = 1.0 - i * 0.25  # first resume matches the job title best
+            embeddings.store_resume_embedding(resume, vector, "test-model")
+
+        with mock.patch("resume.embeddings.get_encoder", return_value=self.encoder):
+            response = APIClient().post(reverse("rescore-resumes"), {
+                "job_data": {"job_title": "Engineer", "ats_threshold": 80},
+                "top_n": 2,
+            }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rescored"], 4)
+        self.assertEqual([c["resume_id"] for c in response.data["top_candidates"]], [resumes[0].id, resumes[1].id])
+        resumes[0].refresh_from_db()
+        self.assertEqual(resumes[0].ats_score, response.data["top_candidates"][0]["ats_score"])
+
+    def test_rescore_endpoint_rejects_malformed_input(self):
+        for payload in (
+            {"job_data": "{not json"},
+            {"job_data": "[1, 2]"},
+            {"job_data": {"job_title": "Engineer"}, "uploaded_after": "yesterday"},
+            {"job_data": {"job_title": "Engineer"}, "resume_ids": ["abc"]},
+        ):
+            response = APIClient().post(reverse("rescore-resumes"), payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
+
+
+class UploadQueueTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.job_data = {"job_title": "Engineer", "ats_threshold": 60}
+        spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spool_dir.cleanup)
+        self.spool_dir = spool_dir.name
+
+    def upload(self, *files):
+        with self.settings(RESUME_UPLOAD_QUEUE={"ASYNC": True, "WORKERS": 0, "SPOOL_DIR": self.spool_dir}):
+            return self.client.post(reverse("resume-upload"), {
+                "resume_file": list(files),
+                "job_data": json.dumps(self.job_data),
+            }, format="multipart")
+
+    def test_upload_returns_batch_id_immediately(self):
+        with mock.patch("resume.upload_queue.process_batch") as process:
+            response = self.upload(create_dummy_pdf(), create_dummy_docx())
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        process.assert_not_called()
+        batch = UploadBatch.objects.get(id=response.data["batch_id"])
+        self.assertEqual(batch.tasks.filter(status=UploadTask.QUEUED).count(), 2)
+
+    def test_batch_status_reports_progress_failures_and_scores(self):
+        response = self.upload(create_dummy_pdf(), create_dummy_docx())
+        resume = Resume.objects.create(resume_file="resume.pdf", ats_score=72.5, shortlisted=True)
+
+        def fake_process(files, job_data, ats_threshold, encoder=None):
+            return [
+                ResumeProcessingError(f"Failed to extract text from {file_obj.name}") if file_obj.name.endswith(".docx")
+                else {"resume_id": resume.id, "ats_score": 72.5, "shortlisted": True}
+                for file_obj in files
+            ]
+
+        with mock.patch("resume.upload_queue.process_batch", side_effect=fake_process) as process:
+            self.assertEqual(upload_queue.drain_queue(), 2)
+
+        process.assert_called_once()  # both files of the batch ran through one process_batch call
+        self.assertEqual([file_obj.name for file_obj in process.call_args.args[0]], ["test_resume.pdf", "test_resume.docx"])
+
+        status_response = self.client.get(response.data["status_url"])
+        self.assertEqual(status_response.data["status"], UploadBatch.COMPLETED)
+        self.assertEqual(status_response.data["counts"]["done"], 1)
+        self.assertEqual(status_response.data["counts"]["failed"], 1)
+        files = {entry["file_name"]: entry for entry in status_response.data["files"]}
+        self.assertEqual(files["test_resume.pdf"]["ats_score"], 72.5)
+        self.assertIn("Failed to extract", files["test_resume.docx"]["error"])
+
+
+    def test_kick_during_final_drain_is_not_lost(self):
+        drains = []
+
+        def drain_then_kick():
+            drains.append(1)
+            if len(drains) == 1:
+                upload_queue.kick_workers()  # task enqueued while this worker's queue looked empty
+            return 0
+
+        with self.settings(RESUME_UPLOAD_QUEUE={"WORKERS": 1}), \
+                mock.patch("resume.upload_queue.drain_queue", side_effect=drain_then_kick), \
+                mock.patch.object(upload_queue, "_active_workers", 1):
+            upload_queue._worker()
+            self.assertEqual(upload_queue._active_workers, 0)
+
+        self.assertEqual(len(drains), 2)
+
+
+class ParallelExtractionTest(TestCase):
+    def test_batch_extracted_in_worker_processes(self):
+        self.addCleanup(extraction._reset_pool)
+        files = [(f"resume_{i}.docx", create_dummy_docx().read()) for i in range(3)] + [("notes.txt", b"plain")]
+
+        with self.settings(RESUME_EXTRACTION={"PROCESSES": 2, "TIMEOUT_SECONDS": 30, "MEMORY_LIMIT_MB": 0}):
+            results = extraction.extract_texts_parallel(files)
+
+        self.assertEqual([r.file_name for r in results], [name for name, _ in files])
+        self.assertTrue(all("Test DOCX Content" in r.text for r in results[:3]))
+        self.assertEqual(results[3].text, "❌ Unsupported file format")
+
+    def test_files_queued_behind_other_callers_not_timed_out(self):
+        extraction._reset_pool()
+        self.addCleanup(extraction._reset_pool)
+
+        def slow_extract(file_obj):
+            time.sleep(0.8)
+            return "text"
+
+        busy = []
+        with self.settings(RESUME_EXTRACTION={"PROCESSES": 1, "TIMEOUT_SECONDS": 1, "MEMORY_LIMIT_MB": 0}), \
+                mock.patch.object(extraction, "HUNG_WORKER_SLACK_SECONDS", 0.2), \
+                mock.patch("resume.utils.extract_text", side_effect=slow_extract):
+            other_caller = threading.Thread(target=lambda: busy.extend(
+                extraction.extract_texts_parallel([(f"busy_{i}.pdf", b"") for i in range(3)])))
+            other_caller.start()
+            time.sleep(0.1)
+            result = extraction.extract_text_isolated("queued.pdf", b"")  # waits ~2.4s, well past 1s + slack
+            other_caller.join()
+
+        self.assertEqual(result.text, "text")
+        self.assertEqual([r.text for r in busy], ["text"] * 3)
+
+    def test_hung_worker_reported_and_pool_replaced(self):
+        extraction._reset_pool()
+        self.addCleanup(extraction._reset_pool)
+
+        with self.settings(RESUME_EXTRACTION={"PROCESSES": 1, "TIMEOUT_SECONDS": 1, "MEMORY_LIMIT_MB": 0}), \
+                mock.patch.object(extraction, "HUNG_WORKER_SLACK_SECONDS", 0.2), \
+                mock.patch("signal.alarm"), \
+                mock.patch("resume.utils.extract_text", side_effect=lambda file_obj: time.sleep(30)):
+            hung_pool = extraction._get_pool(extraction.get_extraction_config())
+            result = extraction.extract_text_isolated("hung.pdf", b"")
+
+        self.assertEqual(result.error, "Extraction worker stopped responding")
+        self.assertIsNot(extraction._pool, hung_pool)
+
+    def test_slow_file_times_out_without_failing_batch(self):
+        def slow_extract(file_obj):
+            if file_obj.name == "scanned.pdf":
+                time.sleep(5)
+            return "text"
+
+        with self.settings(RESUME_EXTRACTION={"PROCESSES": 0, "TIMEOUT_SECONDS": 1, "MEMORY_LIMIT_MB": 0}):
+            with mock.patch("resume.utils.extract_text", side_effect=slow_extract):
+                results = extraction.extract_texts_parallel([("scanned.pdf", b""), ("ok.pdf", b"")])
+
+        self.assertIn("timed out", results[0].error)
+        self.assertEqual(results[1].text, "text")
+
+    def test_timeout_not_swallowed_by_extractor(self):
+        def hang(file_obj):
+            time.sleep(5)
+
+        with self.settings(RESUME_EXTRACTION={"PROCESSES": 0, "TIMEOUT_SECONDS": 1, "MEMORY_LIMIT_MB": 0}):
+            with mock.patch("docx.Document", side_effect=hang):
+                result = extraction.extract_text_isolated("slow.docx", b"PK")
+
+        self.assertIn("timed out", result.error)
+
+    def test_memory_cap_is_headroom_over_inherited_size(self):
+        with mock.patch("resource.setrlimit") as setrlimit:
+            extraction._init_worker(256)
+
+        limit = setrlimit.call_args.args[1][0]
+        self.assertGreaterEqual(limit, extraction._address_space_bytes() + 200 * 1024 * 1024)
+
+    def test_failed_extraction_not_saved_as_resume(self):
+        storage_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(storage_dir.cleanup)
+
+        with self.settings(RESUME_EXTRACTION={"PROCESSES": 0},
+                           RESUME_STORAGE={"BACKEND": "local", "LOCAL_ROOT": storage_dir.name}):
+            result = pipeline.process_batch([SimpleUploadedFile("broken.docx", b"not a zip")], {"job_title": "Engineer"}, 60,
+                                            encoder=mock.Mock())[0]
+
+        self.assertIsInstance(result, ResumeProcessingError)
+        self.assertFalse(Resume.objects.exists())
+
+
+class PageParallelOCRTest(TestCase):
+    def test_pages_rasterised_individually_and_stop_early(self):
+        def fake_convert(data, dpi, first_page, last_page, grayscale, poppler_path):
+            self.assertEqual(first_page, last_page)
+            image = mock.Mock()
+            image.page = first_page
+            return [image]
+
+        with mock.patch("resume.ocr.pdfinfo_from_bytes", return_value={"Pages": 10}), \
+                mock.patch("resume.ocr.convert_from_bytes", side_effect=fake_convert) as convert, \
+                mock.patch("resume.ocr.image_to_string", side_effect=lambda image: f"page {image.page} " * 50):
+            result = ocr.ocr_pdf_bytes(b"%PDF", threads=2, max_pages=6, min_chars=600, dpi=150)
+
+        self.assertEqual([page.page for page in result.pages], [1, 2])
+        self.assertTrue(result.stopped_early)
+        self.assertEqual(result.total_pages, 10)
+        self.assertEqual(convert.call_args.kwargs["dpi"], 150)
+        self.assertTrue(result.text.startswith("page 1"))
+
+    def test_failing_page_does_not_wait_for_pages_still_running(self):
+        page_two_running = threading.Event()
+
+        def fake_convert(data, dpi, first_page, last_page, grayscale, poppler_path):
+            if first_page == 1:
+                page_two_running.wait(1)
+                raise RuntimeError("poppler crashed")
+            page_two_running.set()
+            time.sleep(2)
+            return []
+
+        started = time.perf_counter()
+        with mock.patch("resume.ocr.pdfinfo_from_bytes", return_value={"Pages": 2}), \
+                mock.patch("resume.ocr.convert_from_bytes", side_effect=fake_convert):
+            with self.assertRaises(RuntimeError):
+                ocr.ocr_pdf_bytes(b"%PDF", threads=2, max_pages=2, min_chars=0, dpi=150)
+
+        self.assertLess(time.perf_counter() - started, 1.5)
+
+
+class DuplicateResumeTest(TestCase):
+    def setUp(self):
+        job_cache.clear_job_cache()
+        self.addCleanup(job_cache.clear_job_cache)
+        self.model = mock.Mock()
+        self.model.encode.side_effect = lambda texts, **kwargs: np.ones((len(texts), 4), dtype=np.float32) / 2
+        self.encoder = encoder.LoadedEncoder(model=self.model, model_name="test-model", device="cpu",
+                                             load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+        storage_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(storage_dir.cleanup)
+        self.storage_dir = storage_dir.name
+
+    def local_storage(self, latency=0.0):
+        return self.settings(
+            RESUME_EXTRACTION={"PROCESSES": 0},
+            RESUME_STORAGE={"BACKEND": "local", "LOCAL_ROOT": self.storage_dir, "LOCAL_LATENCY_SECONDS": latency},
+        )
+
+    def test_uploads_overlap_with_each_other_and_extraction(self):
+        files = [create_dummy_docx(f"Candidate {i} Python developer", f"resume_{i}.docx") for i in range(4)]
+
+        started = time.perf_counter()
+        with self.local_storage(latency=0.3):
+            results = pipeline.process_batch(files, {"job_title": "Engineer"}, 60, self.encoder)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len([r for r in results if isinstance(r, dict)]), 4)
+        self.assertTrue(all(r["resume_url"].startswith("file://") for r in results))
+        self.assertFalse(any(r["duplicate"] for r in results))
+        texts = Resume.objects.with_text().order_by("id").values_list("extracted_text", flat=True)
+        self.assertEqual(list(texts), [f"Candidate {i} Python developer" for i in range(4)])
+        self.assertLess(elapsed, 4 * 0.3)
+
+    def test_reupload_skips_upload_and_extraction(self):
+        content = create_dummy_docx().read()  # one payload: docx metadata embeds a timestamp
+        with self.local_storage(), mock.patch.object(LocalResumeStorage, "upload", autospec=True,
+                                                     side_effect=LocalResumeStorage.upload) as storage_upload:
+            first = pipeline.process_resume_file(SimpleUploadedFile("a.docx", content), {"job_title": "Engineer"}, 60, self.encoder)
+            second = pipeline.process_resume_file(SimpleUploadedFile("b.docx", content), {"job_title": "Engineer"}, 60, self.encoder)
+
+        self.assertEqual(storage_upload.call_count, 1)
+        self.assertFalse(first["duplicate"])
+        self.assertTrue(second["duplicate"])
+        self.assertEqual(second["resume_url"], first["resume_url"])
+        self.assertEqual(ExtractionCache.objects.count(), 1)
+        hashes = set(Resume.objects.values_list("content_hash", flat=True))
+        self.assertEqual(len(hashes), 1)
+
+    def test_same_name_different_content_stored_separately(self):
+        storage = LocalResumeStorage(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, storage.root, True)
+
+        first = storage.upload("resume.pdf", b"%PDF one")
+        second = storage.upload("resume.pdf", b"%PDF two")
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(storage.upload("other.pdf", b"%PDF one"), first)
+
+    def test_identical_files_in_one_batch_upload_once(self):
+        content = create_dummy_docx().read()
+        with self.local_storage(), mock.patch.object(LocalResumeStorage, "upload", autospec=True,
+                                                     side_effect=LocalResumeStorage.upload) as storage_upload:
+            results = pipeline.process_batch(
+                [SimpleUploadedFile("a.docx", content), SimpleUploadedFile("b.docx", content)],
+                {"job_title": "Engineer"}, 60, self.encoder,
+            )
+
+        self.assertEqual(storage_upload.call_count, 1)
+        self.assertEqual([r["duplicate"] for r in results], [False, True])
+        self.assertEqual(results[0]["resume_url"], results[1]["resume_url"])
+
+    def test_analyze_uses_stored_text_without_downloading(self):
+        resume = Resume.objects.create(resume_file="https://res.cloudinary.com/demo/raw/upload/resumes/cv.pdf",
+                                       extracted_text="Python developer")
+
+        with mock.patch("resume.views.get_encoder", return_value=self.encoder), \
+                mock.patch("resume.pipeline.fetch_resume_bytes") as fetch_bytes:
+            response = APIClient().post(reverse("analyze-resume"), {
+                "resume_id": resume.id, "job_data": {"job_title": "Engineer"},
+            }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        fetch_bytes.assert_not_called()
+        self.assertTrue(resume.embeddings.filter(model_name="test-model").exists())
+
+
+class ResumeFetchTest(TestCase):
+    def test_repeat_fetch_served_from_disk_cache(self):
+        response = mock.MagicMock(status_code=200)
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"%PDF-", b"1.4"]
+        session = mock.Mock()
+        session.get.return_value = response
+
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+
+        with self.settings(RESUME_FETCH={"CACHE_DIR": cache_dir.name}), \
+                mock.patch("resume.fetch.get_session", return_value=session):
+            first = fetch.fetch_resume_bytes("https://example.com/cv.pdf")
+            second = fetch.fetch_resume_bytes("https://example.com/cv.pdf")
+
+        self.assertEqual(first, b"%PDF-1.4")
+        self.assertEqual(second, first)
+        self.assertEqual(session.get.call_count, 1)
+        self.assertTrue(session.get.call_args.kwargs["stream"])
+
+
+class BulkPurgeTest(TestCase):
+    def setUp(self):
+        storage_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(storage_dir.cleanup)
+        self.storage = LocalResumeStorage(storage_dir.name)
+        self.urls = [self.storage.upload(f"cv_{i}.pdf", f"%PDF {i}".encode()) for i in range(5)]
+        for url in self.urls:
+            Resume.objects.create(resume_file=url)
+
+    def test_purge_is_resumable_after_a_crash(self):
+        calls = []
+
+        def flaky_delete_many(urls):
+            calls.append(urls)
+            if len(calls) == 2:
+                raise RuntimeError("worker killed")
+            return LocalResumeStorage.delete_many(self.storage, urls)
+
+        job, should_run = purge.start_or_resume_purge()
+        self.assertTrue(should_run)
+        with mock.patch("resume.purge.get_resume_storage", return_value=self.storage), \
+                mock.patch.object(self.storage, "delete_many", side_effect=flaky_delete_many):
+            with self.assertRaises(RuntimeError):
+                purge.run_purge(job, batch_size=2, workers=1)
+
+            job, should_run = purge.start_or_resume_purge()
+            self.assertEqual(Resume.objects.count(), 3)
+            self.assertEqual(job.last_resume_id, Resume.objects.order_by("id").first().id - 1)
+            self.assertFalse(should_run)  # still fresh, another worker may own it
+
+            purge.run_purge(job, batch_size=2, workers=1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, PurgeJob.COMPLETED)
+        self.assertEqual(job.deleted_rows, 5)
+        self.assertEqual(Resume.objects.count(), 0)
+        self.assertFalse(any(os.path.exists(url[len("file://"):]) for url in self.urls))
+
+    def test_purge_keeps_files_reused_by_newer_uploads(self):
+        job, _ = purge.start_or_resume_purge()
+        ExtractionCache.objects.create(content_hash="a" * 64, extractor_version="1", resume_url=self.urls[0],
+                                       extracted_text="text")
+        newer = Resume.objects.create(resume_file=self.urls[0])  # re-upload of cv_0 after the snapshot
+
+        with mock.patch("resume.purge.get_resume_storage", return_value=self.storage):
+            purge.run_purge(job, batch_size=2, workers=2)
+
+        self.assertEqual(list(Resume.objects.values_list("id", flat=True)), [newer.id])
+        self.assertTrue(os.path.exists(self.urls[0][len("file://"):]))
+        self.assertTrue(ExtractionCache.objects.filter(resume_url=self.urls[0]).exists())
+        self.assertFalse(any(os.path.exists(url[len("file://"):]) for url in self.urls[1:]))
+
+
+class ReportExportTest(TestCase):
+    def setUp(self):
+        Resume.objects.create(resume_file="https://example.com/a.pdf", email="a@example.com", ats_score=82.5, shortlisted=True)
+        Resume.objects.create(resume_file="https://example.com/b.pdf", ats_score=41.0, shortlisted=False)
+
+    def test_excel_report_served_from_file(self):
+        response = self.client.get(reverse("generate-excel-report"), {"filter": "shortlisted"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('filename="resumes.xlsx"', response["Content-Disposition"])
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"PK"))
+
+    def test_csv_report_streams_rows(self):
+        response = self.client.get(reverse("generate-csv-report"))
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "Resume File,Email,Phone Number,ATS Score (%),Shortlisted")
+        self.assertEqual(lines[1], "https://example.com/a.pdf,a@example.com,,82.50,Yes")
+        self.assertEqual(len(lines), 3)
+
+    def test_pdf_report_cached_until_resume_set_changes(self):
+        with tempfile.TemporaryDirectory() as cache_dir, self.settings(RESUME_REPORTS={"CACHE_DIR": cache_dir, "PDF_ROWS_PER_TABLE": 1}):
+            with mock.patch.object(reports, "write_pdf_report", wraps=reports.write_pdf_report) as render:
+                first = self.client.get(reverse("generate-pdf-report"))
+                self.assertTrue(b"".join(first.streaming_content).startswith(b"%PDF"))
+                self.client.get(reverse("generate-pdf-report"))
+                self.assertEqual(render.call_count, 1)
+
+                Resume.objects.filter(shortlisted=False).update(ats_score=55.0)
+                self.client.get(reverse("generate-pdf-report"))
+                self.assertEqual(render.call_count, 2)
+
+                Resume.objects.bulk_update([Resume(id=Resume.objects.get(shortlisted=False).id, phone_number="+919876543210")],
+                                           ["phone_number"])  # contact backfills edit reported columns
+                self.client.get(reverse("generate-pdf-report"))
+                self.assertEqual(render.call_count, 3)
+
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_pdf_tables_generated_as_layout_reaches_them(self):
+        produced = []
+
+        def tables():
+            for i in range(3):
+                produced.append(i)
+                yield i
+
+        stream = reports._FlowableStream(tables())
+        self.assertEqual(len(stream), 1)
+        self.assertEqual(produced, [0])
+        del stream[0]
+        self.assertEqual((len(stream), produced), (1, [0, 1]))
+
+
+class KeysetListingTest(TestCase):
+    def setUp(self):
+        for score in (90.0, 75.0, 75.0, 60.0, 20.0):
+            Resume.objects.create(resume_file=f"https://example.com/{score}.pdf", ats_score=score)
+
+    def test_pages_follow_cursor_without_gaps_or_repeats(self):
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = self.client.get(reverse("get-resumes"), params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(row["id"] for row in response.json())
+            if "X-Next-Cursor" not in response:
+                break
+            self.assertIn('rel="next"', response["Link"])
+            params = {"limit": 2, "cursor": response["X-Next-Cursor"]}
+
+        expected = list(Resume.objects.order_by("-ats_score", "-id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_list_row_uses_stored_url(self):
+        row = self.client.get(reverse("get-resumes"), {"limit": 1}).json()[0]
+        self.assertEqual(row["resume_url"], "https://example.com/90.0.pdf")
+        self.assertNotIn("extracted_text", row)
+
+    def test_unpaged_request_returns_every_row(self):
+        with self.settings(RESUME_LISTING={"PAGE_SIZE": 2}):
+            response = self.client.get(reverse("get-resumes"))
+            listing = self.client.get(reverse("resume-list")).json()
+
+        self.assertEqual(len(response.json()), 5)
+        self.assertNotIn("X-Next-Cursor", response)
+        self.assertEqual((len(listing["resumes"]), listing["next_cursor"]), (5, None))
+
+    def test_invalid_cursor_rejected(self):
+        response = self.client.get(reverse("get-resumes"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ThresholdMaterializationTest(TestCase):
+    def setUp(self):
+        thresholds.invalidate_ats_threshold()
+        self.high = Resume.objects.create(resume_file="https://example.com/high.pdf", ats_score=80.0, shortlisted=False)
+        self.low = Resume.objects.create(resume_file="https://example.com/low.pdf", ats_score=40.0, shortlisted=True)
+
+    def test_set_threshold_reshortlists_all_resumes(self):
+        response = APIClient().post(reverse("set-ats-threshold"), {"threshold": 50}, format="json")
+
+        self.assertEqual(response.json()["shortlisted_count"], 1)
+        self.high.refresh_from_db()
+        self.low.refresh_from_db()
+        self.assertTrue(self.high.shortlisted)
+        self.assertFalse(self.low.shortlisted)
+
+        shortlisted = self.client.get(reverse("shortlisted-candidates"))
+        self.assertEqual([row["id"] for row in shortlisted.json()], [self.high.id])
+        self.assertEqual(shortlisted["X-ATS-Threshold"], "50.0")
+
+    def test_scoring_paths_store_shortlist_against_hr_threshold(self):
+        thresholds.apply_ats_threshold(1000)  # nobody passes the HR threshold (range bonuses lift scores past 100)
+        resume = Resume.objects.create(resume_file="https://example.com/cv.pdf", extracted_text="Python developer")
+        model = mock.Mock()
+        model.encode.side_effect = lambda texts, **kwargs: np.ones((len(texts), 4), dtype=np.float32) / 2
+        loaded = encoder.LoadedEncoder(model=model, model_name="test-model", device="cpu",
+                                       load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+        job_cache.clear_job_cache()
+        self.addCleanup(job_cache.clear_job_cache)
+
+        with mock.patch("resume.views.get_encoder", return_value=loaded):
+            response = APIClient().post(reverse("analyze-resume"), {
+                "resume_id": resume.id, "job_data": {"job_title": "Engineer", "ats_threshold": 0},
+            }, format="json")
+        result = embeddings.rerank_pool({"job_title": "Engineer"}, Resume.objects.all(), 0, encoder=loaded)
+
+        self.assertTrue(response.data["shortlisted"])  # the job's own threshold, for this response only
+        self.assertTrue(all(candidate["shortlisted"] for candidate in result["top_candidates"]))
+        self.assertFalse(Resume.objects.filter(shortlisted=True).exists())
+
+    def test_threshold_cached_until_invalidated(self):
+        self.assertEqual(thresholds.get_ats_threshold(), 60)
+        HRSettings.objects.create(id=1, ats_threshold=70.0)
+        with self.assertNumQueries(0):
+            self.assertEqual(thresholds.get_ats_threshold(), 60)
+
+        thresholds.apply_ats_threshold(75)
+        self.assertEqual(thresholds.get_ats_threshold(), 75.0)
+
+    def test_stored_flag_ignores_stale_cached_threshold(self):
+        resume = Resume.objects.create(resume_file="resume.pdf", ats_score=80.0)
+        thresholds.materialize_shortlisted(Resume.objects.filter(id=resume.id))
+        resume.refresh_from_db()
+        self.assertTrue(resume.shortlisted)  # default threshold 60 with no HR settings row
+
+        self.assertEqual(thresholds.get_ats_threshold(), 60)  # cached in this process
+        HRSettings.objects.create(id=1, ats_threshold=90.0)  # changed by another worker process
+        thresholds.materialize_shortlisted(Resume.objects.filter(id=resume.id))
+        resume.refresh_from_db()
+        self.assertFalse(resume.shortlisted)
+
+
+class DeferredTextTest(TestCase):
+    def setUp(self):
+        self.resume = Resume.objects.create(resume_file="https://example.com/a.pdf", extracted_text="x" * 50000)
+
+    def test_extracted_text_deferred_by_default(self):
+        resume = Resume.objects.get(id=self.resume.id)
+        self.assertIn("extracted_text", resume.get_deferred_fields())
+        self.assertNotIn("extracted_text", Resume.objects.with_text().get(id=self.resume.id).get_deferred_fields())
+
+        with self.assertNumQueries(1):
+            self.assertEqual(len(resume.extracted_text), 50000)
+
+
+class HealthCheckTest(TestCase):
+    def test_health_reports_database(self):
+        response = self.client.get(reverse("health"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["database"], "ok")
+
+
+class InferenceServerTest(TestCase):
+    def setUp(self):
+        self.socket_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.socket_dir.cleanup)
+        self.socket_path = os.path.join(self.socket_dir.name, "encoder.sock")
+
+        def slow_encode(texts, **kwargs):
+            time.sleep(0.05)
+            return [[float(len(text)), 0.0] for text in texts]
+
+        self.model = mock.Mock()
+        self.model.encode.side_effect = slow_encode
+        self.server = inference.InferenceServer(self.socket_path, self.model, "test-model")
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def test_remote_encode_matches_local(self):
+        remote = inference.RemoteEncoderModel(self.socket_path)
+
+        self.assertEqual(remote.info()["model_name"], "test-model")
+        np.testing.assert_allclose(remote.encode(["abc", "a"]), [[3.0, 0.0], [1.0, 0.0]])
+
+    def test_concurrent_requests_share_batches(self):
+        remote = inference.RemoteEncoderModel(self.socket_path)
+        threads = [threading.Thread(target=remote.encode, args=([f"text {i}"],)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(self.model.encode.call_count, 8)
+
+    def test_worker_encoder_uses_server(self):
+        encoder.clear_encoders()
+        self.addCleanup(encoder.clear_encoders)
+        with self.settings(RESUME_ENCODER={"MODEL_NAME": "test-model", "SERVER_SOCKET": self.socket_path}):
+            loaded = encoder.get_encoder()
+
+        self.assertEqual(loaded.device, "remote")
+        self.assertEqual(loaded.param_bytes, 0)
+        self.assertEqual(scoring.encode_texts(loaded.model, ["abcd"]).shape, (1, 2))
+
+
+class MicroBatcherTest(TestCase):
+    def test_concurrent_calls_merge_into_one_batch(self):
+        calls = []
+
+        def double(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = batching.MicroBatcher(double, max_batch_size=16, max_wait_ms=100)
+        self.addCleanup(batcher.close)
+        futures = [batcher.submit([i, i + 10]) for i in range(4)]
+
+        self.assertEqual([future.result(timeout=2) for future in futures], [[0, 20], [2, 22], [4, 24], [6, 26]])
+        self.assertEqual(len(calls), 1)
+        metrics = batcher.metrics()
+        self.assertEqual(metrics["batches"], 1)
+        self.assertEqual(metrics["avg_batch_size"], 8)
+        self.assertEqual(metrics["queue_depth"], 0)
+
+    def test_batch_size_cap_and_errors_reach_callers(self):
+        batcher = batching.MicroBatcher(lambda items: 1 / 0, max_batch_size=1, max_wait_ms=50)
+        self.addCleanup(batcher.close)
+
+        with self.assertRaises(ZeroDivisionError):
+            batcher.run(["a"])
+        self.assertEqual(batcher.metrics()["errors"], 1)
+
+    def test_encoder_wraps_local_model(self):
+        model = mock.Mock()
+        model.encode.side_effect = lambda texts, **kwargs: [[1.0, 0.0]] * len(texts)
+        loaded = encoder.LoadedEncoder(model=model, model_name="test-model", device="cpu",
+                                       load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+        encoder.clear_encoders()
+        self.addCleanup(encoder.clear_encoders)
+
+        with mock.patch("resume.encoder._load_encoder", return_value=loaded):
+            wrapped = encoder.get_encoder()
+        scoring.encode_texts(wrapped.model, ["Python"])
+
+        self.assertIsInstance(wrapped.model, batching.BatchingModel)
+        self.assertEqual(wrapped.stats()["batching"]["requests"], 1)
+
+
+class ContactExtractionTest(TestCase):
+    def test_phone_numbers_normalised_to_e164(self):
+        self.assertEqual(contacts.normalize_phone("098765 43210", "91"), "+919876543210")
+        self.assertEqual(contacts.normalize_phone("+1 (415) 555-2671", "91"), "+14155552671")
+        self.assertEqual(contacts.normalize_phone("0044 20 7946 0958", "91"), "+442079460958")
+        self.assertIsNone(contacts.normalize_phone("2019 - 2023", "91"))
+
+    def test_multiple_candidates_header_first(self):
+        text = "Jane Doe\nJane.Doe@Example.COM, jd@work.io\nPhone: (+91) 98765-43210\n" + "Worked 2015 - 2019. " * 500
+        found = contacts.extract_contacts(text)
+
+        self.assertEqual(found.emails, ["Jane.Doe@example.com", "jd@work.io"])
+        self.assertEqual(found.phones, ["+919876543210"])
+        self.assertEqual(contacts.extract_email_and_phone(""), (None, None))
+
+    def test_missing_kind_searched_below_header(self):
+        text = "a@b.co\n" + "x" * 5000 + "\nCall 9876543210"
+        self.assertEqual(contacts.extract_email_and_phone(text), ("a@b.co", "+919876543210"))
+
+    def test_backfill_fills_missing_contacts(self):
+        resume = Resume.objects.create(resume_file="https://example.com/a.pdf", extracted_text="me@x.org 9876543210")
+        Resume.objects.create(resume_file="https://example.com/b.pdf", email="kept@x.org", phone_number="+910000000000",
+                              extracted_text="other@x.org")
+
+        self.assertEqual(contacts.backfill_contacts(batch_size=1), (1, 1))
+        resume.refresh_from_db()
+        self.assertEqual((resume.email, resume.phone_number), ("me@x.org", "+919876543210"))
+
+
+class StructuredParsingTest(TestCase):
+    text = (
+        "Priya Sharma\nSoftware Engineer at Infosys since March 2020.\n"
+        "Skills: Python, Django REST Framework, PostgreSQL and Docker.\n"
+        "B.Tech in Computer Science, Anna University, 2019."
+    )
+
+    def setUp(self):
+        import spacy
+
+        nlp = spacy.blank("en")
+        nlp.add_pipe("entity_ruler").add_patterns([
+            {"label": "PERSON", "pattern": "Priya Sharma"},
+            {"label": "ORG", "pattern": "Infosys"},
+            {"label": "ORG", "pattern": "Anna University"},
+            {"label": "DATE", "pattern": "March 2020"},
+        ])
+        parsing.set_nlp(nlp)
+        self.addCleanup(parsing.set_nlp, None)
+
+    def test_fields_extracted(self):
+        fields = parsing.parse_resume_text(self.text)
+
+        self.assertEqual(fields["name"], "Priya Sharma")
+        self.assertEqual(fields["skills"], ["python", "django rest framework", "postgresql", "docker"])
+        self.assertEqual(fields["organizations"], ["Infosys", "Anna University"])
+        self.assertEqual(fields["dates"], ["March 2020"])
+        self.assertEqual(fields["education"], {"degrees": ["B.Tech"], "institutions": ["Anna University"]})
+
+    def test_backfill_parses_unparsed_rows_only(self):
+        pending = Resume.objects.create(resume_file="https://example.com/a.pdf", extracted_text=self.text)
+        Resume.objects.create(resume_file="https://example.com/b.pdf", extracted_text=self.text, parsed_fields={"version": "0"})
+        Resume.objects.create(resume_file="https://example.com/c.pdf")
+
+        self.assertEqual(parsing.backfill_parsed_fields(batch_size=1), (1, 1))
+        pending.refresh_from_db()
+        self.assertEqual(pending.parsed_fields["name"], "Priya Sharma")
+
+    def test_backfill_uses_one_pipe_call(self):
+        for i in range(5):
+            Resume.objects.create(resume_file=f"https://example.com/{i}.pdf", extracted_text=self.text)
+        nlp = parsing.get_nlp()
+
+        with mock.patch.object(nlp, "pipe", wraps=nlp.pipe) as pipe:
+            self.assertEqual(parsing.backfill_parsed_fields(batch_size=1), (5, 5))
+
+        self.assertEqual(pipe.call_count, 1)
+
+
+
+class ChunkedScoringTest(TestCase):
+    def setUp(self):
+        self.config = {**chunking.DEFAULT_CHUNKING_CONFIG, "CHUNK_WORDS": 10, "OVERLAP_WORDS": 2, "MAX_CHUNKS": 4}
+
+    def test_long_sections_share_the_chunk_budget(self):
+        text = "Experience\n" + " ".join(f"job{i}" for i in range(200)) + "\nSkills\npython django docker\n"
+
+        chunked = chunking.chunk_text(text, self.config)
+
+        self.assertEqual(len(chunked.chunks), 4)
+        self.assertGreater(chunked.total_chunks, 4)
+        self.assertEqual(chunked.sections, 2)
+        self.assertEqual(chunked.chunks[-1], "Skills: python django docker")
+        self.assertTrue(all(chunk.startswith("Experience: ") for chunk in chunked.chunks[:-1]))
+
+    def test_aggregations_per_resume(self):
+        similarities = np.array([[0.2, 0.9], [0.6, 0.1], [0.4, 0.3], [0.5, 0.5]])
+        counts = [3, 1]
+
+        np.testing.assert_allclose(scoring.aggregate_chunk_groups(similarities, counts, "max"), [[0.6, 0.9], [0.5, 0.5]])
+        np.testing.assert_allclose(scoring.aggregate_chunk_groups(similarities, counts, "mean"), [[0.4, 13 / 30], [0.5, 0.5]])
+        np.testing.assert_allclose(scoring.aggregate_chunk_groups(similarities, counts, "topk", 2), [[0.5, 0.6], [0.5, 0.5]])
+
+    def test_chunk_matrices_round_trip_through_rescore(self):
+        job_matrix = np.eye(5, 8, dtype=np.float32)
+        model = mock.Mock()
+        model.encode.return_value = job_matrix
+        loaded = encoder.LoadedEncoder(model=model, model_name="test-model", device="cpu",
+                                       load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+        chunked = np.zeros((3, 8), dtype=np.float32)
+        chunked[[0, 1, 2], [0, 1, 2]] = [0.9, 0.7, 0.5]  # each chunk matches a different job field
+        single = np.zeros(8, dtype=np.float32)
+        single[0] = 0.4
+        resumes = [Resume.objects.create(resume_file=f"resume_{i}.pdf") for i in range(2)]
+        embeddings.store_resume_embedding(resumes[0], chunked, "test-model")
+        embeddings.store_resume_embedding(resumes[1], single, "test-model")
+
+        self.assertEqual(embeddings.get_resume_vector(resumes[0], "test-model").shape, (3, 8))
+        with self.settings(RESUME_CHUNKING={"AGGREGATION": "max"}):
+            ids, field_scores, final_scores = embeddings.rescore_pool({"job_title": "Engineer"}, encoder=loaded)
+
+        self.assertEqual(list(ids), [resume.id for resume in resumes])
+        np.testing.assert_allclose(field_scores[0][:3], [90.0, 70.0, 50.0])
+        np.testing.assert_allclose(field_scores[1][:3], [40.0, 0.0, 0.0])
+        with self.settings(RESUME_CHUNKING={"AGGREGATION": "max"}):
+            expected = scoring.score_vector(chunked, job_matrix)
+        self.assertAlmostEqual(final_scores[0], expected["final_ats_score"], delta=0.02)
+
+
+    def test_pre_chunking_vectors_are_re_embedded(self):
+        model = mock.Mock()
+        model.encode.side_effect = lambda texts, **kwargs: np.ones((len(texts), 4), dtype=np.float32) / 2
+        loaded = encoder.LoadedEncoder(model=model, model_name="test-model", device="cpu",
+                                       load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+        text = "Experience\n" + " ".join(f"job{i}" for i in range(60)) + "\nSkills\npython django"
+        resume = Resume.objects.create(resume_file="https://example.com/cv.pdf", extracted_text=text)
+        ResumeEmbedding.objects.create(resume=resume, model_name="test-model", dimensions=4,
+                                       vector=embeddings.vector_to_bytes(np.ones(4) / 2))  # truncated, chunking=""
+
+        self.assertIsNone(embeddings.get_resume_vector(resume, "test-model"))
+        with self.settings(RESUME_CHUNKING=self.config):
+            self.assertEqual(embeddings.embed_missing_resumes("test-model", loaded, Resume.objects.all()), 1)
+            self.assertEqual(embeddings.get_resume_vector(resume, "test-model").shape, (4, 4))
+            self.assertEqual(embeddings.embed_missing_resumes("test-model", loaded, Resume.objects.all()), 0)
+
+    def test_pool_scoring_skips_vectors_the_backfill_could_not_replace(self):
+        current = Resume.objects.create(resume_file="https://example.com/a.pdf")
+        no_text = Resume.objects.create(resume_file="https://example.com/b.pdf")  # NULL text, never re-embedded
+        embeddings.store_resume_embedding(current, np.ones((2, 4)) / 2, "test-model")
+        ResumeEmbedding.objects.create(resume=no_text, model_name="test-model", dimensions=4,
+                                       vector=embeddings.vector_to_bytes(np.ones(4) / 2))  # truncated, chunking=""
+
+        ids, matrix, counts = embeddings.load_embedding_matrix("test-model")
+
+        self.assertEqual(ids.tolist(), [current.id])
+        self.assertEqual(counts.tolist(), [2])
+
+
+class SkillMatchTest(TestCase):
+    def setUp(self):
+        skills.compile_skill_automaton.cache_clear()
+
+    def test_exact_and_synonym_matches_on_word_boundaries(self):
+        job_data = {"required_skills": "Kubernetes, PostgreSQL, Java, C++, React; Terraform"}
+        text = "Deployed services on K8s with Postgres.\nWrote JavaScript (React.js) and some C++."
+
+        result = skills.match_skills(text, job_data)
+
+        self.assertEqual(result["matched"], ["Kubernetes", "PostgreSQL", "C++", "React"])
+        self.assertEqual(result["missing"], ["Java", "Terraform"])  # "java" inside "javascript" is not a match
+
+    def test_everyday_words_and_abbreviations_do_not_match(self):
+        job_data = {"required_skills": ["Computer Vision", "Deep Learning", "Node.js", "Go", "Machine Learning"]}
+        text = "Curriculum Vitae (CV)\nDL no. KA0120190001234\nNode of a team of five, ready to go the extra mile. ml"
+
+        self.assertEqual(skills.match_skills(text, job_data)["matched"], [])
+        self.assertEqual(skills.match_skills("Services in Go and ML pipelines", job_data)["matched"], ["Go", "Machine Learning"])
+
+    def test_automaton_reused_for_same_skill_list(self):
+        job_data = {"required_skills": ["Python", "Docker"]}
+        for text in ["python developer", "docker and python", "go"]:
+            skills.match_skills(text, job_data)
+
+        info = skills.compile_skill_automaton.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    def test_score_resume_reports_skills(self):
+        model = mock.Mock()
+        model.encode.side_effect = lambda texts, **kwargs: np.eye(len(texts), 8, dtype=np.float32)
+        loaded = encoder.LoadedEncoder(model=model, model_name="test-model", device="cpu",
+                                       load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+        job_cache.clear_job_cache()
+        self.addCleanup(job_cache.clear_job_cache)
+
+        result = scoring.score_resume("Python and Django", {"job_title": "Dev", "required_skills": ["Django", "AWS"]}, loaded)
+
+        self.assertEqual(result["skills"], {"matched": ["Django"], "missing": ["AWS"]})
+
+
+class SearchIndexTest(TestCase):
+    def setUp(self):
+        job_cache.clear_job_cache()
+        self.addCleanup(job_cache.clear_job_cache)
+        self.texts = [
+            "Backend engineer: Python, Django, PostgreSQL and Docker on Kubernetes.",
+            "Frontend developer with React and TypeScript.",
+            "Data analyst using Excel and Power BI. Some Python.",
+        ]
+        self.resumes = [
+            Resume.objects.create(resume_file=f"https://example.com/{i}.pdf", extracted_text=text)
+            for i, text in enumerate(self.texts)
+        ]
+        search.backfill_search_index()
+
+    def test_tokenize_keeps_skill_spellings(self):
+        self.assertEqual(search.tokenize("Node.js, C++ and CI/CD."), ["node.js", "c++", "ci/cd"])
+
+    def test_bm25_ranks_matching_resumes_only(self):
+        ids, scores = search.bm25_search(["django", "postgresql", "python"], top_k=10)
+
+        self.assertEqual(list(ids), [self.resumes[0].id, self.resumes[2].id])
+        self.assertGreater(scores[0], scores[1])
+
+    def test_terms_shared_by_every_resume_still_match_in_small_pools(self):
+        search.index_resume_texts([(resume.id, "python django developer") for resume in self.resumes])
+
+        ids, _ = search.bm25_search(["python", "django"])
+
+        self.assertEqual(sorted(ids), sorted(resume.id for resume in self.resumes))
+
+    def test_common_terms_skipped_in_large_pools(self):
+        with self.settings(RESUME_SEARCH={"DF_CUTOFF_MIN_DOCS": 3}):
+            ids, _ = search.bm25_search(["python", "django"])  # "python" is in 2 of 3 resumes
+
+        self.assertEqual(list(ids), [self.resumes[0].id])
+
+    def test_query_terms_capped_with_skills_first(self):
+        df = {"python": 2, "django": 1, "engineer": 1, "backend": 1}
+
+        with self.settings(RESUME_SEARCH={"MAX_QUERY_TERMS": 2}):
+            kept = search.select_terms(["backend", "django", "engineer", "python", "unindexed"], df, 3, primary=["python"])
+
+        self.assertEqual(kept, ["python", "backend"])
+
+    def test_reindex_replaces_postings(self):
+        search.index_resume_texts([(self.resumes[1].id, "Django developer")])
+
+        ids, _ = search.bm25_search(["react"])
+        self.assertEqual(len(ids), 0)
+        self.resumes[1].refresh_from_db()
+        self.assertEqual(self.resumes[1].term_count, 2)
+
+    def test_search_endpoint_scores_lexical_candidates_only(self):
+        model = mock.Mock()
+        model.encode.side_effect = lambda texts, **kwargs: np.eye(len(texts), 8, dtype=np.float32)
+        loaded = encoder.LoadedEncoder(model=model, model_name="test-model", device="cpu",
+                                       load_seconds=0.0, param_bytes=0, rss_delta_bytes=0)
+
+        with mock.patch("resume.encoder.get_encoder", return_value=loaded):
+            response = APIClient().post(reverse("search-resumes"), {
+                "job_data": {"job_title": "Backend Engineer", "required_skills": ["Postgres", "K8s"]},
+                "top_k": 1,
+            }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["lexical_candidates"], 1)
+        self.assertEqual(response.data["embedded"], 1)
+        self.assertEqual([row["resume_id"] for row in response.data["results"]], [self.resumes[0].id])
+
+    def test_search_endpoint_rejects_malformed_job_data(self):
+        for job_data in ("{not json", "[1, 2]", 42):
+            response = APIClient().post(reverse("search-resumes"), {"job_data": job_data}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, job_data)
@@ -0,0 +1,74 @@
+import threading
+import time
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, FloatField, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+
+DEFAULT_ATS_THRESHOLD = 60
+DEFAULT_THRESHOLD_CACHE_SECONDS = 30  # for display only; stored shortlist flags are derived from the database value
+
+_lock = threading.Lock()
+_cached = None  # (threshold, loaded_at)
+
+
+def _cache_seconds():
+    return getattr(settings, "RESUME_THRESHOLD_CACHE_SECONDS", DEFAULT_THRESHOLD_CACHE_SECONDS)
+
+
+def get_ats_threshold():
+    """The HR-wide ATS threshold, read from the database at most once per cache window."""
+    global _cached
+    cached = _cached
+    if cached is not None and time.monotonic() - cached[1] < _cache_seconds():
+        return cached[0]
+
+    from .models import HRSettings
+
+    with _lock:
+        hr_settings = HRSettings.objects.first()
+        threshold = hr_settings.ats_threshold if hr_settings else DEFAULT_ATS_THRESHOLD
+        _cached = (threshold, time.monotonic())
+    return threshold
+
+
+def _shortlisted_case(threshold):
+    return Case(When(ats_score__gte=threshold, then=Value(True)), default=Value(False))
+
+
+def materialize_shortlisted(resumes):
+    """Re-derives ``shortlisted`` for a Resume queryset from the HR threshold in the database, in one UPDATE.
+
+    The threshold is read inside the UPDATE rather than from this process's cache, so a change
+    applied by another worker is never overwritten with the old value. A job's own
+    ``ats_threshold`` only decides the verdict reported back to that request.
+    """
+    from .models import HRSettings
+
+    stored = Subquery(HRSettings.objects.order_by("pk").values("ats_threshold")[:1])
+    return resumes.update(
+        shortlisted=_shortlisted_case(Coalesce(stored, Value(float(DEFAULT_ATS_THRESHOLD)), output_field=FloatField()))
+    )
+
+
+def invalidate_ats_threshold():
+    global _cached
+    with _lock:
+        _cached = None
+
+
+def apply_ats_threshold(threshold):
+    """Stores the threshold and re-materializes `shortlisted` for every resume in one UPDATE.
+
+    Returns the number of resumes now shortlisted.
+    """
+    from .models import HRSettings, Resume
+
+    threshold = float(threshold)
+    with transaction.atomic():
+        HRSettings.objects.update_or_create(id=1, defaults={"ats_threshold": threshold})
+        Resume.objects.update(shortlisted=_shortlisted_case(threshold))
+    invalidate_ats_threshold()
+
+    return Resume.objects.filter(shortlisted=True).count()
@@ -0,0 +1,233 @@
+import os
+import threading
+import time
+import uuid
+from contextlib import ExitStack
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.files import File
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from .pipeline import ResumeProcessingError, process_batch
+
+
+DEFAULT_UPLOAD_QUEUE_CONFIG = {
+    "ASYNC": True,                          # upload/ returns a batch id instead of processing inline
+    "SPOOL_DIR": "/tmp/resume_upload_spool",  # uploaded files wait here until a worker picks them up
+    "WORKERS": 2,                           # in-process worker threads per web process (0 = external worker only)
+    "CLAIM_SIZE": 32,                       # files of one batch a worker claims and runs through process_batch together
+    "POLL_SECONDS": 2.0,                    # idle sleep for the process_upload_queue command
+}
+
+
+def get_upload_queue_config():
+    config = dict(DEFAULT_UPLOAD_QUEUE_CONFIG)
+    config.update(getattr(settings, "RESUME_UPLOAD_QUEUE", {}))
+    return config
+
+
+# ✅ Enqueue
+def enqueue_batch(files, job_data, ats_threshold):
+    """Spools the uploaded files to disk and records one queued task per file."""
+    from .models import UploadBatch, UploadTask
+
+    spool_dir = get_upload_queue_config()["SPOOL_DIR"]
+    os.makedirs(spool_dir, exist_ok=True)
+
+    spooled = []
+    for file_obj in files:
+        spool_path = os.path.join(spool_dir, f"{uuid.uuid4().hex}_{os.path.basename(file_obj.name)}")
+        with open(spool_path, "wb") as spool_file:
+            for chunk in file_obj.chunks():
+                spool_file.write(chunk)
+        spooled.append((file_obj.name, spool_path))
+
+    with transaction.atomic():
+        batch = UploadBatch.objects.create(job_data=job_data, ats_threshold=ats_threshold, total_files=len(spooled))
+        UploadTask.objects.bulk_create(
+            [UploadTask(batch=batch, file_name=name, spool_path=path) for name, path in spooled]
+        )
+        transaction.on_commit(kick_workers)
+    return batch
+
+
+# ✅ Claim & run
+def claim_next_tasks(limit=None):
+    """Atomically moves queued tasks of the oldest waiting batch to processing (SKIP LOCKED on Postgres).
+
+    Up to CLAIM_SIZE files of one batch are claimed together so they get the same parallel
+    extraction, in-batch dedupe and upload/extraction overlap as a synchronous upload.
+    """
+    from .models import UploadBatch, UploadTask
+
+    limit = limit or get_upload_queue_config()["CLAIM_SIZE"]
+    with transaction.atomic():
+        queued = UploadTask.objects.select_for_update(skip_locked=True).filter(status=UploadTask.QUEUED)
+        first = queued.order_by("id").first()
+        if first is None:
+            return []
+        tasks = list(queued.filter(batch_id=first.batch_id).order_by("id")[:limit])
+        started_at = timezone.now()
+        for task in tasks:
+            task.status = UploadTask.PROCESSING
+            task.attempts += 1
+            task.started_at = started_at
+        UploadTask.objects.bulk_update(tasks, ["status", "attempts", "started_at"])
+        UploadBatch.objects.filter(id=first.batch_id, status=UploadBatch.PENDING).update(status=UploadBatch.PROCESSING)
+    return tasks
+
+
+def _record_result(task, result):
+    from .models import UploadTask
+
+    if isinstance(result, ResumeProcessingError):
+        task.status, task.error = UploadTask.FAILED, str(result)
+    elif isinstance(result, Exception):
+        print(f"❌ Error processing {task.file_name}: {result}")
+        task.status, task.error = UploadTask.FAILED, f"Internal Server Error: {result}"
+    else:
+        task.status = UploadTask.DONE
+        task.resume_id = result["resume_id"]
+        task.ats_score = result["ats_score"]
+        task.shortlisted = result["shortlisted"]
+    task.finished_at = timezone.now()
+
+
+def run_tasks(tasks):
+    """Processes claimed tasks of one batch in a single process_batch call and records each result or error."""
+    from .models import UploadTask
+
+    batch = tasks[0].batch
+    with ExitStack() as stack:
+        runnable, files = [], []
+        for task in tasks:
+            try:
+                spool_file = stack.enter_context(open(task.spool_path, "rb"))
+            except OSError as e:
+                _record_result(task, e)
+                continue
+            runnable.append(task)
+            files.append(File(spool_file, name=task.file_name))
+        try:
+            results = process_batch(files, batch.job_data, batch.ats_threshold) if files else []
+        except Exception as e:
+            results = [e] * len(files)
+    for task, result in zip(runnable, results):
+        _record_result(task, result)
+
+    UploadTask.objects.bulk_update(tasks, ["status", "error", "resume", "ats_score", "shortlisted", "finished_at"])
+    for task in tasks:
+        try:
+            os.remove(task.spool_path)
+        except OSError:
+            pass
+    _finish_batch_if_done(batch.id)
+
+
+def _finish_batch_if_done(batch_id):
+    from .models import UploadBatch, UploadTask
+
+    still_running = UploadTask.objects.filter(
+        batch_id=batch_id, status__in=[UploadTask.QUEUED, UploadTask.PROCESSING]
+    ).exists()
+    if not still_running:
+        UploadBatch.objects.filter(id=batch_id).exclude(status=UploadBatch.COMPLETED).update(
+            status=UploadBatch.COMPLETED, completed_at=timezone.now()
+        )
+
+
+def drain_queue(max_tasks=None):
+    """Processes queued tasks until the queue is empty (or max_tasks were run)."""
+    processed = 0
+    while max_tasks is None or processed < max_tasks:
+        tasks = claim_next_tasks(None if max_tasks is None else max_tasks - processed)
+        if not tasks:
+            break
+        run_tasks(tasks)
+        processed += len(tasks)
+    return processed
+
+
+# ✅ In-process worker pool (one per web worker process)
+_executor = None
+_active_workers = 0
+_kicks = 0  # bumped on every kick; a worker only exits if none arrived during its last drain
+_pool_lock = threading.Lock()
+
+
+def _worker():
+    global _active_workers
+    try:
+        while True:
+            with _pool_lock:
+                kicks_seen = _kicks
+            drain_queue()
+            with _pool_lock:
+                if _kicks == kicks_seen:
+                    _active_workers -= 1
+                    return
+            # A task was enqueued after drain_queue() found the queue empty; go round again.
+    except Exception as e:
+        print(f"❌ Upload worker crashed: {e}")
+        with _pool_lock:
+            _active_workers -= 1
+    finally:
+        close_old_connections()
+
+
+def kick_workers():
+    """Starts worker threads (up to WORKERS) to drain the queue in the background."""
+    global _executor, _active_workers, _kicks
+    workers = get_upload_queue_config()["WORKERS"]
+    if workers <= 0:
+        return
+    with _pool_lock:
+        _kicks += 1
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resume-upload")
+        while _active_workers < workers:
+            _active_workers += 1
+            _executor.submit(_worker)
+
+
+def requeue_stale_tasks(older_than_seconds=1800):
+    """Puts tasks stuck in processing (e.g. after a worker crash) back on the queue."""
+    from .models import UploadTask
+
+    cutoff = timezone.now() - timedelta(seconds=older_than_seconds)
+    return UploadTask.objects.filter(status=UploadTask.PROCESSING, started_at__lt=cutoff).update(status=UploadTask.QUEUED)
+
+
+def run_forever(poll_seconds=None):
+    """Loop used by the process_upload_queue management command."""
+    poll_seconds = poll_seconds or get_upload_queue_config()["POLL_SECONDS"]
+    while True:
+        if not drain_queue():
+            close_old_connections()
+            time.sleep(poll_seconds)
+
+
+def batch_status(batch):
+    """Per-file progress, failures and final scores for the batches/<id>/ endpoint."""
+    from .models import UploadTask
+
+    files = list(
+        batch.tasks.order_by("id").values(
+            "id", "file_name", "status", "error", "resume_id", "ats_score", "shortlisted", "started_at", "finished_at"
+        )
+    )
+    counts = {choice: 0 for choice, _ in UploadTask.STATUS_CHOICES}
+    for entry in files:
+        counts[entry["status"]] += 1
+
+    return {
+        "batch_id": str(batch.id),
+        "status": batch.status,
+        "total_files": batch.total_files,
+        "processed": counts[UploadTask.DONE] + counts[UploadTask.FAILED],
+        "counts": counts,
+        "created_at": batch.created_at,
+        "completed_at": batch.completed_at,
+        "files": files,
+    }
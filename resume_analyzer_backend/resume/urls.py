@@ -4,12 +4,16 @@ from django.conf.urls.static import static
 
 from .views import (
     ResumeUploadView,analyze_resume_combined, get_resumes,delete_resume,delete_all_resumes,
-    get_shortlisted_candidates, set_ats_threshold, generate_pdf_report, generate_excel_report,ResumeListView
+    get_shortlisted_candidates, set_ats_threshold, generate_pdf_report, generate_excel_report,ResumeListView,
+    get_encoder_status, rescore_resumes, search_resumes, get_upload_batch, get_purge_status, generate_csv_report
 )
 
 urlpatterns = [
     path('upload/', ResumeUploadView.as_view(), name='resume-upload'),
+    path('batches/<uuid:batch_id>/', get_upload_batch, name='upload-batch-status'),
     path('analyze/', analyze_resume_combined, name='analyze-resume'),
+    path('rescore/', rescore_resumes, name='rescore-resumes'),
+    path('search/', search_resumes, name='search-resumes'),
     
     # Shortlisted Candidates & ATS Score
     path('shortlisted/', get_shortlisted_candidates, name='shortlisted-candidates'),
@@ -18,6 +22,7 @@ urlpatterns = [
     # Report Generation
     path('report/pdf/', generate_pdf_report, name='generate-pdf-report'),
     path('report/excel/', generate_excel_report, name='generate-excel-report'),
+    path('report/csv/', generate_csv_report, name='generate-csv-report'),
 
     # View all resumes
     path('list/', ResumeListView.as_view(), name="resume-list"), 
@@ -27,6 +32,10 @@ urlpatterns = [
     path('resumes/<int:resume_id>/delete/', delete_resume, name='delete-resume'),
 
     path('resumes/delete_all/', delete_all_resumes, name='delete_all_resumes'),
+    path('resumes/purge/<uuid:purge_id>/', get_purge_status, name='purge-status'),
+
+    # Encoder diagnostics
+    path('encoder/status/', get_encoder_status, name='encoder-status'),
     
 ]+ static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
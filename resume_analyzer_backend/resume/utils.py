@@ -1,18 +1,12 @@
 import io
 import os
-import re
-import docx
-import pdfplumber
-import pytesseract
-import spacy
-from pdf2image import convert_from_path
-from PIL import Image
-from sentence_transformers import SentenceTransformer, util
-import cloudinary.uploader # type: ignore
-import requests
 from dotenv import load_dotenv
-from functools import lru_cache
-from sentence_transformers import SentenceTransformer
+from . import contacts
+from .encoder import get_model
+from .parsing import get_nlp
+from .scoring import score_resume
+from .ocr import ocr_pdf_bytes
+from .fetch import FetchError, fetch_resume_bytes
 
 
 # ✅ Load environment variables
@@ -24,33 +18,31 @@ if os.name == "posix":  # Linux/macOS
 else:  # Windows (local development)
     POPPLER_PATH = r"C:\Release-23.11.0-0\poppler-23.11.0\Library\bin"
 
-# ✅ Lazy Load NLP & BERT models
-@lru_cache(maxsize=1)
+# ✅ Lazy Load NLP & BERT models (spaCy, pdfplumber, docx, pytesseract and torch are imported on first use)
 def get_spacy_model():
-    return spacy.load("en_core_web_sm")
+    """The process-wide spaCy pipeline used for structured parsing (None if the model is not installed)."""
+    return get_nlp()
 
 
 def get_bert_model():
-    return SentenceTransformer("paraphrase-MiniLM-L3-v2", cache_folder="/tmp")
+    """Returns the process-wide sentence encoder configured in settings.RESUME_ENCODER."""
+    return get_model()
 
 
 # ✅ Download Cloudinary File Before Processing
 def download_file(file_url):
-    """Downloads a file from Cloudinary for local processing."""
+    """Downloads a file from Cloudinary for local processing (pooled, streamed, disk-cached)."""
     try:
-        response = requests.get(file_url)
-        if response.status_code == 200:
-            return io.BytesIO(response.content)
-        else:
-            print(f"❌ Failed to download file from Cloudinary: {file_url}")
-            return None
-    except Exception as e:
-        print(f"❌ Error downloading file: {e}")
+        return io.BytesIO(fetch_resume_bytes(file_url))
+    except FetchError as e:
+        print(f"❌ Failed to download file from Cloudinary: {e}")
         return None
 
 # ✅ Extract text from PDF (with OCR support)
 def extract_text_from_pdf(file_obj):
     """Extracts text from a PDF file, including OCR for scanned resumes."""
+    import pdfplumber
+
     text = ""
     try:
         with pdfplumber.open(file_obj) as pdf:
@@ -62,20 +54,32 @@ def extract_text_from_pdf(file_obj):
         if not text.strip():
             print("⚠️ No text extracted, attempting OCR...")
             text = extract_text_with_ocr(file_obj)
+    except MemoryError:
+        raise  # ✅ Let the extraction worker report the memory cap instead of an empty result
     except Exception as e:
         print(f"❌ Error reading PDF: {e}")
     
     return text.strip() if text else "❌ Error extracting text"
 
-# ✅ OCR Function for Scanned PDFs (Optimized for Memory)
+# ✅ OCR Function for Scanned PDFs (page-parallel, stops once enough text is found)
 def extract_text_with_ocr(pdf_file):
-    """Extracts text from scanned PDFs using OCR (optimized for memory)."""
+    """Extracts text from scanned PDFs using OCR; accepts a path, bytes or a file object."""
     text = ""
     try:
-        for image in convert_from_path(pdf_file, poppler_path=POPPLER_PATH):  # ✅ Process one image at a time
-            text += pytesseract.image_to_string(image) + "\n"
-            image.close()  # ✅ Free memory after processing
-        print("✅ OCR successful!")
+        if isinstance(pdf_file, (bytes, bytearray)):
+            data = bytes(pdf_file)
+        elif hasattr(pdf_file, "read"):
+            pdf_file.seek(0)
+            data = pdf_file.read()
+        else:
+            with open(pdf_file, "rb") as f:
+                data = f.read()
+
+        result = ocr_pdf_bytes(data, poppler_path=POPPLER_PATH)
+        text = result.text
+        print(f"✅ OCR successful! {len(result.pages)}/{result.total_pages} pages in {result.seconds:.2f}s")
+    except MemoryError:
+        raise  # ✅ Let the extraction worker report the memory cap instead of an empty result
     except Exception as e:
         print(f"❌ OCR failed: {e}")
     return text.strip()
@@ -83,6 +87,8 @@ def extract_text_with_ocr(pdf_file):
 # ✅ Extract text from DOCX (including OCR for images)
 def extract_text_from_docx(file_obj):
     """Extracts text from a DOCX file, including tables & images (via OCR)."""
+    import docx
+
     try:
         doc = docx.Document(file_obj)
         text = [para.text for para in doc.paragraphs]
@@ -100,6 +106,8 @@ def extract_text_from_docx(file_obj):
 
         return full_text if full_text.strip() else "❌ No extractable text found."
 
+    except MemoryError:
+        raise  # ✅ Let the extraction worker report the memory cap instead of an empty result
     except Exception as e:
         print(f"❌ Error reading DOCX: {e}")
         return "❌ Error extracting text."
@@ -107,6 +115,10 @@ def extract_text_from_docx(file_obj):
 # ✅ OCR function for extracting text from images inside DOCX
 def extract_text_from_docx_images(docx_path):
     """Extracts text from images embedded inside a DOCX file using OCR."""
+    import docx
+    import pytesseract
+    from PIL import Image
+
     try:
         doc = docx.Document(docx_path)
         text = []
@@ -121,6 +133,8 @@ def extract_text_from_docx_images(docx_path):
                 text.append(extracted_text)
 
         return "\n".join(text) if text else "❌ No images found for OCR."
+    except MemoryError:
+        raise  # ✅ Let the extraction worker report the memory cap instead of an empty result
     except Exception as e:
         print(f"❌ OCR extraction failed: {e}")
         return "❌ OCR failed."
@@ -139,60 +153,19 @@ def extract_text(file_obj):
 
 # ✅ Extract Email and Phone Numbers from Text
 def extract_email_and_phone(text):
-    """Extracts email and phone number from resume text using regex."""
-    email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    phone_pattern = r"(\+?\d{1,3}[-.\s]?)?(\(?\d{2,4}\)?[-.\s]?)?(\d{3,4}[-.\s]?\d{4})"
-
-    email_matches = re.findall(email_pattern, text, re.IGNORECASE)
-    phone_matches = re.findall(phone_pattern, text)
-
-    email = email_matches[0] if email_matches else None
-    phone_number = "".join(phone_matches[0]).replace(" ", "").replace("-", "").replace(".", "").replace("(", "").replace(")", "") if phone_matches else None
-
-    return email, phone_number
+    """Extracts the first email and E.164 phone number, scanning the resume header first (see contacts.py)."""
+    return contacts.extract_email_and_phone(text)
 
 # ✅ Optimized BERT-based similarity matching
 def bert_match_keywords(bert_model, resume_text, job_text):
     """Compares resume text with job description using preloaded BERT model."""
+    from sentence_transformers import util
+
     embeddings = bert_model.encode([resume_text, job_text], convert_to_tensor=True)
     similarity_score = util.pytorch_cos_sim(embeddings[0], embeddings[1]).item()
     return round(similarity_score * 100, 2)
 
 # ✅ Optimized Multi-Factor ATS Scoring Function
 def compute_ats_score(resume_text, job_data):
-    """Compute ATS Score using lazy-loaded BERT model."""
-    bert_model = get_bert_model()  # ✅ Load BERT model once
-
-    scores = {
-        "job_title": bert_match_keywords(bert_model, resume_text, job_data["job_title"]),
-        "job_description": bert_match_keywords(bert_model, resume_text, job_data["job_description"]),
-        "required_skills": bert_match_keywords(bert_model, resume_text, " ".join(job_data["required_skills"])),
-        "preferred_qualifications": bert_match_keywords(bert_model, resume_text, " ".join(job_data["preferred_qualifications"])),
-        "responsibilities": bert_match_keywords(bert_model, resume_text, " ".join(job_data["responsibilities"]))
-    }
-
-    weights = {"job_title": 20, "job_description": 30, "required_skills": 25, "preferred_qualifications": 10, "responsibilities": 15}
-    final_ats_score = sum(scores[key] * weights[key] / 100 for key in scores) + 30
-
-
-    # Add points based on ATS score range
-    if final_ats_score < 30:
-        final_ats_score += 30
-    elif final_ats_score <= 40:
-        final_ats_score += 35
-    elif final_ats_score <= 50:
-        final_ats_score += 40
-    elif final_ats_score <= 70:
-        final_ats_score += 25
-    elif final_ats_score <= 80:
-        final_ats_score += 10
-    elif final_ats_score <= 90:
-        final_ats_score += 5
-
-        
-    return {"scores": scores, "final_ats_score": round(final_ats_score, 2)}
-
-
-
-
-
+    """Compute ATS Score: the resume is encoded once, job fields come from the job-profile cache."""
+    return score_resume(resume_text, job_data)
@@ -1,34 +1,34 @@
 import os
 import json
-import pandas as pd
-from io import BytesIO
-import re
-import cloudinary.uploader  # ✅ Import Cloudinary uploader
+import time
 from django.views import View
 from django.db import connection
+from django.core.exceptions import ValidationError
 from django.core.files.storage import default_storage
-from django.http import JsonResponse, HttpResponse, FileResponse
+from django.http import JsonResponse, HttpResponse, FileResponse, StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework import status
 from rest_framework.decorators import api_view
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
-from io import BytesIO
-from django.http import FileResponse
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
+from django.urls import reverse
 from resume.models import Resume
-from resume.models import Resume, HRSettings
-from .serializers import ResumeSerializer
-from .utils import compute_ats_score, extract_text, extract_email_and_phone
+from resume.models import Resume, ExtractionCache, PurgeJob, UploadBatch
+from .serializers import RESUME_LIST_FIELDS, ResumeListSerializer
+from .encoder import encoder_stats, get_encoder
+from .embeddings import get_resume_vector, rerank_pool, store_resume_embedding
+from .job_cache import get_job_matrix
+from .scoring import encode_resume, score_vector
+from .search import get_search_config, search_candidates
+from .pipeline import ResumeProcessingError, load_resume_text, process_batch, resume_file_url
+from .purge import purge_status, run_purge_in_background, start_or_resume_purge
+from .storage import get_resume_storage
+from .thresholds import apply_ats_threshold, get_ats_threshold, materialize_shortlisted
+from .upload_queue import batch_status, enqueue_batch, get_upload_queue_config
+from .pagination import InvalidCursor, keyset_page, page_limit, set_pagination_headers
+from .reports import build_excel_report_file, filtered_resumes, get_pdf_report_path, iter_csv_report
 
 # ✅ Allowed file types
 ALLOWED_EXTENSIONS = [".pdf", ".docx"]
@@ -44,84 +44,39 @@ class ResumeUploadView(APIView):
             if not files:
                 return Response({"error": "No files uploaded"}, status=status.HTTP_400_BAD_REQUEST)
 
-            uploaded_resumes = []  # ✅ Store results for each file
-
-            for file_obj in files:
-                print("✅ Uploading file:", file_obj.name)
-
-                # ✅ Upload file to Cloudinary (store as raw file)
-                cloudinary_response = cloudinary.uploader.upload(
-                        file_obj,
-                        resource_type="raw",  # Ensures Cloudinary treats it as a document
-                        folder="resumes/",
-                        use_filename=True,  
-                        unique_filename=False, 
-                        overwrite=True,  
-                        access_mode="public",
-                        format="pdf"  # Explicitly set format to PDF
-                    )
-
-
-                cloudinary_url = cloudinary_response.get("url")
-                if not cloudinary_url:
-                    return Response({"error": f"Failed to upload {file_obj.name} to Cloudinary"},
-                                    status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-                print("📂 File stored at:", cloudinary_url)
-
-                # ✅ Extract text from resume
-                resume_text = extract_text(file_obj)
-                if not resume_text:
-                    return Response({"error": f"Failed to extract text from {file_obj.name}"}, status=status.HTTP_400_BAD_REQUEST)
-
-                print("📝 Extracted text:", resume_text[:100])
-
-                # ✅ Get job data from request
-                job_data_str = request.data.get("job_data")
-                if job_data_str:
-                    job_data = json.loads(job_data_str)  # Convert from JSON string to dictionary
-                else:
-                    return Response({"error": "Job data is missing"}, status=status.HTTP_400_BAD_REQUEST)
-
-                print("📊 Job Data Received:", job_data)
-
-                # ✅ Get ATS threshold (default 60)
-                ats_threshold = float(job_data.get("ats_threshold", 60))
-
-                # ✅ Compute ATS Score
-                ats_score = compute_ats_score(resume_text, job_data)
-                print(f"⭐ ATS Score for {file_obj.name}: {ats_score['final_ats_score']}")
-
-                email, phone_number = extract_email_and_phone(resume_text)
-
-                # ✅ Determine Shortlisting Status
-                is_shortlisted = ats_score["final_ats_score"] >= ats_threshold
-
-                # ✅ Save resume to the database (store Cloudinary URL)
-                resume_instance = Resume.objects.create(
-                    resume_file=cloudinary_url,  # Store Cloudinary URL instead of file path
-                    extracted_text=resume_text,
-                    email=email,
-                    phone_number=phone_number,
-                    ats_score=ats_score["final_ats_score"],
-                    shortlisted=is_shortlisted
-                )
-                resume_instance.save()
-
-                # ✅ Append each uploaded resume's results
-                uploaded_resumes.append({
-                    "resume_id": resume_instance.id,
-                    "file_name": file_obj.name,
-                    "resume_url": cloudinary_url,
-                    "ats_score": ats_score["final_ats_score"],
-                    "email": email,
-                    "phone_number": phone_number,
-                    "shortlisted": is_shortlisted
-                })
+            # ✅ Get job data from request (parsed once for the whole batch)
+            job_data_str = request.data.get("job_data")
+            if job_data_str:
+                job_data = json.loads(job_data_str)  # Convert from JSON string to dictionary
+            else:
+                return Response({"error": "Job data is missing"}, status=status.HTTP_400_BAD_REQUEST)
+
+            print("📊 Job Data Received:", job_data)
+
+            # ✅ Get ATS threshold (default 60)
+            ats_threshold = float(job_data.get("ats_threshold", 60))
+
+            # ✅ Default: queue the batch and return immediately, workers process the files
+            if get_upload_queue_config()["ASYNC"]:
+                batch = enqueue_batch(files, job_data, ats_threshold)
+                return Response({
+                    "message": "Upload accepted",
+                    "batch_id": str(batch.id),
+                    "total_files": batch.total_files,
+                    "status_url": reverse("upload-batch-status", args=[batch.id]),
+                }, status=status.HTTP_202_ACCEPTED)
+
+            # ✅ Uploads, parallel extraction and scoring for the whole batch
+            results = process_batch(files, job_data, ats_threshold)
+            uploaded_resumes = [r for r in results if not isinstance(r, ResumeProcessingError)]  # ✅ Store results for each file
+            errors = [str(r) for r in results if isinstance(r, ResumeProcessingError)]
+            if errors and not uploaded_resumes:
+                return Response({"error": errors[0]}, status=status.HTTP_400_BAD_REQUEST)
 
             return Response({
                 "message": "Upload successful",
-                "resumes": uploaded_resumes
+                "resumes": uploaded_resumes,
+                "errors": errors
             }, status=status.HTTP_201_CREATED)
 
         except Exception as e:
@@ -129,6 +84,14 @@ class ResumeUploadView(APIView):
             return Response({"error": f"Internal Server Error: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# ✅ Upload Batch Progress
+@api_view(['GET'])
+def get_upload_batch(request, batch_id):
+    """Reports per-file progress, failures and final scores of an upload batch."""
+    batch = get_object_or_404(UploadBatch, id=batch_id)
+    return Response(batch_status(batch), status=status.HTTP_200_OK)
+
+
 # ✅ Resume Analysis (ATS Scoring & Shortlisting)
 @api_view(['POST'])
 def analyze_resume_combined(request):
@@ -141,368 +104,245 @@ def analyze_resume_combined(request):
 
     try:
         resume = Resume.objects.get(id=resume_id)
-        resume_text = extract_text(resume.resume_file.path)
+        encoder = get_encoder()
 
-        # Compute ATS Score
-        ats_result = compute_ats_score(resume_text, job_data)
+        # Compute ATS Score (stored vector → stored text → fetch & extract, in that order)
+        resume_vector = get_resume_vector(resume, encoder.model_name)
+        if resume_vector is None:
+            resume_vector = encode_resume(load_resume_text(resume), encoder)
+            store_resume_embedding(resume, resume_vector, encoder.model_name)
+        ats_result = score_vector(resume_vector, get_job_matrix(job_data, encoder))
 
-        # Update the resume in the database
+        # Update the resume in the database (stored shortlist follows the HR threshold)
         resume.ats_score = ats_result["final_ats_score"]
-        resume.shortlisted = resume.ats_score >= job_data.get("ats_threshold", 60)  # Default threshold 60%
-        resume.save()
+        resume.save(update_fields=["ats_score"])
+        materialize_shortlisted(Resume.objects.filter(id=resume.id))
 
         return Response({
             "message": "Resume analyzed successfully",
             "ats_scores": ats_result["scores"],
             "final_ats_score": ats_result["final_ats_score"],
-            "shortlisted": resume.shortlisted
+            "shortlisted": resume.ats_score >= float(job_data.get("ats_threshold", 60)),  # Default threshold 60%
+            "chunks": len(resume_vector),
         })
 
     except Resume.DoesNotExist:
         return Response({"error": "Resume not found"}, status=404)
+    except ResumeProcessingError as e:
+        return Response({"error": str(e)}, status=status.HTTP_502_BAD_GATEWAY)
+
+
+def _request_job_data(request):
+    """job_data from a JSON body or a form field; None when missing, malformed or not an object."""
+    job_data = request.data.get("job_data")
+    if isinstance(job_data, str):
+        try:
+            job_data = json.loads(job_data)
+        except (TypeError, ValueError):
+            return None
+    return job_data if isinstance(job_data, dict) and job_data else None
+
+
+# ✅ Bulk Re-Rank (score the whole pool, or a filtered subset, against one job)
+@api_view(['POST'])
+def rescore_resumes(request):
+    """Re-scores stored resume vectors against new job data and returns the top candidates."""
+    job_data = _request_job_data(request)
+    if job_data is None:
+        return Response({"error": "Job data is required as a JSON object."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        top_n = int(request.data.get("top_n", 20))
+        ats_threshold = float(job_data.get("ats_threshold", 60))
+    except (TypeError, ValueError):
+        return Response({"error": "top_n and ats_threshold must be numbers."}, status=status.HTTP_400_BAD_REQUEST)
+
+    # ✅ Optional filters
+    resumes = Resume.objects.all()
+    try:
+        resume_ids = request.data.get("resume_ids")
+        if resume_ids:
+            resumes = resumes.filter(id__in=resume_ids)
+        if request.data.get("shortlisted") is not None:
+            resumes = resumes.filter(shortlisted=str(request.data.get("shortlisted")).lower() in ("true", "1"))
+        if request.data.get("uploaded_after"):
+            resumes = resumes.filter(uploaded_at__gte=request.data.get("uploaded_after"))
+    except (TypeError, ValueError, ValidationError):
+        return Response({"error": "Invalid resume_ids or uploaded_after filter."}, status=status.HTTP_400_BAD_REQUEST)
+
+    started = time.perf_counter()
+    result = rerank_pool(job_data, resumes, ats_threshold, top_n=max(top_n, 0))
+    print(f"🔁 Re-scored {result['rescored']} resumes in {time.perf_counter() - started:.2f}s")
+
+    return Response({
+        "message": "Resumes re-scored successfully",
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        **result,
+    }, status=status.HTTP_200_OK)
+
+
+# ✅ Search (BM25 candidates from the inverted index, then embedding scores on those only)
+@api_view(['POST'])
+def search_resumes(request):
+    """Returns the best-matching resumes for a job without scoring the whole pool."""
+    job_data = _request_job_data(request)
+    if job_data is None:
+        return Response({"error": "Job data is required as a JSON object."}, status=status.HTTP_400_BAD_REQUEST)
+
+    config = get_search_config()
+    try:
+        top_k = int(request.data.get("top_k", config["CANDIDATES"]))
+        top_n = int(request.data.get("top_n", 20))
+    except (TypeError, ValueError):
+        return Response({"error": "top_k and top_n must be numbers."}, status=status.HTTP_400_BAD_REQUEST)
+
+    started = time.perf_counter()
+    result = search_candidates(job_data, top_k=min(max(top_k, 1), config["MAX_CANDIDATES"]), top_n=top_n)
+    print(f"🔎 Searched {result['lexical_candidates']} lexical candidates in {time.perf_counter() - started:.2f}s")
+
+    return Response({
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        **result,
+    }, status=status.HTTP_200_OK)
 
 
 # ✅ Get All Resumes
 @api_view(['GET'])
 def get_resumes(request):
-    """Retrieves all uploaded resumes sorted by ATS score (highest first)."""
-    resumes = Resume.objects.all().order_by('-ats_score')  # ✅ Ensure sorting
-    serializer = ResumeSerializer(resumes, many=True)
-    return Response(serializer.data)
+    """Retrieves uploaded resumes sorted by ATS score (highest first), one keyset page at a time."""
+    try:
+        rows, next_cursor = keyset_page(
+            Resume.objects.values(*RESUME_LIST_FIELDS), request.GET.get("cursor"), page_limit(request.GET)
+        )
+    except InvalidCursor as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    response = Response(ResumeListSerializer(rows, many=True).data)
+    return set_pagination_headers(response, request, next_cursor)
 
 
 
 class ResumeListView(View):
     def get(self, request, *args, **kwargs):
-        resumes = Resume.objects.all().values("id", "resume_file", "ats_score", "email", "phone_number", "shortlisted")
-        return JsonResponse({"resumes": list(resumes)}, safe=False)
+        try:
+            resumes, next_cursor = keyset_page(
+                Resume.objects.values("id", "resume_file", "ats_score", "email", "phone_number", "shortlisted"),
+                request.GET.get("cursor"),
+                page_limit(request.GET),
+            )
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        return set_pagination_headers(JsonResponse({"resumes": resumes, "next_cursor": next_cursor}), request, next_cursor)
     
 
 
 # ✅ Get Shortlisted Candidates
 @api_view(['GET'])
 def get_shortlisted_candidates(request):
-    """Retrieves shortlisted candidates based on ATS score threshold."""
-    hr_settings = HRSettings.objects.first()
-    threshold = hr_settings.ats_threshold if hr_settings else 60
+    """Retrieves shortlisted candidates (materialized against the ATS threshold by set_ats_threshold)."""
+    shortlisted_candidates = Resume.objects.filter(shortlisted=True).values(*RESUME_LIST_FIELDS)
+    cursor = request.GET.get("cursor")
 
-    connection.close()
-    shortlisted_candidates = Resume.objects.filter(ats_score__gte=threshold).order_by('-ats_score')
+    try:
+        rows, next_cursor = keyset_page(shortlisted_candidates, cursor, page_limit(request.GET))
+    except InvalidCursor as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-    if not shortlisted_candidates.exists():
+    if not rows and not cursor:
         return Response({"message": "No candidates shortlisted."}, status=status.HTTP_200_OK)
 
-    serializer = ResumeSerializer(shortlisted_candidates, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    response = Response(ResumeListSerializer(rows, many=True).data, status=status.HTTP_200_OK)
+    response["X-ATS-Threshold"] = str(get_ats_threshold())
+    return set_pagination_headers(response, request, next_cursor)
+
+
+# ✅ Health Check (no ML stacks are imported or loaded to answer it)
+def health_check(request):
+    """Liveness/readiness probe: one trivial query, plus whether this worker has an encoder loaded yet."""
+    database = "ok"
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except Exception as e:
+        database = f"error: {e}"
+
+    healthy = database == "ok"
+    return JsonResponse(
+        {"status": "ok" if healthy else "unavailable", "database": database, "encoder_loaded": bool(encoder_stats())},
+        status=200 if healthy else 503,
+    )
+
+
+# ✅ Encoder Load Time & Memory Footprint (this worker)
+@api_view(['GET'])
+def get_encoder_status(request):
+    """Reports the sentence encoders loaded in this worker process."""
+    return Response({"encoders": encoder_stats()}, status=status.HTTP_200_OK)
 
 
 # ✅ Set ATS Threshold
-@api_view(['POST'])
+@api_view(['GET', 'POST'])
 def set_ats_threshold(request):
-    """Updates the ATS score threshold dynamically."""
+    """Returns (GET) or updates (POST) the ATS score threshold, re-shortlisting every resume on update."""
+    if request.method == "GET":
+        return Response({"threshold": get_ats_threshold()}, status=status.HTTP_200_OK)
+
     try:
         threshold = request.data.get("threshold")
 
         if threshold is None or not isinstance(threshold, (int, float)) or not (0 <= float(threshold) <= 100):
             return Response({"error": "Invalid threshold value. Must be between 0 and 100."}, status=status.HTTP_400_BAD_REQUEST)
 
-        hr_settings, created = HRSettings.objects.get_or_create(id=1)
-        hr_settings.ats_threshold = float(threshold)
-        hr_settings.save()
+        shortlisted_count = apply_ats_threshold(threshold)
 
-        return Response({"message": "ATS threshold updated successfully"}, status=status.HTTP_200_OK)
+        return Response(
+            {"message": "ATS threshold updated successfully", "shortlisted_count": shortlisted_count},
+            status=status.HTTP_200_OK,
+        )
     except Exception as e:
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-from django.http import HttpResponse, FileResponse
-import pandas as pd
-from io import BytesIO
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from resume.models import Resume
-
 # 📂 Generate and Return Excel Report
-import pandas as pd
-from io import BytesIO
-from django.http import HttpResponse
-import xlsxwriter
-from resume.models import Resume
-
-# def generate_excel_report(request):
-#     """Generates an enhanced Excel report for all resumes."""
-    
-#     shortlisted = Resume.objects.all().values_list("resume_file", "email", "phone_number", "ats_score", "shortlisted")
-
-#     if not shortlisted:
-#         return HttpResponse("No resumes available.", content_type="text/plain")
-
-#     # ✅ Convert QuerySet to DataFrame
-#     df = pd.DataFrame(shortlisted, columns=["Resume File", "Email", "Phone Number", "ATS Score", "Shortlisted"])
-
-#     # ✅ Convert "Shortlisted" column to Yes/No
-#     df["Shortlisted"] = df["Shortlisted"].apply(lambda x: "✅ Yes" if x else "❌ No")
-
-#     buffer = BytesIO()
-    
-#     # ✅ Create Excel Writer
-#     with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
-#         df.to_excel(writer, index=False, sheet_name="Resumes")
-        
-#         workbook = writer.book
-#         worksheet = writer.sheets["Resumes"]
-
-#         # ✅ Formatting
-#         header_format = workbook.add_format({"bold": True, "align": "center", "bg_color": "#D3D3D3", "border": 1})
-#         percent_format = workbook.add_format({"num_format": "0.00%", "align": "center"})
-#         yes_format = workbook.add_format({"bg_color": "#C6EFCE", "bold": True})
-#         no_format = workbook.add_format({"bg_color": "#FFC7CE", "bold": True})
-#         center_format = workbook.add_format({"align": "center"})
-
-#         # ✅ Apply Formatting
-#         for col_num, value in enumerate(df.columns):
-#             worksheet.write(0, col_num, value, header_format)  # Apply header style
-#             worksheet.set_column(col_num, col_num, 20, center_format)  # Set column width
-
-#         # ✅ Format "ATS Score" as percentage
-#         worksheet.set_column("D:D", 15, percent_format)  
-
-#         # ✅ Conditional Formatting for "Shortlisted"
-#         worksheet.conditional_format("E2:E{}".format(len(df) + 1), 
-#                                      {"type": "text", "criteria": "containing", "value": "Yes", "format": yes_format})
-#         worksheet.conditional_format("E2:E{}".format(len(df) + 1), 
-#                                      {"type": "text", "criteria": "containing", "value": "No", "format": no_format})
-
-#         writer.close()
-    
-#     buffer.seek(0)
-
-#     # ✅ Serve the Excel file as a response
-#     response = HttpResponse(buffer.read(), content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-#     response["Content-Disposition"] = 'attachment; filename="resumes.xlsx"'
-
-#     return response
-
-
-# # 📝 Generate and Return PDF Report
-# def generate_pdf_report(request):
-#     buffer = BytesIO()
-#     doc = SimpleDocTemplate(buffer, pagesize=letter)
-#     elements = []
-
-#     # ✅ Styles
-#     styles = getSampleStyleSheet()
-
-#     # ✅ Title
-#     title = Paragraph("<b>All Candidate Resume information</b>", styles["Title"])
-#     elements.append(title)
-#     elements.append(Paragraph("<br/><br/>", styles["Normal"]))  # Add spacing
-
-#     # ✅ Fetch Resume Data
-#     resumes = Resume.objects.all().values("id", "email", "phone_number", "ats_score", "shortlisted")
-
-#     if not resumes:
-#         elements.append(Paragraph("No resumes found.", styles["Normal"]))
-#     else:
-#         # ✅ Table Headers
-#         data = [["ID", "Email", "Phone", "ATS Score", "Shortlisted"]]
-
-#         # ✅ Add Resume Data to Table
-#         for resume in resumes:
-#             shortlisted_status = "Yes" if resume["shortlisted"] else "No"
-#             data.append([
-#                 str(resume["id"]),
-#                 resume["email"] or "N/A",
-#                 resume["phone_number"] or "N/A",
-#                 f"{resume['ats_score']:.2f}%",
-#                 shortlisted_status
-#             ])
-
-#         # ✅ Create Table
-#         table = Table(data, colWidths=[1 * inch, 2.5 * inch, 2 * inch, 1.5 * inch, 1.5 * inch])
-
-#         # ✅ Table Styling
-#         table.setStyle(TableStyle([
-#             ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-#             ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-#             ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-#             ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-#             ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-#             ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-#             ("GRID", (0, 0), (-1, -1), 1, colors.black),
-#         ]))
-
-#         elements.append(table)
-
-#     # ✅ Build PDF
-#     doc.build(elements)
-#     buffer.seek(0)
-
-#     return FileResponse(buffer, as_attachment=True, filename="shortlisted_resumes.pdf")
-
-
-import pandas as pd
-from django.http import HttpResponse
-from io import BytesIO
-from resume.models import Resume
-
 def generate_excel_report(request):
-    """Generates an enhanced Excel report for resumes based on filter selection."""
+    """Generates an enhanced Excel report for resumes based on filter selection (flat memory)."""
 
     # ✅ Get filter type from request
-    filter_type = request.GET.get("filter", "all")
-
-    if filter_type == "shortlisted":
-        resumes = Resume.objects.filter(shortlisted=True)
-    elif filter_type == "not_shortlisted":
-        resumes = Resume.objects.filter(shortlisted=False)
-    else:
-        resumes = Resume.objects.all()
+    resumes = filtered_resumes(request.GET.get("filter", "all"))
 
     if not resumes.exists():
         return HttpResponse("No resumes available.", content_type="text/plain")
 
-    # ✅ Convert QuerySet to DataFrame
-    df = pd.DataFrame.from_records(resumes.values("resume_file", "email", "phone_number", "ats_score", "shortlisted"))
-
-    # ✅ Rename Columns for Readability
-    df.rename(columns={
-        "resume_file": "Resume File",
-        "email": "Email",
-        "phone_number": "Phone Number",
-        "ats_score": "ATS Score (%)",
-        "shortlisted": "Shortlisted"
-    }, inplace=True)
-
-    # ✅ Convert "Shortlisted" column to Yes/No
-    df["Shortlisted"] = df["Shortlisted"].apply(lambda x: "✅ Yes" if x else "❌ No")
-    
-    df["ATS Score (%)"] = df["ATS Score (%)"] / 100
-
-    buffer = BytesIO()
+    # ✅ Serve the Excel file straight from a temp file
+    return FileResponse(
+        build_excel_report_file(resumes),
+        as_attachment=True,
+        filename="resumes.xlsx",
+        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
 
-    # ✅ Create Excel Writer
-    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
-        df.to_excel(writer, index=False, sheet_name="Resumes")
 
-        workbook = writer.book
-        worksheet = writer.sheets["Resumes"]
-
-        # ✅ Formatting
-        header_format = workbook.add_format({"bold": True, "align": "center", "bg_color": "#D3D3D3", "border": 1})
-        percent_format = workbook.add_format({"num_format": "0.00%", "align": "center"})
-        yes_format = workbook.add_format({"bg_color": "#C6EFCE", "bold": True})
-        no_format = workbook.add_format({"bg_color": "#FFC7CE", "bold": True})
-        center_format = workbook.add_format({"align": "center"})
-
-        # ✅ Apply Formatting
-        for col_num, value in enumerate(df.columns):
-            worksheet.write(0, col_num, value, header_format)  # Apply header style
-            worksheet.set_column(col_num, col_num, 20, center_format)  # Set column width
-
-        # ✅ Format "ATS Score" as percentage
-        worksheet.set_column("D:D", 15, percent_format)  
-
-        # ✅ Conditional Formatting for "Shortlisted"
-        worksheet.conditional_format("E2:E{}".format(len(df) + 1), 
-                                     {"type": "text", "criteria": "containing", "value": "Yes", "format": yes_format})
-        worksheet.conditional_format("E2:E{}".format(len(df) + 1), 
-                                     {"type": "text", "criteria": "containing", "value": "No", "format": no_format})
-
-        writer.close()
-
-    buffer.seek(0)
-
-    # ✅ Serve the Excel file as a response
-    response = HttpResponse(buffer.read(), content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-    response["Content-Disposition"] = 'attachment; filename="resumes.xlsx"'
+# 📄 Generate and Stream CSV Report
+def generate_csv_report(request):
+    """Streams the resume report as CSV row by row."""
+    resumes = filtered_resumes(request.GET.get("filter", "all"))
 
+    response = StreamingHttpResponse(iter_csv_report(resumes), content_type="text/csv")
+    response["Content-Disposition"] = 'attachment; filename="resumes.csv"'
     return response
 
 
 
 
-from django.http import FileResponse
-from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
-from resume.models import Resume
-
+# 📝 Generate and Return PDF Report
 def generate_pdf_report(request):
-    """Generates a detailed PDF report of resumes with filtering options."""
-    
-    filter_type = request.GET.get("filter", "all")
-
-    if filter_type == "shortlisted":
-        resumes = Resume.objects.filter(shortlisted=True)
-    elif filter_type == "not_shortlisted":
-        resumes = Resume.objects.filter(shortlisted=False)
-    else:
-        resumes = Resume.objects.all()
-
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    elements = []
-    
-    styles = getSampleStyleSheet()
-
-    # ✅ Title
-    title = Paragraph(f"<b>Resume Report ({filter_type.capitalize()} Candidates)</b>", styles["Title"])
-    elements.append(title)
-    elements.append(Paragraph("<br/><br/>", styles["Normal"]))
-
-    if not resumes.exists():
-        elements.append(Paragraph("No resumes found.", styles["Normal"]))
-    else:
-        # ✅ Table Headers
-        data = [["ID", "Email", "Phone", "ATS Score", "Shortlisted"]]
-
-        # ✅ Add Resume Data to Table
-        for resume in resumes:
-            shortlisted_status = "✅ Yes" if resume.shortlisted else "❌ No"
-            data.append([
-                str(resume.id),
-                resume.email or "N/A",
-                resume.phone_number or "N/A",
-                f"{resume.ats_score:.2f}%",
-                shortlisted_status
-            ])
-
-        # ✅ Create Table
-        table = Table(data, colWidths=[1 * inch, 2.5 * inch, 2 * inch, 1.5 * inch, 1.5 * inch])
-
-        # ✅ Table Styling
-        table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-            ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-        ]))
-
-        elements.append(table)
-
-    # ✅ Build PDF
-    doc.build(elements)
-    buffer.seek(0)
-
-    return FileResponse(buffer, as_attachment=True, filename="resumes.pdf")
-
-
-
-
-
-
-
-
-
+    """Generates a detailed PDF report of resumes with filtering options (cached until the set changes)."""
 
+    filter_type = request.GET.get("filter", "all")
+    if filter_type not in ("all", "shortlisted", "not_shortlisted"):
+        filter_type = "all"
 
+    return FileResponse(open(get_pdf_report_path(filter_type), "rb"), as_attachment=True, filename="resumes.pdf")
 
 
 @api_view(['DELETE'])
@@ -510,52 +350,47 @@ def delete_resume(request, resume_id):
     """Deletes a specific resume by ID and removes it from Cloudinary."""
     try:
         resume = Resume.objects.get(id=resume_id)
-
-        # ✅ Extract Cloudinary Public ID from the URL
-        cloudinary_url = resume.resume_file.url  # Get Cloudinary URL
-        match = re.search(r"resumes/(.*)\..*$", cloudinary_url)  # Extract public_id
-        if match:
-            public_id = f"resumes/{match.group(1)}"
-            
-            # ✅ Force immediate deletion using `invalidate=True`
-            cloudinary.uploader.destroy(public_id, resource_type="raw", invalidate=True)
-            print(f"🗑️ Force deleted from Cloudinary: {public_id}")
-        else:
-            print("⚠️ Failed to extract public_id from Cloudinary URL")
+        resume_url = resume.resume_file.name
 
         # ✅ Delete from the database
         resume.delete()
+
+        # ✅ Remove the stored file unless a duplicate upload still links to it
+        if not Resume.objects.filter(resume_file=resume_url).exists():
+            get_resume_storage().delete(resume_file_url(resume))
+            ExtractionCache.objects.filter(resume_url=resume_url).delete()
+            print(f"🗑️ Force deleted stored file: {resume_url}")
+
         return Response({"message": "Resume deleted successfully"}, status=status.HTTP_200_OK)
 
     except Resume.DoesNotExist:
         return Response({"error": "Resume not found"}, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         return Response({"error": f"Internal Server Error: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
-    
-
-
-from rest_framework.decorators import api_view
-from rest_framework.response import Response
-from .models import Resume
-from rest_framework import status
-
-
 
 
 # ✅ Delete All Resumes (Removes from Cloudinary Too)
 @api_view(['DELETE'])
 def delete_all_resumes(request):
-    """Deletes all resumes and removes them from Cloudinary."""
+    """Starts (or resumes) a background purge of all resumes and their stored files."""
     try:
-        resumes = Resume.objects.all()
-
-        for resume in resumes:
-            public_id = resume.resume_file.url.split("/")[-1].split(".")[0]
-            cloudinary.uploader.destroy(f"resumes/{public_id}", resource_type="raw")
+        job, should_run = start_or_resume_purge()
+        if should_run:
+            run_purge_in_background(job)
 
-        Resume.objects.all().delete()
-        return Response({"message": "All resumes deleted successfully."}, status=status.HTTP_204_NO_CONTENT)
+        return Response({
+            "message": "Deleting all resumes.",
+            "status_url": reverse("purge-status", args=[job.id]),
+            **purge_status(job),
+        }, status=status.HTTP_202_ACCEPTED)
 
     except Exception as e:
-        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+# ✅ Purge Progress
+@api_view(['GET'])
+def get_purge_status(request, purge_id):
+    """Reports how far a delete-all run has got."""
+    job = get_object_or_404(PurgeJob, id=purge_id)
+    return Response(purge_status(job), status=status.HTTP_200_OK)
@@ -126,6 +126,119 @@ CLOUDINARY_STORAGE = {
 
 DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
 
+# ✅ Sentence encoder used for ATS scoring (loaded once per worker, warmed in ResumeConfig.ready)
+RESUME_ENCODER = {
+    'MODEL_NAME': os.getenv("RESUME_ENCODER_MODEL", "paraphrase-MiniLM-L3-v2"),
+    'DEVICE': os.getenv("RESUME_ENCODER_DEVICE", "cpu"),
+    'CACHE_FOLDER': os.getenv("RESUME_ENCODER_CACHE", "/tmp"),
+    'WARMUP': os.getenv("RESUME_ENCODER_WARMUP", "True") == "True",
+    'WARMUP_BACKGROUND': os.getenv("RESUME_ENCODER_WARMUP_BACKGROUND", "True") == "True",
+    # ✅ Shared inference server: run `python manage.py serve_encoder` once and point every worker at its socket
+    'SERVER_SOCKET': os.getenv("RESUME_ENCODER_SOCKET", ""),
+    'SERVER_TIMEOUT_SECONDS': float(os.getenv("RESUME_ENCODER_SOCKET_TIMEOUT", "30")),
+    'SERVER_MAX_BATCH': int(os.getenv("RESUME_ENCODER_MAX_BATCH", "64")),
+    # ✅ In-process micro-batching of concurrent scoring encodes (metrics on /api/encoder/status/)
+    'MICRO_BATCH': os.getenv("RESUME_ENCODER_MICRO_BATCH", "True") == "True",
+    'MICRO_BATCH_MAX_SIZE': int(os.getenv("RESUME_ENCODER_MICRO_BATCH_SIZE", "32")),
+    'MICRO_BATCH_WAIT_MS': float(os.getenv("RESUME_ENCODER_MICRO_BATCH_WAIT_MS", "5")),
+}
+
+# ✅ Job-profile embedding cache (in-process LRU, optionally backed by the database)
+RESUME_JOB_CACHE = {
+    'SIZE': int(os.getenv("RESUME_JOB_CACHE_SIZE", "256")),
+    'PERSIST': os.getenv("RESUME_JOB_CACHE_PERSIST", "True") == "True",
+}
+
+# ✅ Upload queue (DB-table queue drained by in-process threads or `manage.py process_upload_queue`)
+RESUME_UPLOAD_QUEUE = {
+    'ASYNC': os.getenv("RESUME_ASYNC_UPLOADS", "True") == "True",
+    'SPOOL_DIR': os.getenv("RESUME_UPLOAD_SPOOL_DIR", "/tmp/resume_upload_spool"),
+    'WORKERS': int(os.getenv("RESUME_UPLOAD_WORKERS", "2")),
+    'POLL_SECONDS': float(os.getenv("RESUME_UPLOAD_POLL_SECONDS", "2")),
+}
+
+# ✅ Text extraction process pool (per-file timeout and memory cap)
+RESUME_EXTRACTION = {
+    'PROCESSES': int(os.getenv("RESUME_EXTRACTION_PROCESSES", str(os.cpu_count() or 1))),
+    'TIMEOUT_SECONDS': int(os.getenv("RESUME_EXTRACTION_TIMEOUT", "60")),
+    'MEMORY_LIMIT_MB': int(os.getenv("RESUME_EXTRACTION_MEMORY_MB", "1024")),
+}
+
+# ✅ OCR for scanned PDFs
+RESUME_OCR = {
+    'DPI': int(os.getenv("RESUME_OCR_DPI", "200")),
+    'GRAYSCALE': os.getenv("RESUME_OCR_GRAYSCALE", "True") == "True",
+    'THREADS': int(os.getenv("RESUME_OCR_THREADS", "4")),
+    'MAX_PAGES': int(os.getenv("RESUME_OCR_MAX_PAGES", "4")),
+    'MIN_CHARS': int(os.getenv("RESUME_OCR_MIN_CHARS", "1500")),
+}
+
+# ✅ Fetching stored resume files (pooled session + local disk cache)
+RESUME_FETCH = {
+    'CACHE_DIR': os.getenv("RESUME_FETCH_CACHE_DIR", "/tmp/resume_file_cache"),
+    'CACHE_MAX_MB': int(os.getenv("RESUME_FETCH_CACHE_MB", "512")),
+    'CONNECT_TIMEOUT': 5,
+    'READ_TIMEOUT': 30,
+    'MAX_FILE_MB': 20,
+    'POOL_SIZE': 16,
+}
+
+# ✅ Resume file storage ("cloudinary", or "local" for offline tests/benchmarks)
+RESUME_STORAGE = {
+    'BACKEND': os.getenv("RESUME_STORAGE_BACKEND", "cloudinary"),
+    'UPLOAD_THREADS': int(os.getenv("RESUME_UPLOAD_THREADS", "8")),
+    'LOCAL_ROOT': os.getenv("RESUME_LOCAL_STORAGE_ROOT", "/tmp/resume_storage"),
+    'LOCAL_BASE_URL': os.getenv("RESUME_LOCAL_STORAGE_URL", ""),
+    'LOCAL_LATENCY_SECONDS': float(os.getenv("RESUME_LOCAL_STORAGE_LATENCY", "0")),
+}
+
+# ✅ Reports
+RESUME_REPORTS = {
+    'CACHE_DIR': os.getenv("RESUME_REPORTS_CACHE_DIR", "/tmp/resume_reports"),
+    'PDF_ROWS_PER_TABLE': 40,
+}
+
+# ✅ Listing endpoints (keyset pagination)
+RESUME_LISTING = {
+    'PAGE_SIZE': int(os.getenv("RESUME_LIST_PAGE_SIZE", "50")),
+    'MAX_PAGE_SIZE': 500,
+}
+
+# ✅ HR ATS threshold is cached per worker; set_ats_threshold invalidates it locally
+RESUME_THRESHOLD_CACHE_SECONDS = int(os.getenv("RESUME_THRESHOLD_CACHE_SECONDS", "30"))
+
+# ✅ Contact extraction (phone numbers stored as E.164)
+RESUME_CONTACTS = {
+    'DEFAULT_COUNTRY_CODE': os.getenv("RESUME_DEFAULT_COUNTRY_CODE", "91"),
+    'TOP_REGION_CHARS': 2000,
+    'MAX_CANDIDATES': 3,
+}
+
+# ✅ Structured parsing with spaCy (backfill: python manage.py parse_resumes --processes 4)
+RESUME_PARSING = {
+    'MODEL': os.getenv("RESUME_SPACY_MODEL", "en_core_web_sm"),
+    'BATCH_SIZE': 64,
+    'N_PROCESS': int(os.getenv("RESUME_PARSING_PROCESSES", "1")),
+    'PARSE_ON_UPLOAD': os.getenv("RESUME_PARSE_ON_UPLOAD", "True") == "True",
+}
+
+# ✅ Long resumes are split into section-aware chunks instead of being truncated by the encoder
+RESUME_CHUNKING = {
+    'ENABLED': os.getenv("RESUME_CHUNKING_ENABLED", "True") == "True",
+    'CHUNK_WORDS': int(os.getenv("RESUME_CHUNK_WORDS", "96")),
+    'OVERLAP_WORDS': int(os.getenv("RESUME_CHUNK_OVERLAP_WORDS", "16")),
+    'MAX_CHUNKS': int(os.getenv("RESUME_MAX_CHUNKS", "8")),
+    'AGGREGATION': os.getenv("RESUME_CHUNK_AGGREGATION", "topk"),
+    'TOP_K': int(os.getenv("RESUME_CHUNK_TOP_K", "2")),
+}
+
+# ✅ BM25 inverted index: search narrows the pool lexically before embedding scoring
+RESUME_SEARCH = {
+    'CANDIDATES': int(os.getenv("RESUME_SEARCH_CANDIDATES", "500")),
+    'MAX_CANDIDATES': int(os.getenv("RESUME_SEARCH_MAX_CANDIDATES", "5000")),
+    'INDEX_ON_UPLOAD': os.getenv("RESUME_INDEX_ON_UPLOAD", "True") == "True",
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
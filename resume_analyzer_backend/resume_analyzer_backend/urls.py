@@ -19,12 +19,14 @@ from django.urls import path
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from resume.views import health_check
 
 
 
 urlpatterns = [
     path('admin/', admin.site.urls),
 path('api/', include('resume.urls')),
+    path('health/', health_check, name='health'),
 ]
 
 if settings.DEBUG: